@@ -0,0 +1,72 @@
+"""Cold-start benchmark: time to import the graph module and build the graph.
+
+Each run is a fresh interpreter. Run it on a machine without Chrome to see the
+cost of the startup work that used to happen at import (Playwright launch,
+Start Menu walk, PowerShell store-app query).
+
+    python -m benchmarks.bench_cold_start [--runs 5] [--ref <git-ref>]
+
+``--ref`` also measures that revision (e.g. the commit before the lazy tool
+registry) from a temporary git worktree, for a before/after comparison.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+PROBE = r"""
+import asyncio, json, time
+t0 = time.perf_counter()
+from src.core.graph_builder import GraphBuilder
+t1 = time.perf_counter()
+asyncio.run(GraphBuilder().build())
+t2 = time.perf_counter()
+print(json.dumps({"import": t1 - t0, "build": t2 - t1}))
+"""
+
+
+def measure(repo: str, runs: int) -> dict:
+    samples = []
+    for _ in range(runs):
+        proc = subprocess.run(
+            [sys.executable, "-c", PROBE], cwd=repo, capture_output=True, text=True, timeout=600
+        )
+        if proc.returncode != 0:
+            raise RuntimeError(f"probe failed in {repo}:\n{proc.stderr[-2000:]}")
+        samples.append(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return {
+        key: statistics.median(s[key] for s in samples) for key in ("import", "build")
+    }
+
+
+def report(label: str, result: dict):
+    total = result["import"] + result["build"]
+    print(f"{label:>10}  import {result['import']:7.2f}s  build {result['build']:7.2f}s  total {total:7.2f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--ref", help="git revision to compare against")
+    args = parser.parse_args()
+    repo = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    if args.ref:
+        with tempfile.TemporaryDirectory() as tmp:
+            worktree = os.path.join(tmp, "before")
+            subprocess.run(["git", "worktree", "add", "--detach", worktree, args.ref], cwd=repo, check=True, capture_output=True)
+            try:
+                if os.path.exists(os.path.join(repo, ".env")):
+                    with open(os.path.join(repo, ".env"), "rb") as src, open(os.path.join(worktree, ".env"), "wb") as dst:
+                        dst.write(src.read())
+                report(args.ref, measure(worktree, args.runs))
+            finally:
+                subprocess.run(["git", "worktree", "remove", "--force", worktree], cwd=repo, capture_output=True)
+    report("current", measure(repo, args.runs))
+
+
+if __name__ == "__main__":
+    main()
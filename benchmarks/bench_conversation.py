@@ -0,0 +1,92 @@
+"""Microbenchmark: ConversationFormatter on long histories.
+
+Compares the previous full re-render (``str +=`` over every message on each
+call) with the incremental formatter. Each simulated turn appends a user
+message, an assistant tool call, a tool result and a reply, then formats the
+history four times, as the router, mode node, sub-router and chatbot do.
+
+    python -m benchmarks.bench_conversation [--sizes 1000 10000 100000] [--turns 5]
+"""
+import argparse
+import time
+import uuid
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from src.utils.conversation import ConversationFormatter
+
+CALLS_PER_TURN = 4
+
+
+def legacy_format(messages) -> str:
+    conversation = "Conversation history:\n\n"
+    for message in messages:
+        if isinstance(message, HumanMessage):
+            conversation += f"User: {message.content}\n"
+        elif isinstance(message, AIMessage):
+            if message.content:
+                conversation += f"Assistant: {message.content}\n"
+            elif getattr(message, "tool_calls", []):
+                conversation += "Assistant: \n"
+        elif isinstance(message, ToolMessage):
+            tool_name = getattr(message, "name", "Unknown Tool")
+            content = message.content[:200] + "..." if len(message.content) > 200 else message.content
+            conversation += f"Tool ({tool_name}): {content}\n"
+    return conversation
+
+
+def make_turn(i: int):
+    call_id = f"call-{i}"
+    return [
+        HumanMessage(content=f"set the volume to {i % 100} percent please", id=str(uuid.uuid4())),
+        AIMessage(content="", tool_calls=[{"name": "volume_control", "args": {"__arg1": str(i % 100)}, "id": call_id}], id=str(uuid.uuid4())),
+        ToolMessage(content=f"System volume set to {i % 100}% " * 20, tool_call_id=call_id, name="volume_control", id=str(uuid.uuid4())),
+        AIMessage(content=f"Done, the volume is now {i % 100}%.", id=str(uuid.uuid4())),
+    ]
+
+
+def make_history(size: int):
+    messages = []
+    i = 0
+    while len(messages) < size:
+        messages.extend(make_turn(i))
+        i += 1
+    return messages[:size]
+
+
+def run_turns(format_fn, history, turns: int) -> float:
+    """Average seconds per turn (CALLS_PER_TURN format calls after appending one turn)."""
+    messages = list(history)
+    start = time.perf_counter()
+    for t in range(turns):
+        messages.extend(make_turn(len(messages) + t))
+        for _ in range(CALLS_PER_TURN):
+            format_fn(messages)
+    return (time.perf_counter() - start) / turns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--turns", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'messages':>10} {'legacy ms/turn':>15} {'incremental ms/turn':>20} {'first call ms':>14} {'speedup':>8}")
+    for size in args.sizes:
+        history = make_history(size)
+        formatter = ConversationFormatter()
+        assert formatter.format_conversation(history) == legacy_format(history)
+
+        legacy = run_turns(legacy_format, history, args.turns)
+
+        formatter = ConversationFormatter()
+        ConversationFormatter._lines.clear()
+        ConversationFormatter._histories.clear()
+        start = time.perf_counter()
+        formatter.format_conversation(history)
+        first = time.perf_counter() - start
+        incremental = run_turns(formatter.format_conversation, history, args.turns)
+
+        print(f"{size:>10} {legacy * 1e3:>15.2f} {incremental * 1e3:>20.2f} {first * 1e3:>14.2f} {legacy / incremental:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
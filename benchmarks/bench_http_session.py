@@ -0,0 +1,97 @@
+"""Benchmark: per-call HTTP overhead of the search tools against a local stand-in.
+
+Compares the old ways a search call reached the network with the shared
+session from ``src.services.http_service``. The stand-in answers instantly, so
+the timings are client overhead: event-loop creation, session and connection
+setup, and request handling. The last row repeats the query with the result
+cache on, so every call after the first is a memory hit.
+
+    python -m benchmarks.bench_http_session [--calls 200]
+"""
+import argparse
+import asyncio
+import concurrent.futures
+import time
+import aiohttp
+from benchmarks.stub_server import StubServer
+from src.config.settings import settings
+from src.services.http_service import http_service
+from src.services.result_cache import result_cache
+from src.tools.search_tools import SearchToolFactory
+
+PARAMS = {"q": "artificial intelligence", "sortBy": "publishedAt", "apiKey": "stub", "pageSize": 10}
+
+
+def url() -> str:
+    return f"{settings.news_api_base_url}/v2/everything"
+
+
+async def fetch_new_session():
+    # What search_news_async did: a fresh ClientSession for every query.
+    async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=30)) as session:
+        async with session.get(url(), params=PARAMS) as response:
+            return await response.json()
+
+
+def new_loop_and_session(calls: int) -> float:
+    # What search_news did inside the running assistant: a thread pool plus asyncio.run per call.
+    start = time.perf_counter()
+    for _ in range(calls):
+        with concurrent.futures.ThreadPoolExecutor() as executor:
+            executor.submit(asyncio.run, fetch_new_session()).result()
+    return time.perf_counter() - start
+
+
+async def new_session(calls: int) -> float:
+    start = time.perf_counter()
+    for _ in range(calls):
+        await fetch_new_session()
+    return time.perf_counter() - start
+
+
+async def shared_session(calls: int) -> float:
+    await http_service.get_json(url(), PARAMS)  # open the pooled connection once
+    start = time.perf_counter()
+    for _ in range(calls):
+        await http_service.get_json(url(), PARAMS)
+    return time.perf_counter() - start
+
+
+async def news_tool(calls: int, cached: bool = False) -> float:
+    result_cache.enabled = cached
+    factory = SearchToolFactory()
+    await factory.search_news("warm-up")
+    start = time.perf_counter()
+    for _ in range(calls):
+        await factory.search_news("artificial intelligence")
+    return time.perf_counter() - start
+
+
+async def run_async(calls: int) -> dict:
+    results = {
+        "new session per call": await new_session(calls),
+        "shared session": await shared_session(calls),
+        "news_search tool": await news_tool(calls),
+        "news_search tool, cached": await news_tool(calls, cached=True),
+    }
+    await http_service.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+    StubServer().start()
+
+    results = {"new loop + session per call": new_loop_and_session(args.calls)}
+    results.update(asyncio.run(run_async(args.calls)))
+
+    baseline = results["new loop + session per call"]
+    print(f"{'client':>28} {'ms/call':>9} {'vs old':>7}")
+    for label, total in results.items():
+        print(f"{label:>28} {total / args.calls * 1e3:>9.3f} {baseline / total:>6.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark: fetching the top search hits one by one versus concurrently, and from cache.
+
+Pages come from the local stand-in after a fixed delay. Rows: each page awaited
+in turn, all pages through ``page_fetcher.fetch_all`` on a cold cache, the same
+URLs again within the freshness window (no request), and again after it has
+passed (conditional request answered with 304, no download or parsing).
+
+    python -m benchmarks.bench_page_fetch [--pages 5] [--latency 0.3]
+"""
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+from benchmarks.stub_server import StubServer
+from src.config.settings import settings
+from src.services.http_service import http_service
+from src.services.page_fetcher import PageFetcher
+
+
+async def timed(coro) -> tuple:
+    start = time.perf_counter()
+    result = await coro
+    return time.perf_counter() - start, result
+
+
+async def run(fetcher: PageFetcher, cold: PageFetcher, urls: list) -> dict:
+    async def one_by_one():
+        return {url: await cold._fetch(url) for url in urls}
+
+    results = {"sequential": await timed(one_by_one())}
+    results["concurrent, cold"] = await timed(fetcher.fetch_all(urls))
+    results["concurrent, fresh cache"] = await timed(fetcher.fetch_all(urls))
+    settings.page_cache_fresh = 0
+    results["concurrent, revalidated"] = await timed(fetcher.fetch_all(urls))
+    await http_service.close()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.3, help="seconds the stand-in waits per page")
+    args = parser.parse_args()
+
+    base = StubServer(latency=args.latency).start()
+    # Every stand-in page is on one host; let the whole batch run at once.
+    settings.page_fetch_per_host = args.pages
+    urls = [f"{base}/page/{n}" for n in range(args.pages)]
+    with tempfile.TemporaryDirectory() as tmp:
+        fetcher = PageFetcher(os.path.join(tmp, "pages.sqlite3"))
+        cold = PageFetcher(os.path.join(tmp, "sequential.sqlite3"))
+        results = asyncio.run(run(fetcher, cold, urls))
+
+    print(f"{'fetch':>26} {'seconds':>8} {'pages':>6}")
+    for label, (seconds, pages) in results.items():
+        print(f"{label:>26} {seconds:>8.3f} {sum(1 for p in pages.values() if p):>6}")
+    print(f"fetcher counts: {fetcher.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""Benchmark: one AI message calling all four search tools.
+
+The search APIs are replaced by a local HTTP stand-in that answers after a
+fixed delay, so no network access or API keys are needed. The calls run
+through the same ToolNode and tool executor the graph uses; the sequential
+column is the cost of awaiting them one after another.
+
+    python -m benchmarks.bench_parallel_tools [--latency 0.5] [--runs 5]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from langchain_core.messages import AIMessage, ToolMessage
+from langgraph.prebuilt import ToolNode
+from benchmarks.stub_server import StubServer
+from src.services.http_service import http_service
+from src.services.result_cache import result_cache
+from src.tools.executor import tool_executor
+from src.tools.search_tools import search_tools
+
+ARGS = {
+    "search_internet": {"query": "latest AI developments"},
+    "wikipedia_search": {"query": "quantum computing"},
+    "news_search": {"query": "artificial intelligence"},
+    "weather": {"location": "London"},
+}
+
+
+def tool_call_message() -> AIMessage:
+    return AIMessage(
+        content="",
+        tool_calls=[{"name": name, "args": args, "id": f"call-{i}"} for i, (name, args) in enumerate(ARGS.items())],
+    )
+
+
+async def sequential() -> float:
+    start = time.perf_counter()
+    for tool in search_tools:
+        await tool.ainvoke(ARGS[tool.name])
+    elapsed = time.perf_counter() - start
+    await http_service.close()
+    return elapsed
+
+
+async def parallel(node: ToolNode) -> float:
+    message = tool_call_message()
+    start = time.perf_counter()
+    result = await node.ainvoke({"messages": [message]})
+    elapsed = time.perf_counter() - start
+    await http_service.close()
+    outputs = [m for m in result["messages"] if isinstance(m, ToolMessage)]
+    assert [m.tool_call_id for m in outputs] == [c["id"] for c in message.tool_calls], "results out of order"
+    assert not any(m.content.startswith(("Network error", "Error")) for m in outputs), outputs
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--latency", type=float, default=0.5, help="seconds the stand-in waits per request")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    StubServer(latency=args.latency).start()
+    result_cache.enabled = False  # every run must reach the stand-in
+    node = ToolNode(tools=tool_executor.wrap_all(search_tools))
+
+    seq = statistics.median(asyncio.run(sequential()) for _ in range(args.runs))
+    par = statistics.median(asyncio.run(parallel(node)) for _ in range(args.runs))
+    print(f"{'tools':>6} {'latency s':>10} {'sequential s':>13} {'ToolNode s':>11} {'speedup':>8}")
+    print(f"{len(ARGS):>6} {args.latency:>10.2f} {seq:>13.3f} {par:>11.3f} {seq / par:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
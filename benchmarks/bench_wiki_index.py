@@ -0,0 +1,96 @@
+"""Benchmark: offline Wikipedia index build and query latency.
+
+Generates a synthetic abstracts dump (same XML shape as
+enwiki-latest-abstract.xml.gz), indexes it with the streaming indexer and
+times BM25 queries against it. ``--dump`` indexes a real dump instead. Peak
+Python memory during the build shows that the indexer streams the dump.
+
+    python -m benchmarks.bench_wiki_index [--pages 200000] [--queries 2000] [--dump PATH]
+"""
+import argparse
+import gzip
+import itertools
+import os
+import random
+import statistics
+import tempfile
+import time
+import tracemalloc
+from xml.sax.saxutils import escape
+from src.services.wiki_index import WikiIndex, build_index
+
+SYLLABLES = "ka lo mi ne ru sa ti vo ze an ber cor dal fen gil hor ist jun kel mar nor".split()
+
+
+def word(rng: random.Random) -> str:
+    return "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4)))
+
+
+def write_dump(path: str, pages: int, vocabulary: list, rng: random.Random) -> list:
+    # Word frequencies follow Zipf's law, as in real text: a few words occur in most pages.
+    cum_weights = list(itertools.accumulate(1 / rank for rank in range(1, len(vocabulary) + 1)))
+    words = lambda k: rng.choices(vocabulary, cum_weights=cum_weights, k=k)
+    titles = []
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        f.write("<feed>\n")
+        for i in range(pages):
+            title = " ".join(words(rng.randint(1, 3))).title()
+            abstract = " ".join(words(rng.randint(20, 60))).capitalize() + "."
+            titles.append(title)
+            f.write(
+                f"<doc><title>Wikipedia: {escape(title)}</title>"
+                f"<url>https://en.wikipedia.org/wiki/{i}</url>"
+                f"<abstract>{escape(abstract)}</abstract><links></links></doc>\n"
+            )
+        f.write("</feed>\n")
+    return titles
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pages", type=int, default=200_000)
+    parser.add_argument("--queries", type=int, default=2000)
+    parser.add_argument("--dump", help="index this abstracts dump instead of a synthetic one")
+    args = parser.parse_args()
+    rng = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        vocabulary = [word(rng) for _ in range(20_000)]
+        dump = args.dump
+        titles = None
+        if dump is None:
+            dump = os.path.join(tmp, "abstract.xml.gz")
+            titles = write_dump(dump, args.pages, vocabulary, rng)
+        index_path = os.path.join(tmp, "wiki_index.sqlite3")
+
+        tracemalloc.start()
+        start = time.perf_counter()
+        pages = build_index(dump, index_path)
+        build_seconds = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"indexed {pages} pages in {build_seconds:.1f}s ({pages / build_seconds:.0f}/s), "
+              f"peak Python memory {peak / 2**20:.1f} MiB, index {os.path.getsize(index_path) / 2**20:.0f} MiB")
+
+        index = WikiIndex(index_path)
+        queries = [
+            rng.choice(titles) if titles and i % 2 else " ".join(rng.choice(vocabulary) for _ in range(rng.randint(1, 3)))
+            for i in range(args.queries)
+        ]
+        index.search(queries[0])
+        latencies = []
+        for query in queries:
+            start = time.perf_counter()
+            index.search(query)
+            latencies.append((time.perf_counter() - start) * 1e3)
+        index.close()
+
+    latencies.sort()
+    pct = lambda p: latencies[min(len(latencies) - 1, int(p * len(latencies)))]
+    print(f"{'queries':>8} {'mean ms':>8} {'p50 ms':>7} {'p95 ms':>7} {'p99 ms':>7} {'misses':>7}")
+    print(f"{len(latencies):>8} {statistics.mean(latencies):>8.3f} {pct(0.5):>7.3f} {pct(0.95):>7.3f} "
+          f"{pct(0.99):>7.3f} {index.misses:>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Local HTTP stand-in for the search APIs (Serper, Wikipedia, NewsAPI, OpenWeatherMap)
+and for the result pages they link to (``/page/<n>``, with ETag revalidation).
+
+Serves canned responses after a fixed delay. ``start()`` runs it on a free
+port in a background thread and points the search base-URL settings at it.
+"""
+import asyncio
+import socket
+import threading
+from aiohttp import web
+from src.config.settings import settings
+
+SERPER = {"organic": [{"snippet": f"Result {i} about the query."} for i in range(10)]}
+WIKIPEDIA = {"query": {"pages": {"1": {"index": 1, "title": "Quantum computing", "extract": "Quantum computing is a type of computation."}}}}
+NEWS = {
+    "status": "ok",
+    "articles": [
+        {"title": f"Headline {i}", "description": "Summary.", "url": f"https://example.com/{i}", "publishedAt": "2026-01-01T00:00:00Z"}
+        for i in range(10)
+    ],
+}
+WEATHER = {
+    "weather": [{"description": "light rain"}],
+    "main": {"temp": 12.3, "temp_max": 14.0, "temp_min": 10.1, "feels_like": 11.0, "humidity": 80},
+    "wind": {"speed": 4.1, "deg": 250},
+    "clouds": {"all": 75},
+}
+PAGE = """<html><head><title>Result page {n}</title><script>var tracking = 1;</script></head>
+<body><header><nav><a href="/">Home</a> <a href="/news">News</a></nav></header>
+<article><h1>Result page {n}</h1>
+<p>This page explains the topic of the query in some detail, with facts the snippet left out.</p>
+<p>A second paragraph adds background, dates and figures that help answer the question directly.</p>
+</article><footer>Copyright. All rights reserved. Subscribe to our newsletter.</footer></body></html>"""
+
+
+class StubServer:
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.requests = 0
+        self.port = None
+        self._loop = None
+        self._runner = None
+
+    def _handler(self, payload):
+        async def handle(request):
+            self.requests += 1
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            return web.json_response(payload)
+
+        return handle
+
+    async def _page(self, request):
+        self.requests += 1
+        etag = f'"v1-{request.match_info["n"]}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        return web.Response(text=PAGE.format(n=request.match_info["n"]), content_type="text/html", headers={"ETag": etag})
+
+    def _app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_post("/search", self._handler(SERPER))
+        app.router.add_get("/w/api.php", self._handler(WIKIPEDIA))
+        app.router.add_get("/v2/everything", self._handler(NEWS))
+        app.router.add_get("/data/2.5/weather", self._handler(WEATHER))
+        app.router.add_get("/page/{n}", self._page)
+        return app
+
+    def start(self) -> str:
+        with socket.socket() as s:
+            s.bind(("127.0.0.1", 0))
+            self.port = s.getsockname()[1]
+        ready = threading.Event()
+
+        def run():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            self._runner = web.AppRunner(self._app())
+            self._loop.run_until_complete(self._runner.setup())
+            self._loop.run_until_complete(web.TCPSite(self._runner, "127.0.0.1", self.port).start())
+            ready.set()
+            self._loop.run_forever()
+
+        threading.Thread(target=run, name="stub-server", daemon=True).start()
+        ready.wait()
+        base = f"http://127.0.0.1:{self.port}"
+        settings.serper_base_url = base
+        settings.wikipedia_base_url = base
+        settings.news_api_base_url = base
+        settings.openweathermap_base_url = base
+        return base
@@ -1,6 +1,8 @@
 import asyncio
 from src.core.assistant import VoiceAssistant
 from src.config.settings import settings
+from src.tools.registry import tool_registry
+from src.services.http_service import http_service
 import logging
 from gtts import gTTS
 from io import BytesIO
@@ -23,11 +25,20 @@ async def main():
     await assistant.initialize()
     print(f"Welcome to {settings.assistant_name}!")
     print("Type 'exit' or 'quit' to end the conversation.")
+    tool_registry.warm()
 
+    async def reply(message):
+        async for text in assistant.astream_chat(message):
+            print(text, end="", flush=True)
+
+    pending = None
     while True:
         try:
-            user_input = await asyncio.to_thread(input, "\nYou: ")
-            user_input = user_input.strip()
+            if pending is None:
+                print("\nYou: ", end="", flush=True)
+                pending = asyncio.ensure_future(asyncio.to_thread(input))
+            user_input = (await pending).strip()
+            pending = None
 
             if user_input.lower() in ["exit", "quit", "bye"]:
                 print("Goodbye!")
@@ -36,8 +47,19 @@ async def main():
             if not user_input:
                 continue
 
-            response = await assistant.chat(user_input)
-            print(f"\n{settings.assistant_name}: {response}")
+            print(f"\n{settings.assistant_name}: ", end="", flush=True)
+            # The next line is read while the answer streams; entering it cancels the answer.
+            pending = asyncio.ensure_future(asyncio.to_thread(input))
+            answer = asyncio.ensure_future(reply(user_input))
+            await asyncio.wait({answer, pending}, return_when=asyncio.FIRST_COMPLETED)
+            if not answer.done():
+                answer.cancel()
+                await asyncio.wait({answer})
+            print()
+            if not pending.done():
+                print("\nYou: ", end="", flush=True)
+            if not answer.cancelled():
+                answer.result()
 
         except KeyboardInterrupt:
             print("\nGoodbye!")
@@ -46,6 +68,8 @@ async def main():
             logging.error(f"Error processing request: {e}")
             print("Sorry, I encountered an error. Please try again.")
 
+    await http_service.close()
+
 
 
 
@@ -130,11 +154,12 @@ async def main():
 #                         )
 #                         break
 
-#                     response = await assistant.chat(command)
 #                     n = 0
-#                     print(f"{settings.assistant_name}: {response}")
-
-#                     await speak(response)
+#                     print(f"{settings.assistant_name}: ", end="", flush=True)
+#                     async for sentence in assistant.astream_sentences(command):
+#                         print(sentence, end=" ", flush=True)
+#                         await speak(sentence)
+#                     print()
 
 #                 except sr.UnknownValueError:
 #                     n += 1
@@ -11,10 +11,20 @@ class Settings:
         self.on_llm_model: str = os.getenv("ON_LLM_MODEL")
         self.on_llm_model_pro: str =os.getenv("ON_LLM_MODEL_PRO")
         self.on_llm_key: str = os.getenv("ON_LLM_KEY")
+        self.ollama_keep_alive: str = os.getenv("OLLAMA_KEEP_ALIVE", "30m")
     
         # API Keys
         self.news_api_key=os.getenv("NEWS_API_KEY")
         self.serper_api_key=os.getenv("SERPER_API_KEY")
+        self.openweathermap_api_key=os.getenv("OPENWEATHERMAP_API_KEY")
+
+        # Search API endpoints (override to point the search tools at a local stand-in)
+        self.serper_base_url = os.getenv("SERPER_BASE_URL", "https://google.serper.dev")
+        self.wikipedia_base_url = os.getenv("WIKIPEDIA_BASE_URL", "https://en.wikipedia.org")
+        self.news_api_base_url = os.getenv("NEWS_API_BASE_URL", "https://newsapi.org")
+        self.openweathermap_base_url = os.getenv("OPENWEATHERMAP_BASE_URL", "https://api.openweathermap.org")
+        # Offline Wikipedia index built by src.services.wiki_index; wikipedia_search prefers it when set
+        self.wiki_index_path = os.getenv("WIKI_INDEX_PATH", "")
     
         # Assistant Configuration
         self.assistant_name=os.getenv("NAME")
@@ -26,10 +36,139 @@ class Settings:
         self.credentials_file="credentials.json"
         
         self.mode="normal"
+
+        # Routing
+        self.fast_router_enabled = os.getenv("FAST_ROUTER", "1") != "0"
+        self.fast_router_threshold = float(os.getenv("FAST_ROUTER_THRESHOLD", "0.75"))
+        self.fast_router_min_score = float(os.getenv("FAST_ROUTER_MIN_SCORE", "2.0"))
+        self.routing_log_enabled = os.getenv("ROUTING_LOG", "1") != "0"
+        self.routing_log_path = os.getenv("ROUTING_LOG_PATH", "routing_log.jsonl")
+        self.router_model_dir = os.getenv("ROUTER_MODEL_DIR", "router_models")
+        self.router_model_threshold = float(os.getenv("ROUTER_MODEL_THRESHOLD", "0.9"))
         
         #online
         self.isOnline=True
 
+        # LLM scheduling: per-model concurrency ("model:limit,..." overrides) and per-call timeout
+        self.llm_concurrency = int(os.getenv("LLM_CONCURRENCY", "8" if self.isOnline else "2"))
+        self.llm_model_concurrency = {
+            model.strip(): int(limit)
+            for model, limit in (
+                item.rsplit(":", 1) for item in os.getenv("LLM_MODEL_CONCURRENCY", "").split(",") if ":" in item
+            )
+        }
+        self.llm_timeout = float(os.getenv("LLM_TIMEOUT", "60"))
+
+        # LLM response cache: TTL in seconds per cache namespace; unlisted namespaces are not cached
+        self.llm_cache_enabled = os.getenv("LLM_CACHE", "1") != "0"
+        self.llm_cache_path = os.getenv("LLM_CACHE_PATH", "llm_cache.sqlite3")
+        self.llm_cache_max_entries = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+        self.llm_cache_ttl = {
+            "router": 7 * 24 * 3600,
+            "mode": 7 * 24 * 3600,
+            "youtube": 24 * 3600,
+            "keyboard": 24 * 3600,
+            "calendar": 10 * 60,
+            # Combined routing carries date slots; its prompt holds the bucketed time, so
+            # entries only match within one bucket anyway.
+            "routing": 10 * 60,
+        }
+
+        # One structured routing call for route, sub-route and slots (calendar, chrome, file manager)
+        self.combined_routing = os.getenv("COMBINED_ROUTING", "1") != "0"
+
+        # Answer user-ready tool results directly instead of rephrasing them with the chatbot LLM
+        self.response_templates = os.getenv("RESPONSE_TEMPLATES", "1") != "0"
+
+        # Approximate token cap for formatted conversation history in prompts (0 = unlimited)
+        self.conversation_token_budget = int(os.getenv("CONVERSATION_TOKEN_BUDGET", "0"))
+
+        # Prompt assembly: time in system prompts is rounded down to this many seconds
+        self.prompt_time_granularity = int(os.getenv("PROMPT_TIME_GRANULARITY", "60"))
+
+        # Startup: components are built on this many threads; the timeline is written to this path
+        self.startup_workers = int(os.getenv("STARTUP_WORKERS", "8"))
+        self.startup_timeline_path = os.getenv("STARTUP_TIMELINE", "startup_timeline.json")
+
+        # Persistent index of installed applications (Start Menu shortcuts and store apps)
+        self.app_index_path = os.getenv("APP_INDEX_PATH", "app_index.json")
+
+        # Local app-name matching: accept the best candidate at this score with this lead over the
+        # runner-up, treat anything below the floor as not installed, otherwise ask the LLM to pick
+        # from a shortlist of this size
+        self.app_match_threshold = float(os.getenv("APP_MATCH_THRESHOLD", "0.8"))
+        self.app_match_margin = float(os.getenv("APP_MATCH_MARGIN", "0.1"))
+        self.app_match_floor = float(os.getenv("APP_MATCH_FLOOR", "0.3"))
+        self.app_match_shortlist = int(os.getenv("APP_MATCH_SHORTLIST", "8"))
+
+        # Harmful-software scan: per-app verdict cache and the number of apps sent to the LLM per call
+        self.software_verdict_path = os.getenv("SOFTWARE_VERDICT_PATH", "software_verdicts.json")
+        self.software_scan_chunk = int(os.getenv("SOFTWARE_SCAN_CHUNK", "40"))
+
+        # Telemetry sampler: seconds between samples, seconds of history kept, ticks between
+        # temperature/GPU reads, and the default window of a performance report
+        self.telemetry_interval = float(os.getenv("TELEMETRY_INTERVAL", "1.0"))
+        self.telemetry_window = float(os.getenv("TELEMETRY_WINDOW", "600"))
+        self.telemetry_slow_every = int(os.getenv("TELEMETRY_SLOW_EVERY", "10"))
+        self.telemetry_report_seconds = float(os.getenv("TELEMETRY_REPORT_SECONDS", "60"))
+        # Default time limit for one metric provider in a performance report
+        self.metric_timeout = float(os.getenv("METRIC_TIMEOUT", "2.0"))
+
+        # Tool execution: worker threads for sync tools and the default per-call time limit in seconds
+        self.tool_workers = int(os.getenv("TOOL_WORKERS", "8"))
+        self.tool_timeout = float(os.getenv("TOOL_TIMEOUT", "30"))
+
+        # Shared HTTP session: connection pool size (total and per host), DNS cache TTL,
+        # keep-alive and total request timeout in seconds
+        self.http_pool_size = int(os.getenv("HTTP_POOL_SIZE", "100"))
+        self.http_pool_per_host = int(os.getenv("HTTP_POOL_PER_HOST", "10"))
+        self.http_dns_ttl = int(os.getenv("HTTP_DNS_TTL", "300"))
+        self.http_keepalive = float(os.getenv("HTTP_KEEPALIVE", "30"))
+        self.http_timeout = float(os.getenv("HTTP_TIMEOUT", "30"))
+
+        # Search result cache: in-memory LRU size, TTL in seconds per tool (unlisted tools are not
+        # cached), how long past its TTL an entry may still be served while the API is slow or down,
+        # and how long to wait for a refresh before serving the stale entry
+        self.result_cache_enabled = os.getenv("RESULT_CACHE", "1") != "0"
+        self.result_cache_path = os.getenv("RESULT_CACHE_PATH", "result_cache.sqlite3")
+        self.result_cache_memory_entries = int(os.getenv("RESULT_CACHE_MEMORY_ENTRIES", "256"))
+        self.result_cache_ttl = {
+            "search_internet": 3600,
+            "wikipedia_search": 7 * 24 * 3600,
+            "news_search": 15 * 60,
+            "weather": 10 * 60,
+        }
+        self.result_cache_stale = {
+            "search_internet": 24 * 3600,
+            "wikipedia_search": 30 * 24 * 3600,
+            "news_search": 6 * 3600,
+            "weather": 3600,
+        }
+        self.result_cache_stale_wait = float(os.getenv("RESULT_CACHE_STALE_WAIT", "2.0"))
+
+        # Page fetch for web search: pages downloaded per search (0 = snippets only), concurrent
+        # requests per host, per-page and whole-stage time limits in seconds, bytes read per page
+        # and characters of text kept per page; extracted text is cached by URL/ETag and reused
+        # without revalidation for page_cache_fresh seconds
+        self.page_fetch_top = int(os.getenv("PAGE_FETCH_TOP", "3"))
+        self.page_fetch_per_host = int(os.getenv("PAGE_FETCH_PER_HOST", "2"))
+        self.page_fetch_timeout = float(os.getenv("PAGE_FETCH_TIMEOUT", "4.0"))
+        self.page_fetch_deadline = float(os.getenv("PAGE_FETCH_DEADLINE", "6.0"))
+        self.page_fetch_max_bytes = int(os.getenv("PAGE_FETCH_MAX_BYTES", "1000000"))
+        self.page_text_chars = int(os.getenv("PAGE_TEXT_CHARS", "4000"))
+        self.page_cache_path = os.getenv("PAGE_CACHE_PATH", "page_cache.sqlite3")
+        self.page_cache_fresh = float(os.getenv("PAGE_CACHE_FRESH", "3600"))
+
+        # Search result reduction: approximate token budget per tool result in the chatbot prompt
+        # (unlisted tools are passed through and cut as before)
+        self.result_reducer_enabled = os.getenv("RESULT_REDUCER", "1") != "0"
+        self.result_token_budget = {
+            "search_internet": 400,
+            "wikipedia_search": 250,
+            "news_search": 250,
+            "weather": 100,
+        }
+
 
 settings = Settings()
 
@@ -1,29 +1,158 @@
+import asyncio
+import logging
+import re
+from typing import AsyncIterator
 from src.core.graph_builder import GraphBuilder
+from src.utils.prompt import prompt_cache_stats
+from src.utils.response import response_stats
+from src.tools.executor import tool_executor
+from src.services.single_flight import single_flight
+from src.services.llm_scheduler import llm_scheduler
+from src.services.llm_cache import llm_cache
+from src.utils.result_reducer import result_reducer
+from src.utils.fast_router import router_stats
 from langchain_core.messages import HumanMessage
 
+logger = logging.getLogger(__name__)
+
+SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
 class VoiceAssistant:
+    # Nodes whose model tokens are user-facing text.
+    STREAM_NODES = ("chatbot",)
+
     def __init__(self):
         self.graph_builder = GraphBuilder()
         self.graph = None
+        self._timeline_pending = False
+        self._turn = None
 
     async def initialize(self):
         self.graph = await self.graph_builder.build()
-    
-    
-    async def chat(self, message: str, config: dict = None) -> str:
-        """Process a chat message asynchronously and return response."""  
-        if config is None:
-            config = {"configurable": {"thread_id": "1"}}
-        
-        
-        state = {
+        timeline = self.graph_builder.startup.timeline
+        timeline.mark("ready")
+        timeline.write()
+        self._timeline_pending = True
+        logger.info(f"Assistant ready in {timeline.marks['ready']:.2f}s")
+
+    @staticmethod
+    def _initial_state(message: str) -> dict:
+        return {
             "messages": [HumanMessage(content=message)],
             "context": {},
             "user_preferences": {},
             "feedback":"",
+            "routing": {},
         }
-        
-        result = await self.graph.ainvoke(state, config)
-        return result["messages"][-1].content
     
-   
+    def cancel_turn(self, reason: str = "superseded by a new command") -> bool:
+        """Cancel the turn still in progress, if any.
+
+        Its pending LLM and tool calls are cancelled; sync tools still running on
+        the executor's threads see their cancel token set and stop at their next
+        check. Returns whether there was a turn to cancel.
+        """
+        turn = self._turn
+        if turn is None or turn.done():
+            return False
+        logger.info(f"Cancelling the previous turn: {reason}")
+        turn.cancel()
+        return True
+
+    async def chat(self, message: str, config: dict = None) -> str:
+        """Process a chat message asynchronously and return response."""  
+        if config is None:
+            config = {"configurable": {"thread_id": "1"}}
+        # A new command supersedes a turn still running, e.g. a voice command issued mid-answer.
+        self.cancel_turn()
+        self._turn = turn = asyncio.ensure_future(self.graph.ainvoke(self._initial_state(message), config))
+
+        try:
+            result = await turn
+        except asyncio.CancelledError:
+            if asyncio.current_task().cancelling():
+                raise
+            # Superseded by a newer command; that turn gives the answer.
+            return ""
+        self._log_turn_stats()
+        return result["messages"][-1].content
+
+    async def astream_chat(self, message: str, config: dict = None) -> AsyncIterator[str]:
+        """Yield response text as it is generated.
+
+        Tokens from the chatbot model are forwarded as they arrive. Turns that end
+        without a streamed answer (e.g. a node replied directly) yield the final
+        message once the graph has finished. The graph runs in its own task, so a
+        new command can cancel it (``cancel_turn``); the superseded stream ends.
+        """
+        if config is None:
+            config = {"configurable": {"thread_id": "1"}}
+        self.cancel_turn()
+        queue = asyncio.Queue()
+
+        async def run():
+            try:
+                async for event in self.graph.astream_events(self._initial_state(message), config, version="v2"):
+                    if event["event"] != "on_chat_model_stream":
+                        continue
+                    if event.get("metadata", {}).get("langgraph_node") not in self.STREAM_NODES:
+                        continue
+                    text = event["data"]["chunk"].content
+                    if isinstance(text, list):
+                        text = "".join(part.get("text", "") if isinstance(part, dict) else str(part) for part in text)
+                    if text:
+                        queue.put_nowait(text)
+            finally:
+                queue.put_nowait(None)
+
+        self._turn = turn = asyncio.ensure_future(run())
+        streamed = False
+        try:
+            while (text := await queue.get()) is not None:
+                streamed = True
+                yield text
+            await asyncio.wait({turn})
+        finally:
+            # The consumer stopped early (closed or cancelled): stop the graph too.
+            if not turn.done():
+                turn.cancel()
+        if turn.cancelled():
+            return
+        turn.result()
+
+        if not streamed:
+            snapshot = await self.graph.aget_state(config)
+            messages = snapshot.values.get("messages", [])
+            if messages:
+                yield messages[-1].content
+        self._log_turn_stats()
+
+    def _log_turn_stats(self):
+        logger.info(f"Prompt cache: {prompt_cache_stats.stats()}")
+        logger.info(f"Responses: {response_stats.summary()}")
+        logger.info(f"Router: {router_stats.summary()}")
+        logger.info(f"Tool executor: {tool_executor.stats()}")
+        logger.info(f"Coalesced requests: {single_flight.stats()}")
+        logger.info(f"LLM scheduler: {llm_scheduler.stats()}")
+        logger.info(f"LLM response cache: {llm_cache.stats()}")
+        logger.info(f"Tool results reduced this turn: {result_reducer.take_turn()}")
+        if self._timeline_pending:
+            # Rewrite once so the first-use cost of the nodes on the first turn is included.
+            self._timeline_pending = False
+            timeline = self.graph_builder.startup.timeline
+            timeline.mark("first_turn")
+            timeline.write()
+
+    async def astream_sentences(self, message: str, config: dict = None) -> AsyncIterator[str]:
+        """Group streamed tokens into whole sentences, so TTS can start speaking early."""
+        buffer = ""
+        async for text in self.astream_chat(message, config):
+            buffer += text
+            parts = SENTENCE_END.split(buffer)
+            for sentence in parts[:-1]:
+                if sentence.strip():
+                    yield sentence.strip()
+            buffer = parts[-1]
+        if buffer.strip():
+            yield buffer.strip()
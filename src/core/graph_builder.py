@@ -1,198 +1,138 @@
+import logging
 from langgraph.graph import START, END, StateGraph
 from langgraph.prebuilt import ToolNode, tools_condition
 from langgraph.checkpoint.memory import InMemorySaver
 from src.core.state import AssistantState
+from src.config.settings import settings
+
+from src.core.startup import Component, StartupOrchestrator
+from src.services.llm_registry import llm_registry
+from src.tools.executor import tool_executor
+from src.utils.result_reducer import result_reducer
+
+# Nodes, edges and tool lists are loaded by the startup orchestrator so that
+# independent components are built concurrently and show up on the startup timeline.
+NODES = {
+    "chatbot": Component("src.nodes.chatbot_node", "ChatbotNode"),
+    "respond": Component("src.nodes.response_node", "ResponseNode"),
+    "network_search": Component("src.nodes.search_node", "SearchNode"),
+    "system_node": Component("src.nodes.system_node", "SystemNode"),
+    "software_node": Component("src.nodes.softwares_node", "SoftwareNode"),
+    "calendar_node": Component("src.nodes.calendar.calendar_node", "CalendarNode"),
+    "calendar_create": Component("src.nodes.calendar.calender_create_node", "CreateCalendarNode"),
+    "calendar_update": Component("src.nodes.calendar.calendar_update_node", "UpdateCalendarNode"),
+    "calendar_delete": Component("src.nodes.calendar.calendar_delete_node", "DeleteCalendarNode"),
+    "calendar_final": Component("src.nodes.calendar.calender_final_node", "FinalCalendarNode"),
+    "keyboard_node": Component("src.nodes.keyboard.keyboard_node", "KeyboardNode"),
+    "keyboard_hotkey": Component("src.nodes.keyboard.keyboard_hotkey", "KeyboardHotKeyNode"),
+    "keyboard_presskey": Component("src.nodes.keyboard.keyboard_presskey", "KeyboardPressNode"),
+    "keyboard_write": Component("src.nodes.keyboard.keyboard_write", "KeyboardWriteNode"),
+    "youtube_node": Component("src.nodes.youtube_node", "YoutubeNode"),
+    "chrome_node": Component("src.nodes.chrome.chrome_node", "ChromeNode"),
+    "chrome_close_node": Component("src.nodes.chrome.chrome_close_node", "ChromeCloseNode"),
+    "chrome_tab_node": Component("src.nodes.chrome.chrome_tab_node", "ChromeTabNode"),
+    "chrome_func_node": Component("src.nodes.chrome.chrome_func_node", "ChromeFuncNode"),
+    "filemanager_node": Component("src.nodes.filemanage.files_node", "FileManagerNode"),
+    "filemanager_close_node": Component("src.nodes.filemanage.files_close_node", "FileManagerCloseNode"),
+    "filemanager_tab_node": Component("src.nodes.filemanage.files_tab_node", "FileManagerTabNode"),
+    "filemanager_write_node": Component("src.nodes.filemanage.files_write_node", "FileManagerWriteNode"),
+    "filemanager_read_node": Component("src.nodes.filemanage.files_read_node", "FileManagerReadNode"),
+}
+
+# Tool lists, keyed by the ToolNode that runs them.
+TOOLS = {
+    "network_search_tools": Component("src.tools.search_tools", "search_tools", construct=False),
+    "system_node_tools": Component("src.tools.system_tools", "system_tools", construct=False),
+    "software_node_tools": Component("src.tools.softwares_tool", "software_tools", construct=False),
+    "chrome_tab_node_tools": Component("src.tools.chrome_tab_tools", "chrome_tab_tools", construct=False),
+    "chrome_func_node_tools": Component("src.tools.chrome_func_tools", "chrome_func_tools", construct=False),
+    "filemanager_tab_node_tools": Component("src.tools.files_tab_tools", "file_manager_tab_tools", construct=False),
+    "filemanager_write_node_tools": Component("src.tools.files_write_tools", "filemanager_write_tools", construct=False),
+    "filemanager_read_node_tools": Component("src.tools.files_read_tools", "filemanager_read_tools", construct=False),
+}
+
+EDGES = {
+    "redirector_edge": Component("src.edges.redirector_edge", "RedirectorEdge"),
+    "calendar_edge": Component("src.edges.calendar_edge", "CalendarRedirectorEdge"),
+    "keyboard_edge": Component("src.edges.keyboard_edge", "KeyboardRedirectorEdge"),
+    "chrome_edge": Component("src.edges.chrome_edge", "ChromeRedirectorEdge"),
+    "filemanager_edge": Component("src.edges.file_manager_edge", "FileManagerRedirectorEdge"),
+    "route": Component("src.nodes.routing_node", "RoutingNode", deps=("redirector_edge",)),
+    **{
+        f"{tools}_response": Component("src.edges.response_edge", "ResponseRedirectorEdge", deps=(tools,))
+        for tools in TOOLS
+        if tools != "network_search_tools"
+    },
+}
+
+# LLM nodes whose tool calls run in a ToolNode.
+TOOL_CALLING = {node.removesuffix("_tools"): node for node in TOOLS}
+
+
+logger = logging.getLogger(__name__)
+
 
-# Node Imports
-from src.nodes.chatbot_node import ChatbotNode
-from src.nodes.search_node import SearchNode
-from src.nodes.system_node import SystemNode
-from src.nodes.softwares_node import SoftwareNode
-from src.nodes.calendar.calendar_node import CalendarNode
-from src.nodes.calendar.calender_create_node import CreateCalendarNode
-from src.nodes.calendar.calendar_update_node import UpdateCalendarNode
-from src.nodes.calendar.calendar_delete_node import DeleteCalendarNode
-from src.nodes.calendar.calender_final_node import FinalCalendarNode
-from src.nodes.keyboard.keyboard_node import KeyboardNode
-from src.nodes.keyboard.keyboard_hotkey import KeyboardHotKeyNode
-from src.nodes.keyboard.keyboard_presskey import KeyboardPressNode
-from src.nodes.keyboard.keyboard_write import KeyboardWriteNode
-
-from src.nodes.youtube_node import YoutubeNode
-
-from src.nodes.chrome.chrome_node import ChromeNode
-from src.nodes.chrome.chrome_tab_node import ChromeTabNode
-from src.nodes.chrome.chrome_close_node import ChromeCloseNode
-from src.nodes.chrome.chrome_func_node import ChromeFuncNode
-
-
-from src.nodes.filemanage.files_node import FileManagerNode
-from src.nodes.filemanage.files_tab_node import FileManagerTabNode
-from src.nodes.filemanage.files_close_node import FileManagerCloseNode
-from src.nodes.filemanage.files_write_node import FileManagerWriteNode
-from src.nodes.filemanage.files_read_node import FileManagerReadNode
-
-
-# Edge Imports
-from src.edges.redirector_edge import RedirectorEdge
-from src.edges.calendar_edge import CalendarRedirectorEdge
-from src.edges.keyboard_edge import KeyboardRedirectorEdge
-from src.edges.chrome_edge import ChromeRedirectorEdge
-from src.edges.file_manager_edge import FileManagerRedirectorEdge
-
-# Tools Imports
-from src.tools.search_tools import search_tools
-from src.tools.system_tools import system_tools
-from src.tools.softwares_tool import software_tools
-from src.tools.chrome_tab_tools import chrome_tab_tools
-from src.tools.chrome_func_tools import chrome_func_tools
-from src.tools.files_tab_tools import file_manager_tab_tools
-from src.tools.files_write_tools import filemanager_write_tools
-from src.tools.files_read_tools import filemanager_read_tools
 class GraphBuilder:
-    def __init__(self):
+    def __init__(self, startup: StartupOrchestrator = None):
         self.memory = InMemorySaver()
+        self.startup = startup or StartupOrchestrator()
 
     async def build(self):
         """Build the async graph."""
+        startup = self.startup
+        specs = {**NODES, **TOOLS, **EDGES}
+        if not settings.combined_routing:
+            specs.pop("route")
+        c = await startup.load_all(specs)
+        track = startup.track_first_use
 
         graph_builder = StateGraph(AssistantState)
 
-        graph_builder.add_node("chatbot", ChatbotNode().execute)
-        graph_builder.add_node("network_search", SearchNode().execute)
-        graph_builder.add_node("network_search_tools", ToolNode(tools=search_tools))
-        graph_builder.add_node("system_node", SystemNode().execute)
-        graph_builder.add_node("system_node_tools", ToolNode(tools=system_tools))
-        graph_builder.add_node("software_node", SoftwareNode().execute)
-        graph_builder.add_node("software_node_tools", ToolNode(tools=software_tools))
-        graph_builder.add_node("calendar_node", CalendarNode().execute)
-        graph_builder.add_node("calendar_create", CreateCalendarNode().execute)
-        graph_builder.add_node("calendar_update", UpdateCalendarNode().execute)
-        graph_builder.add_node("calendar_delete", DeleteCalendarNode().execute)
-        graph_builder.add_node("calendar_final", FinalCalendarNode().execute)
-        graph_builder.add_node("keyboard_node", KeyboardNode().execute)
-        graph_builder.add_node("keyboard_hotkey", KeyboardHotKeyNode().execute)
-        graph_builder.add_node("keyboard_presskey", KeyboardPressNode().execute)
-        graph_builder.add_node("keyboard_write", KeyboardWriteNode().execute)
-        graph_builder.add_node("youtube_node", YoutubeNode().execute)
-        graph_builder.add_node("chrome_node", ChromeNode().execute)
-        graph_builder.add_node("chrome_close_node", ChromeCloseNode().execute)
-        graph_builder.add_node("chrome_tab_node", ChromeTabNode().execute)
-        graph_builder.add_node("chrome_tab_node_tools", ToolNode(tools=chrome_tab_tools))
-        graph_builder.add_node("chrome_func_node", ChromeFuncNode().execute)
-        graph_builder.add_node("chrome_func_node_tools", ToolNode(tools=chrome_func_tools))
-        
-        graph_builder.add_node("filemanager_node", FileManagerNode().execute)
-        graph_builder.add_node("filemanager_close_node", FileManagerCloseNode().execute)
-        graph_builder.add_node("filemanager_tab_node", FileManagerTabNode().execute)
-        graph_builder.add_node("filemanager_tab_node_tools", ToolNode(tools=file_manager_tab_tools))
-        graph_builder.add_node("filemanager_write_node", FileManagerWriteNode().execute)
-        graph_builder.add_node("filemanager_write_node_tools", ToolNode(tools=filemanager_write_tools))
-        graph_builder.add_node("filemanager_read_node", FileManagerReadNode().execute)
-        graph_builder.add_node("filemanager_read_node_tools", ToolNode(tools=filemanager_read_tools))
-        
-
-        graph_builder.add_conditional_edges(START, RedirectorEdge().execute)
-
-        graph_builder.add_conditional_edges(
-            "network_search",
-            tools_condition,
-            {"tools": "network_search_tools", "__end__": "chatbot"},
-        )
+        for name in NODES:
+            graph_builder.add_node(name, track(name, c[name].execute))
+        for name in TOOLS:
+            # Search results are reduced to their token budget before they reach the chatbot.
+            graph_builder.add_node(name, ToolNode(tools=tool_executor.wrap_all(result_reducer.wrap_all(c[name]))))
+
+        redirector = track("redirector_edge", c["redirector_edge"].execute)
+        if settings.combined_routing:
+            graph_builder.add_node("route", track("route", c["route"].execute))
+            graph_builder.add_edge(START, "route")
+            graph_builder.add_conditional_edges("route", redirector)
+        else:
+            graph_builder.add_conditional_edges(START, redirector)
+
+        for node, tools in TOOL_CALLING.items():
+            graph_builder.add_conditional_edges(
+                node,
+                tools_condition,
+                {"tools": tools, "__end__": "chatbot"},
+            )
         graph_builder.add_conditional_edges(
             "network_search_tools",
             tools_condition,
             {"tools": "network_search_tools", "__end__": "chatbot"},
         )
-        
-        graph_builder.add_conditional_edges(
-            "system_node",
-            tools_condition,
-            {"tools": "system_node_tools", "__end__": "chatbot"},
-        )
-        graph_builder.add_conditional_edges(
-            "system_node_tools",
-            tools_condition,
-            {"tools": "system_node_tools", "__end__": "chatbot"},
-        )
-        graph_builder.add_conditional_edges(
-            "software_node",
-            tools_condition,
-            {"tools": "software_node_tools", "__end__": "chatbot"},
-        )
-        graph_builder.add_conditional_edges(
-            "software_node_tools",
-            tools_condition,
-            {"tools": "software_node_tools", "__end__": "chatbot"},
-        )
-        
-        graph_builder.add_conditional_edges(
-            "chrome_tab_node",
-            tools_condition,
-            {"tools": "chrome_tab_node_tools", "__end__": "chatbot"},
-        )
-        graph_builder.add_conditional_edges(
-            "chrome_tab_node_tools",
-            tools_condition,
-            {"tools": "chrome_tab_node_tools", "__end__": "chatbot"},
-        )
-        
-        graph_builder.add_conditional_edges(
-            "chrome_func_node",
-            tools_condition,
-            {"tools": "chrome_func_node_tools", "__end__": "chatbot"},
-        )
-        graph_builder.add_conditional_edges(
-            "chrome_func_node_tools",
-            tools_condition,
-            {"tools": "chrome_func_node_tools", "__end__": "chatbot"},
-        )
-        
-        
-        graph_builder.add_conditional_edges(
-            "filemanager_tab_node",
-            tools_condition,
-            {"tools": "filemanager_tab_node_tools", "__end__": "chatbot"},
-        )
-        graph_builder.add_conditional_edges(
-            "filemanager_tab_node_tools",
-            tools_condition,
-            {"tools": "filemanager_tab_node_tools", "__end__": "chatbot"},
-        )
-        
-        graph_builder.add_conditional_edges(
-            "filemanager_write_node",
-            tools_condition,
-            {"tools": "filemanager_write_node_tools", "__end__": "chatbot"},
-        )
-        graph_builder.add_conditional_edges(
-            "filemanager_write_node_tools",
-            tools_condition,
-            {"tools": "filemanager_write_node_tools", "__end__": "chatbot"},
-        )
-        
-        graph_builder.add_conditional_edges(
-            "filemanager_read_node",
-            tools_condition,
-            {"tools": "filemanager_read_node_tools", "__end__": "chatbot"},
-        )
-        graph_builder.add_conditional_edges(
-            "filemanager_read_node_tools",
-            tools_condition,
-            {"tools": "filemanager_read_node_tools", "__end__": "chatbot"},
-        )
+        for tools in TOOLS:
+            if tools == "network_search_tools":
+                continue
+            graph_builder.add_conditional_edges(
+                tools,
+                track(f"{tools}_response", c[f"{tools}_response"].execute),
+                {"respond": "respond", "chatbot": "chatbot"},
+            )
 
         graph_builder.add_conditional_edges(
-            "calendar_node", CalendarRedirectorEdge().execute
+            "calendar_node", track("calendar_edge", c["calendar_edge"].execute)
         )
         graph_builder.add_conditional_edges(
-            "keyboard_node", KeyboardRedirectorEdge().execute
+            "keyboard_node", track("keyboard_edge", c["keyboard_edge"].execute)
         )
         graph_builder.add_conditional_edges(
-            "chrome_node", ChromeRedirectorEdge().execute
+            "chrome_node", track("chrome_edge", c["chrome_edge"].execute)
         )
         graph_builder.add_conditional_edges(
-            "filemanager_node", FileManagerRedirectorEdge().execute
+            "filemanager_node", track("filemanager_edge", c["filemanager_edge"].execute)
         )
 
         graph_builder.add_edge("calendar_create", "calendar_final")
@@ -200,16 +140,15 @@ class GraphBuilder:
         graph_builder.add_edge("calendar_delete", "calendar_final")
         graph_builder.add_edge("calendar_final", "chatbot")
 
-        graph_builder.add_edge("keyboard_hotkey", "chatbot")
-        graph_builder.add_edge("keyboard_presskey", "chatbot")
-        graph_builder.add_edge("keyboard_write", "chatbot")
-        graph_builder.add_edge("youtube_node", "chatbot")
-        graph_builder.add_edge("chrome_tab_node","chatbot")
-        graph_builder.add_edge("chrome_close_node","chatbot")
-        graph_builder.add_edge("chrome_func_node","chatbot")
-        graph_builder.add_edge("filemanager_tab_node","chatbot")
-        graph_builder.add_edge("filemanager_close_node","chatbot")
-        graph_builder.add_edge("filemanager_write_node","chatbot")
-        graph_builder.add_edge("filemanager_read_node","chatbot")
+        # Nodes that already answer with a user-ready AIMessage skip the chatbot rephrasing.
+        direct = "respond" if settings.response_templates else "chatbot"
+        graph_builder.add_edge("keyboard_hotkey", direct)
+        graph_builder.add_edge("keyboard_presskey", direct)
+        graph_builder.add_edge("keyboard_write", direct)
+        graph_builder.add_edge("youtube_node", direct)
+        graph_builder.add_edge("chrome_close_node", direct)
+        graph_builder.add_edge("filemanager_close_node", direct)
         graph_builder.add_edge("chatbot", END)
-        return graph_builder.compile(checkpointer=self.memory)
+        graph_builder.add_edge("respond", END)
+        logger.info(f"LLM client registry: {llm_registry.stats()}")
+        return startup.run("graph", "compile", lambda: graph_builder.compile(checkpointer=self.memory))
@@ -0,0 +1,192 @@
+import argparse
+import asyncio
+import functools
+import importlib
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Tuple
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Reference point for every timeline entry; this module is imported at the very start of startup.
+PROCESS_START = time.perf_counter()
+
+
+@dataclass
+class Component:
+    """A module attribute to load at startup: a class to construct or a plain value (e.g. a tool list)."""
+
+    module: str
+    attr: str
+    deps: Tuple[str, ...] = ()
+    construct: bool = True
+
+
+@dataclass
+class TimelineEntry:
+    component: str
+    phase: str
+    start: float
+    end: float
+    thread: str = field(default_factory=lambda: threading.current_thread().name)
+
+    @property
+    def duration(self) -> float:
+        return self.end - self.start
+
+
+class StartupTimeline:
+    """Per-component import, construction and first-use timings, relative to process start."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.entries: List[TimelineEntry] = []
+        self.marks: Dict[str, float] = {}
+
+    def record(self, component: str, phase: str, start: float, end: float):
+        with self._lock:
+            self.entries.append(TimelineEntry(component, phase, start - PROCESS_START, end - PROCESS_START))
+
+    def mark(self, name: str):
+        self.marks[name] = time.perf_counter() - PROCESS_START
+
+    def to_dict(self) -> dict:
+        with self._lock:
+            entries = sorted(self.entries, key=lambda e: e.start)
+        return {
+            "marks": {k: round(v, 4) for k, v in self.marks.items()},
+            "entries": [
+                {
+                    "component": e.component,
+                    "phase": e.phase,
+                    "start": round(e.start, 4),
+                    "duration": round(e.duration, 4),
+                    "thread": e.thread,
+                }
+                for e in entries
+            ],
+        }
+
+    def waterfall(self, width: int = 60) -> str:
+        data = self.to_dict()
+        entries = data["entries"]
+        if not entries:
+            return "(no startup entries)"
+        horizon = max([e["start"] + e["duration"] for e in entries] + list(data["marks"].values()))
+        scale = width / horizon if horizon else 0
+        label = max(len(f"{e['component']}:{e['phase']}") for e in entries)
+        lines = [f"{'component:phase'.ljust(label)}  {'start':>8} {'dur':>8}  0s{'':{width - 4}}{horizon:.2f}s"]
+        for e in entries:
+            offset = int(e["start"] * scale)
+            bar = "#" * max(1, int(e["duration"] * scale))
+            lines.append(
+                f"{(e['component'] + ':' + e['phase']).ljust(label)}  {e['start'] * 1e3:7.0f}ms {e['duration'] * 1e3:6.0f}ms  {' ' * offset}{bar}"
+            )
+        for name, at in data["marks"].items():
+            lines.append(f"{('@' + name).ljust(label)}  {at * 1e3:7.0f}ms {'':>8}  {' ' * int(at * scale)}|")
+        return "\n".join(lines)
+
+    def write(self, json_path: str = None, text_path: str = None):
+        json_path = json_path or settings.startup_timeline_path
+        text_path = text_path or json_path.rsplit(".", 1)[0] + ".txt"
+        try:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, indent=2)
+            with open(text_path, "w", encoding="utf-8") as f:
+                f.write(self.waterfall() + "\n")
+        except OSError as e:
+            logger.warning(f"Could not write startup timeline: {e}")
+
+
+class StartupOrchestrator:
+    """Loads independent components concurrently and records when each became ready.
+
+    Imports are serialised: they are CPU-bound under the GIL anyway, and
+    importing interdependent modules from several threads at once can deadlock
+    on the module locks. Construction runs in a thread pool, so blocking
+    constructors overlap. A component starts as soon as its ``deps`` are built.
+    """
+
+    def __init__(self, timeline: StartupTimeline = None, max_workers: int = None):
+        self.timeline = timeline or StartupTimeline()
+        self.max_workers = max_workers or settings.startup_workers
+        self._import_lock = threading.Lock()
+        self._first_used = set()
+
+    def _import(self, name: str, module: str):
+        with self._import_lock:
+            start = time.perf_counter()
+            mod = importlib.import_module(module)
+            self.timeline.record(name, "import", start, time.perf_counter())
+        return mod
+
+    def _load(self, name: str, spec: Component, deps: list):
+        value = getattr(self._import(name, spec.module), spec.attr)
+        if not spec.construct:
+            return value
+        start = time.perf_counter()
+        value = value(*deps)
+        self.timeline.record(name, "construct", start, time.perf_counter())
+        return value
+
+    async def load_all(self, specs: Dict[str, Component]) -> Dict[str, Any]:
+        loop = asyncio.get_running_loop()
+        tasks: Dict[str, asyncio.Task] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="startup") as pool:
+
+            async def load(name: str, spec: Component):
+                deps = [await tasks[d] for d in spec.deps]
+                return await loop.run_in_executor(pool, self._load, name, spec, deps)
+
+            for name, spec in specs.items():
+                tasks[name] = asyncio.ensure_future(load(name, spec))
+            results = await asyncio.gather(*tasks.values())
+        return dict(zip(tasks, results))
+
+    def run(self, name: str, phase: str, fn: Callable, *args):
+        """Time a synchronous step (e.g. graph compilation) on the current thread."""
+        start = time.perf_counter()
+        result = fn(*args)
+        self.timeline.record(name, phase, start, time.perf_counter())
+        return result
+
+    def track_first_use(self, name: str, fn: Callable) -> Callable:
+        """Wrap a node or edge so its first call lands on the timeline."""
+        if not asyncio.iscoroutinefunction(fn):
+            return fn
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            if name in self._first_used:
+                return await fn(*args, **kwargs)
+            self._first_used.add(name)
+            start = time.perf_counter()
+            try:
+                return await fn(*args, **kwargs)
+            finally:
+                self.timeline.record(name, "first_use", start, time.perf_counter())
+
+        return wrapper
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the assistant graph and write the startup timeline.")
+    parser.add_argument("--json", default=settings.startup_timeline_path)
+    parser.add_argument("--max-seconds", type=float, help="exit non-zero if the graph is not ready within this time")
+    args = parser.parse_args()
+
+    from src.core.assistant import VoiceAssistant
+
+    assistant = VoiceAssistant()
+    asyncio.run(assistant.initialize())
+    timeline = assistant.graph_builder.startup.timeline
+    timeline.write(args.json)
+    print(timeline.waterfall())
+    ready = timeline.marks.get("ready", 0.0)
+    if args.max_seconds is not None and ready > args.max_seconds:
+        raise SystemExit(f"Startup took {ready:.2f}s, budget is {args.max_seconds:.2f}s")
@@ -8,4 +8,5 @@ class AssistantState(TypedDict):
     user_preferences: dict
     calendar_events: List[any]
     feedback:str
+    routing: dict
   
@@ -1,23 +1,32 @@
 import asyncio
+import logging
+import os
 from abc import ABC, abstractmethod
 from typing import Any, Dict
+from src.config.settings import settings
 from src.core.state import AssistantState
-from src.services.llm_service import LLMService
+from src.services.llm_service import llm_service as shared_llm_service
 from src.utils.conversation import ConversationFormatter
-from datetime import datetime
-from zoneinfo import ZoneInfo
+from src.utils.intent_classifier import IntentClassifier
+from src.utils.routing_log import routing_logger
+from src.utils.prompt import bucketed_time
+
+logger = logging.getLogger(__name__)
 
 
 class BaseEdge(ABC):
     """Base class for all edges in the assistant graph."""
 
-    def __init__(self, config=None):
-        self.llm_service = LLMService()
+    def __init__(self, config=None, llm_service=None):
+        self.llm_service = llm_service or shared_llm_service
         self.config = config or {}
         self.formatter = ConversationFormatter().format_conversation
         self.formatter_without_tools = (
             ConversationFormatter().format_conversation_without_tools
         )
+        self.router_model = IntentClassifier.load(
+            os.path.join(settings.router_model_dir, f"{type(self).__name__}.npz")
+        )
 
     @abstractmethod
     def execute(self, state: AssistantState) -> Dict[str, Any]:
@@ -28,8 +37,29 @@ class BaseEdge(ABC):
         """Get the system message for this edge."""
         return "You are a helpful AI assistant."
 
+    def _local_route(self, user_query: str, valid_nodes) -> str | None:
+        """Return the trained classifier's route when its calibrated probability is high enough."""
+        if self.router_model is None or not user_query:
+            return None
+        route, prob = self.router_model.predict(user_query, settings.mode)
+        if prob >= settings.router_model_threshold and route in valid_nodes:
+            logger.debug(f"{type(self).__name__} decision (classifier, {prob:.2f}): {route}")
+            return route
+        return None
+
+    def _routed(self, state, user_query: str, valid_nodes) -> str | None:
+        """Sub-route chosen by the combined routing call, if it is one this edge can take."""
+        route = (state.get("routing") or {}).get("sub_route")
+        if route in valid_nodes:
+            self._log_decision(user_query, route, "combined")
+            return route
+        return None
+
+    def _log_decision(self, user_query: str, route: str, source: str):
+        routing_logger.log(type(self).__name__, user_query, settings.mode, route, source)
+
     def _get_current_time(self):
-        return datetime.now(ZoneInfo("Asia/Kolkata"))
+        return bucketed_time()
 
     def execute_sync_wrapper(self, state: AssistantState) -> Dict[str, Any]:
         """Wrapper to run async execute in sync context."""
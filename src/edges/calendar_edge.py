@@ -1,34 +1,47 @@
 import asyncio
 from langchain_core.messages import SystemMessage, HumanMessage
 from .base_edge import BaseEdge
+from src.services.llm_scheduler import Priority
 
 
 class CalendarRedirectorEdge(BaseEdge):
+    VALID_NODES = {
+        "calendar_create",
+        "calendar_update",
+        "calendar_delete",
+        "calendar_final"
+    }
+
     def __init__(self):
         super().__init__()
 
     async def execute(self, state):
         """Edge that decides the next node with improved routing logic."""
-        system_msg = self.get_system_message()
         user_query = self._extract_latest_user_query(state["messages"])
+        route = self._routed(state, user_query, self.VALID_NODES)
+        if route:
+            return route
+
+        route = self._local_route(user_query, self.VALID_NODES)
+        if route:
+            self._log_decision(user_query, route, "classifier")
+            return route
+
+        system_msg = self.get_system_message()
         human_msg = self._format_human_message(state["messages"], user_query, state)
 
         messages = [SystemMessage(content=system_msg), HumanMessage(content=human_msg)]
         
         try:
-            response = await self.llm_service.ainvoke(messages, use_pro=True)
+            response = await self.llm_service.ainvoke(
+                messages, use_pro=True, priority=Priority.ROUTING, cache_namespace="router"
+            )
             result = response.content.strip().lower()
             
-            valid_nodes = {
-                "calendar_create",
-                "calendar_update",
-                "calendar_delete",
-                "calendar_final"
-            }
-            
             print(f"Calendar Router decision: {result}")
             
-            if result in valid_nodes:
+            if result in self.VALID_NODES:
+                self._log_decision(user_query, result, "llm")
                 return result
             else:
                 print(f"Invalid router result '{result}', defaulting to calendar_final")
@@ -1,33 +1,46 @@
 import asyncio
 from langchain_core.messages import SystemMessage, HumanMessage
 from .base_edge import BaseEdge
+from src.services.llm_scheduler import Priority
 from src.config.settings import settings
 
 
 class ChromeRedirectorEdge(BaseEdge):
+    VALID_NODES = {
+        "chatbot",
+        "chrome_close_node",
+        "chrome_tab_node",
+        "chrome_func_node",
+    }
+
     def __init__(self):
         super().__init__()
 
     async def execute(self, state):
         """Edge that routes to chatbot or a specific Chrome node."""
-        system_msg = self.get_system_message()
         user_query = self._extract_latest_user_query(state["messages"])
+        route = self._routed(state, user_query, self.VALID_NODES)
+        if route:
+            return route
+
+        route = self._local_route(user_query, self.VALID_NODES)
+        if route:
+            self._log_decision(user_query, route, "classifier")
+            return route
+
+        system_msg = self.get_system_message()
         human_msg = self._format_human_message(state["messages"], user_query, state)
 
         messages = [SystemMessage(content=system_msg), HumanMessage(content=human_msg)]
 
         try:
-            response = await self.llm_service.ainvoke(messages, use_pro=True)
+            response = await self.llm_service.ainvoke(
+                messages, use_pro=True, priority=Priority.ROUTING, cache_namespace="router"
+            )
             result = response.content.strip().lower()
 
-            valid_nodes = {
-                "chatbot",
-                "chrome_close_node",
-                "chrome_tab_node",
-                "chrome_func_node",
-            }
-
-            if result in valid_nodes:
+            if result in self.VALID_NODES:
+                self._log_decision(user_query, result, "llm")
                 return result
 
             return "chatbot"
@@ -1,11 +1,35 @@
 import asyncio
+import logging
+import time
 from langchain_core.messages import SystemMessage, HumanMessage
 from .base_edge import BaseEdge
+from src.services.llm_scheduler import Priority
 from src.config.settings import settings
+from src.utils.fast_router import KeywordRouter, router_stats
+
+logger = logging.getLogger(__name__)
+
 
 class RedirectorEdge(BaseEdge):
+    VALID_NODES = {
+        "chatbot",
+        "network_search",
+        "calendar_node",
+        "system_node",
+        "software_node",
+        "keyboard_node",
+        "youtube_node",
+        "chrome_node",
+        "filemanager_node"
+    }
+
     def __init__(self):
         super().__init__()
+        self.fast_router = KeywordRouter.from_prompt(
+            self.get_system_message(),
+            threshold=settings.fast_router_threshold,
+            min_score=settings.fast_router_min_score,
+        )
 
     async def execute(self, state):
         """Edge that decides the next node with improved routing logic."""
@@ -19,40 +43,58 @@ class RedirectorEdge(BaseEdge):
         if mode == "filemanager":
             return "filemanager_node"
 
-        system_msg = self.get_system_message()
         user_query = self._extract_latest_user_query(state["messages"])
+        routing = state.get("routing") or {}
+        if routing.get("route") in self.VALID_NODES:
+            self._log_decision(user_query, routing["route"], routing.get("source", "combined"))
+            return routing["route"]
+
+        route, source = self.local_route(user_query)
+        if route:
+            self._log_decision(user_query, route, source)
+            return route
+
+        system_msg = self.get_system_message()
         human_msg = self._format_human_message(state["messages"], user_query)
 
         messages = [SystemMessage(content=system_msg), HumanMessage(content=human_msg)]
 
         try:
-            response = await self.llm_service.ainvoke(messages, use_pro=True)
+            start = time.perf_counter()
+            response = await self.llm_service.ainvoke(
+                messages, use_pro=True, priority=Priority.ROUTING, cache_namespace="router"
+            )
+            router_stats.record("llm", time.perf_counter() - start)
             result = response.content.strip().lower()
 
-            valid_nodes = {
-                "chatbot",
-                "network_search",
-                "calendar_node",
-                "system_node",
-                "software_node",
-                "keyboard_node",
-                "youtube_node",
-                "chrome_node",
-                "filemanager_node"
-            }
-
-            print(f"Router decision: {result}")
-
-            if result in valid_nodes:
+            logger.debug(f"Router decision (llm): {result} | {router_stats.summary()}")
+
+            if result in self.VALID_NODES:
+                self._log_decision(user_query, result, "llm")
                 return result
             else:
-                print(f"Invalid router result '{result}', defaulting to chatbot")
+                logger.warning(f"Invalid router result '{result}', defaulting to chatbot")
                 return "chatbot"
 
         except Exception as e:
-            print(f"Router error: {e}, defaulting to chatbot")
+            logger.warning(f"Router error: {e}, defaulting to chatbot")
             return "chatbot"
 
+    def local_route(self, user_query: str):
+        """Keyword fast path, then the trained classifier; returns (route, source) or (None, None)."""
+        if settings.fast_router_enabled:
+            start = time.perf_counter()
+            route, confidence = self.fast_router.route(user_query)
+            if route:
+                router_stats.record("fast", time.perf_counter() - start)
+                logger.debug(f"Router decision (fast, {confidence:.2f}): {route} | {router_stats.summary()}")
+                return route, "fast"
+
+        route = self._local_route(user_query, self.VALID_NODES)
+        if route:
+            return route, "classifier"
+        return None, None
+
     def get_system_message(self) -> str:
         return """You are an intelligent request router that analyzes user messages and determines the appropriate system component to handle them.
     
@@ -81,6 +123,7 @@ class RedirectorEdge(BaseEdge):
     → calendar_node  
     TRIGGERS: calendar, schedule, meeting, event, appointment, book, plan, remind
     EXAMPLES: "check my calendar", "schedule meeting", "what events tomorrow"
+    NOT FOR: trip, travel, flight, train, hotel, ticket, vacation
     
     → chrome_node
     TRIGGERS: browser, website, navigate, open site, web page, url, bookmark, chrome, enter chrome node
@@ -93,10 +136,12 @@ class RedirectorEdge(BaseEdge):
     → system_node
     TRIGGERS: brightness, volume, sound, airplane mode, wifi, bluetooth, CPU, RAM, GPU, performance, system info
     EXAMPLES: "increase brightness", "check CPU usage", "mute volume"
+    NOT FOR: what is, what does, meaning of, difference between, explain, how much ram do i need
     
     → software_node
     TRIGGERS: open app, launch, start program, run software, install, virus scan, malware check
     EXAMPLES: "open chrome", "launch calculator", "scan for viruses"
+    NOT FOR: install python, pip install, npm install, how to install, how do i install, want to install
     
     → keyboard_node
     TRIGGERS: when user wants to set keyboard mode
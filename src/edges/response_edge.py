@@ -0,0 +1,22 @@
+from .base_edge import BaseEdge
+from src.config.settings import settings
+from src.utils.response import is_interrupted, latest_tool_results, user_ready_tool_names
+
+
+class ResponseRedirectorEdge(BaseEdge):
+    """Routes tool results to the local responder when every result is user-ready, else to the chatbot."""
+
+    def __init__(self, tools):
+        super().__init__()
+        self.user_ready = user_ready_tool_names(tools)
+
+    async def execute(self, state):
+        if not settings.response_templates:
+            return "chatbot"
+        results = latest_tool_results(state["messages"])
+        # Errors and timeouts go to the chatbot so it can explain what happened.
+        if results and all(
+            r.name in self.user_ready and r.status != "error" and not is_interrupted(r) for r in results
+        ):
+            return "respond"
+        return "chatbot"
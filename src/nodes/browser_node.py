@@ -3,7 +3,8 @@ from langchain_core.messages import SystemMessage, HumanMessage
 from .base_node import BaseNode
 from src.config.settings import settings
 from src.core.state import AssistantState
-from src.tools.browser_tools import browser_tools
+from src.tools.browser_tools import get_browser_tools
+from src.utils.prompt import assemble_prompt
 
 class BrowserNode(BaseNode):
     def __init__(self):
@@ -17,17 +18,16 @@ class BrowserNode(BaseNode):
         human_msg = self._format_human_message(state["messages"], user_query)
 
         messages = [SystemMessage(content=system_msg), HumanMessage(content=human_msg)]
-        llm =await self.llm_service.abind_tools(browser_tools)
+        llm =await self.llm_service.abind_tools(await get_browser_tools())
         response =await llm.ainvoke(messages)
         return {"messages": [response]}
 
     def get_system_message(self) -> str:
-        return f"""
+        return assemble_prompt(f"""
         You are {settings.assistant_name}, an AI voice assistant for Windows.
-        Current time: {self._get_current_time()}.
         use the browser tools based on the user needs. 
         Provide helpful and accurate responses based on the search results.
-        """
+        """, {"Current time": self._get_current_time()})
 
     def _extract_latest_user_query(self, messages):
         from langchain_core.messages import HumanMessage
@@ -2,10 +2,9 @@ import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict
 from src.core.state import AssistantState
-from src.services.llm_service import LLMService
+from src.services.llm_service import llm_service as shared_llm_service
 from src.utils.conversation import ConversationFormatter
-from datetime import datetime
-from zoneinfo import ZoneInfo
+from src.utils.prompt import bucketed_time
 import pickle
 import os
 from googleapiclient.discovery import build
@@ -15,10 +14,10 @@ from google.auth.transport.requests import Request
 class CalendarBaseNode(ABC):
     """Base class for all nodes in the assistant graph."""
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, llm_service=None):
         self.SCOPES = ["https://www.googleapis.com/auth/calendar"]
         self.ConversationFormatter = ConversationFormatter()
-        self.llm_service = LLMService()
+        self.llm_service = llm_service or shared_llm_service
         self.config = config or {}
         self.formatter = self.ConversationFormatter.format_conversation
         self.formatter_without_tools = self.ConversationFormatter.format_conversation_without_tools
@@ -30,7 +29,7 @@ class CalendarBaseNode(ABC):
         pass
 
     def _get_current_time(self):
-        return datetime.now(ZoneInfo("Asia/Kolkata"))
+        return bucketed_time()
 
     def get_calendar_service(self):
         creds = None
@@ -4,6 +4,7 @@ from src.config.settings import settings
 from src.core.state import AssistantState
 import datetime
 from pydantic import BaseModel, Field
+from src.utils.prompt import assemble_prompt
 
 
 class DataOutput(BaseModel):
@@ -26,7 +27,7 @@ class DeleteCalendarNode(CalendarBaseNode):
         human_msg = self._format_human_message(state["messages"], user_query)
         messages = [SystemMessage(content=system_msg), HumanMessage(content=human_msg)]
 
-        llm = self.llm_service.llm.with_structured_output(DataOutput)
+        llm = self.llm_service.with_structured_output(DataOutput, cache_namespace="calendar")
         res_data = await llm.ainvoke(messages)
 
 
@@ -82,31 +83,27 @@ class DeleteCalendarNode(CalendarBaseNode):
         else:
             calendar_details = "\nNo events available to delete."
     
-        return f"""You are an **event delete assistant** that extracts structured information from user requests to delete calendar events.
+        return assemble_prompt(f"""You are an **event delete assistant** that extracts structured information from user requests to delete calendar events.
     
     ROLE:
     - Identify the correct event to delete.
     - Ensure user confirmation before deletion.
     - Output ONLY the fields defined in the schema (can_make, feedback, event_id).
     
-    CURRENT TIME: {self._get_current_time()}
-    
-    {calendar_details}
-    
     ### EXTRACTION RULES
     1) **can_make** = True **only if**:
-       - You can unambiguously identify which event to delete (**event_id is known from the list above**), **and**
+       - You can unambiguously identify which event to delete (**event_id is known from the Events list in the current context**), **and**
        - The user has **explicitly confirmed** deletion in the conversation.
          - Treat as confirmed if the latest user message includes both delete intent and an explicit confirmation (e.g., "yes, delete it", "confirm delete", "go ahead and delete").
          - Or if earlier the assistant asked to confirm and the user subsequently replied affirmatively (e.g., "yes", "confirm", "proceed", "delete it").
-    2) **event_id**: REQUIRED when can_make=True. **Never invent IDs; use an ID from the list above only.**
+    2) **event_id**: REQUIRED when can_make=True. **Never invent IDs; use an ID from the Events list in the current context only.**
     3) **feedback**: Always provide a concise, helpful message:
        - If can_make=True: confirm what will be deleted (event name/time if available).
        - If can_make=False: ask for missing info (which event?) or ask for explicit confirmation.
     
     ### INTENT & IDENTIFICATION
     - Delete intent keywords: **delete, remove, cancel, discard, clear, erase, drop, trash**.
-    - Identify the event by matching user references (name, date/time, index like "the second event", or exact ID) against the list above.
+    - Identify the event by matching user references (name, date/time, index like "the second event", or exact ID) against the Events list in the current context.
     - If multiple events match or it’s ambiguous → set can_make=false and ask the user to specify the event (name/time/ID).
     - If there are **no events available**, set can_make=false with feedback indicating that there are no deletable events.
     
@@ -126,7 +123,7 @@ class DeleteCalendarNode(CalendarBaseNode):
     - **event_id** is mandatory when can_make=True.
     - **Explicit confirmation** is mandatory; otherwise can_make=False with a confirmation prompt in feedback.
     - Do not modify any fields; your task is **delete-only**.
-    """
+    """, {"Current time": self._get_current_time(), "Events": calendar_details})
     
 
     def _format_human_message(self, messages, user_query):
@@ -4,6 +4,8 @@ from src.config.settings import settings
 from src.core.state import AssistantState
 import datetime
 from pydantic import BaseModel, Field
+from src.services.llm_scheduler import Priority
+from src.utils.prompt import assemble_prompt
 
 
 class DateOutput(BaseModel):
@@ -16,21 +18,40 @@ class CalendarNode(CalendarBaseNode):
         super().__init__()
 
     async def execute(self, state) -> AssistantState:
+        dates = self._routed_dates(state.get("routing") or {})
+        if dates is None:
+            dates = await self._parse_dates(state)
+        start_date, end_date = dates
+        
+        events_data = self.get_reminders(start_date, end_date)
+        
+    
+        return {"calendar_events": events_data}
+
+    @staticmethod
+    def _routed_dates(routing):
+        """Date range extracted by the combined routing call, if it parses."""
+        try:
+            start = datetime.datetime.fromisoformat(routing["start_date"].replace('Z', ''))
+            end = datetime.datetime.fromisoformat(routing["end_date"].replace('Z', ''))
+        except (KeyError, AttributeError, ValueError):
+            return None
+        return start, end
+
+    async def _parse_dates(self, state):
         system_msg = self.get_system_message()
         user_query = self._extract_latest_user_query(state["messages"])
         human_msg = self._format_human_message(state["messages"], user_query)
         messages = [SystemMessage(content=system_msg), HumanMessage(content=human_msg)]
         
-        llm = self.llm_service.llm.with_structured_output(DateOutput)
+        llm = self.llm_service.with_structured_output(
+            DateOutput, priority=Priority.ROUTING, cache_namespace="calendar"
+        )
         dates = await llm.ainvoke(messages)
         
         start_date = datetime.datetime.fromisoformat(dates.start.replace('Z', ''))
         end_date = datetime.datetime.fromisoformat(dates.end.replace('Z', ''))
-        
-        events_data = self.get_reminders(start_date, end_date)
-        
-    
-        return {"calendar_events": events_data}
+        return start_date, end_date
 
     def get_reminders(self, start, end):
         service = self.get_calendar_service()
@@ -50,7 +71,7 @@ class CalendarNode(CalendarBaseNode):
 
     
     def get_system_message(self):
-        return f"""You are a calendar date range parser.
+        return assemble_prompt(f"""You are a calendar date range parser.
 
 ROLE:
 - Extract the best possible start and end dates from the user's query.
@@ -75,8 +96,7 @@ SPECIAL RULES:
 
 OUTPUT:
 - Return ISO format strings (YYYY-MM-DDTHH:MM:SS) without timezone info.
-CURRENT TIME: {self._get_current_time()}
-"""
+""", {"Current time": self._get_current_time()})
 
     def _format_human_message(self, messages, user_query):
         return f"""CONVERSATION CONTEXT:
@@ -4,6 +4,7 @@ from src.config.settings import settings
 from src.core.state import AssistantState
 import datetime
 from pydantic import BaseModel, Field
+from src.utils.prompt import assemble_prompt
 
 
 class DataOutput(BaseModel):
@@ -36,7 +37,7 @@ class UpdateCalendarNode(CalendarBaseNode):
         human_msg = self._format_human_message(state["messages"], user_query)
         messages = [SystemMessage(content=system_msg), HumanMessage(content=human_msg)]
 
-        llm = self.llm_service.llm.with_structured_output(DataOutput)
+        llm = self.llm_service.with_structured_output(DataOutput, cache_namespace="calendar")
         res_data = await llm.ainvoke(messages)
 
         if not res_data.can_make:
@@ -144,20 +145,16 @@ class UpdateCalendarNode(CalendarBaseNode):
         else:
             calendar_details = "\nNo events available to update."
 
-        return f"""You are an **event update assistant** that extracts structured information from user requests to update calendar events.
+        return assemble_prompt(f"""You are an **event update assistant** that extracts structured information from user requests to update calendar events.
     
     ROLE:
     - Identify the correct event to update.
     - Extract only the fields the user wants to change.
     - Provide structured data for downstream systems.
     
-    CURRENT TIME: {self._get_current_time()}
-    
-    {calendar_details}
-    
     ### EXTRACTION RULES:
     1. **can_make**: True ONLY if you can identify which event to update AND at least one field to change.  
-    2. **event_id**: REQUIRED. Must match one of the available event IDs above.  
+    2. **event_id**: REQUIRED. Must match one of the event IDs listed under Events in the current context.  
     3. **name**: Only set if the user explicitly wants to rename the event.  
     4. **start_date**: Set only if the start time/date is being changed.  
     5. **end_date**:  
@@ -203,7 +200,7 @@ class UpdateCalendarNode(CalendarBaseNode):
     - `event_id` and at least one changed field are mandatory.  
     - If missing, set `can_make=false`.  
     - Always infer `end_date` as start_date + 1 hour if missing.  
-    """
+    """, {"Current time": self._get_current_time(), "Events": calendar_details})
 
     def _format_human_message(self, messages, user_query):
         return f"""CONVERSATION HISTORY:
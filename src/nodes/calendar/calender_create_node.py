@@ -4,6 +4,7 @@ from src.config.settings import settings
 from src.core.state import AssistantState
 import datetime
 from pydantic import BaseModel, Field
+from src.utils.prompt import assemble_prompt
 
 
 class DataOutput(BaseModel):
@@ -35,7 +36,7 @@ class CreateCalendarNode(CalendarBaseNode):
         human_msg = self._format_human_message(state["messages"], user_query)
         messages = [SystemMessage(content=system_msg), HumanMessage(content=human_msg)]
 
-        llm = self.llm_service.llm.with_structured_output(DataOutput)
+        llm = self.llm_service.with_structured_output(DataOutput, cache_namespace="calendar")
         res_data = await llm.ainvoke(messages)
 
         if not res_data.can_make:
@@ -89,10 +90,9 @@ class CreateCalendarNode(CalendarBaseNode):
             return f"Failed to create calendar event: {str(e)}"
 
     def get_system_message(self):
-        return f"""You are an event creation assistant that extracts information from user requests.
+        return assemble_prompt(f"""You are an event creation assistant that extracts information from user requests.
 
 ROLE: Parse user requests to create calendar events
-CURRENT TIME: {self._get_current_time()}
 
 EXTRACTION RULES:
 1. **can_make**: Set to true only if you can extract NAME, START_DATE and END_DATE
@@ -129,7 +129,7 @@ REQUIRED INFORMATION:
 - Start date/time is MANDATORY
 - End date/time is MANDATORY(add one hr to starting data if not mentioned)  
 - If any missing, set can_make=false
-"""
+""", {"Current time": self._get_current_time()})
 
     def _format_human_message(self, messages, user_query):
         return f"""CONVERSATION HISTORY:
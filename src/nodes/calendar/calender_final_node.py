@@ -2,6 +2,7 @@ from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 from src.nodes.calendar.base_node import CalendarBaseNode
 from src.config.settings import settings
 from src.core.state import AssistantState
+from src.utils.prompt import assemble_prompt
 
 
 class FinalCalendarNode(CalendarBaseNode):
@@ -19,14 +20,11 @@ class FinalCalendarNode(CalendarBaseNode):
         return {"messages": [AIMessage(content=response.content)],"feedback":None}
     
     def get_system_message(self,state):
-        return f"""You are a calendar data summarizer that prepares comprehensive information for the chatbot.
+        return assemble_prompt(f"""You are a calendar data summarizer that prepares comprehensive information for the chatbot.
 
 ROLE: Calendar operation data compiler
-CURRENT TIME: {self._get_current_time()}
 
-TASK: Provide complete, detailed information about calendar operations for the chatbot to respond to the user.
-Feedback:
-{state.get("feedback","")}
+TASK: Provide complete, detailed information about calendar operations for the chatbot to respond to the user, using the Feedback in the current context.
 GUIDELINES:
 - Include ALL relevant details from calendar operations
 - List EVERY event with complete information (name, date, time)
@@ -54,7 +52,7 @@ For errors:
 
 OUTPUT FORMAT:
 Provide structured, complete information that gives the chatbot everything needed to respond naturally to the user.
-"""
+""", {"Current time": self._get_current_time(), "Feedback": state.get("feedback", "")})
 
     def _format_human_message(self, messages, user_query, state):
         calendar_events = state.get("calendar_events", [])
@@ -2,6 +2,8 @@ from langchain_core.messages import SystemMessage, HumanMessage, AIMessage, Tool
 from .base_node import BaseNode
 from src.config.settings import settings
 from src.core.state import AssistantState
+from src.utils.prompt import assemble_prompt
+from src.utils.response import response_stats
 
 class ChatbotNode(BaseNode):
     def __init__(self):
@@ -14,6 +16,7 @@ class ChatbotNode(BaseNode):
         human_msg = self._format_human_message(state["messages"], user_query)
         
         messages = [SystemMessage(content=system_msg), HumanMessage(content=human_msg)]
+        response_stats.record(templated=False)
         
         try:
             response = await self.llm_service.ainvoke(messages)
@@ -23,9 +26,8 @@ class ChatbotNode(BaseNode):
             return {"messages": [fallback_response]}
 
     def get_system_message(self) -> str:
-        return f"""```
+        return assemble_prompt(f"""```
 You are {settings.assistant_name}, an intelligent Windows voice assistant.
-Current time: {self._get_current_time()}
 
 ROLE: Conversational AI Assistant
 GOAL: Provide helpful, direct responses without unnecessary questions
@@ -78,7 +80,7 @@ OUTPUT REQUIREMENTS:
 - End responses cleanly without forced questions
 - If it have feedback from AI related to conformation - then return that feedback as it is (important)
 ```
-"""
+""", {"Current time": self._get_current_time()})
 
     def _extract_latest_user_query(self, messages):
         from langchain_core.messages import HumanMessage
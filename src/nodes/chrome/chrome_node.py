@@ -4,6 +4,7 @@ from src.nodes.base_node import BaseNode
 from src.core.state import AssistantState
 from pydantic import BaseModel, Field
 from src.config.settings import settings
+from src.services.llm_scheduler import Priority
 
 class DataOutput(BaseModel):
     next_mode: str = Field(description="next mode of the user")
@@ -14,13 +15,9 @@ class ChromeNode(BaseNode):
         super().__init__()
 
     async def execute(self, state) -> AssistantState:
-        system_msg = self.get_system_message()
-        user_query = self._extract_latest_user_query(state["messages"])
-        human_msg = self._format_human_message(state["messages"], user_query)
-        messages = [SystemMessage(content=system_msg), HumanMessage(content=human_msg)]
-        llm = self.llm_service.llm.with_structured_output(DataOutput)
-        res_data = await llm.ainvoke(messages)
-        mode = res_data.next_mode
+        mode = (state.get("routing") or {}).get("next_mode")
+        if mode is None:
+            mode = await self._classify_mode(state)
         if mode == "chrome":
             settings.mode="chrome"
             return {
@@ -31,6 +28,17 @@ class ChromeNode(BaseNode):
             "messages": [AIMessage(content="chrome mode has been exited.")]
         }
 
+    async def _classify_mode(self, state) -> str:
+        system_msg = self.get_system_message()
+        user_query = self._extract_latest_user_query(state["messages"])
+        human_msg = self._format_human_message(state["messages"], user_query)
+        messages = [SystemMessage(content=system_msg), HumanMessage(content=human_msg)]
+        llm = self.llm_service.with_structured_output(
+            DataOutput, priority=Priority.ROUTING, cache_namespace="mode"
+        )
+        res_data = await llm.ainvoke(messages)
+        return res_data.next_mode
+
     def get_system_message(self) -> str:
         return """
         You are a mode classifier for an AI assistant. Your job is to determine
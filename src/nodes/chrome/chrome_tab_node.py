@@ -8,6 +8,7 @@ import logging
 
 from src.tools.chrome_tab_tools import chrome_tab_tools
 from src.services.selenium_service import seleniumservice
+from src.utils.prompt import assemble_prompt
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,7 @@ class ChromeTabNode(BaseNode):
         super().__init__()
 
     async def execute(self, state: AssistantState) -> AssistantState:
-        system_msg = self.get_system_message()
+        system_msg = self.get_system_message((state.get("routing") or {}).get("tab_index"))
         user_query = self._extract_latest_user_query(state["messages"])
         if not user_query:
             return {
@@ -42,14 +43,13 @@ class ChromeTabNode(BaseNode):
             "messages": [response],
         }
 
-    def get_system_message(self) -> str:
+    def get_system_message(self, tab_index: int = None) -> str:
         """Generate system message with current browser state and instructions"""
         
         browser_state = self._get_detailed_browser_state()
 
-        return f"""You are a Chrome browser tab management assistant. Your task is to identify the correct tab based on user descriptions and perform the requested actions.
-
-{browser_state}
+        return assemble_prompt(f"""You are a Chrome browser tab management assistant. Your task is to identify the correct tab based on user descriptions and perform the requested actions.
+The open tabs are listed under CURRENT CONTEXT at the end.
 
 AVAILABLE TOOLS:
 1. switch_tab - Input: tab index (0-based integer)
@@ -77,13 +77,16 @@ TAB IDENTIFICATION RULES:
 
 IMPORTANT:
 - ALWAYS provide the exact tab index number (0-based) when using tools
-- Double-check the tab list above before choosing an index
+- Double-check the tab list in the current context before choosing an index
 - If unsure, pick the most logical match based on user intent
 - for new tab only give url like https://www.google.com/
 
 RESPONSE FORMAT:
 - Execute the action using the appropriate tool
-- Confirm what was done with specific details (e.g., "Closed tab 2: 'YouTube - Video Title'")"""
+- Confirm what was done with specific details (e.g., "Closed tab 2: 'YouTube - Video Title'")""",
+            {"Tab index suggested by the router": tab_index},
+            tail=browser_state,
+        )
 
         
     def _get_detailed_browser_state(self) -> str:
@@ -10,6 +10,7 @@ from src.services.selenium_service import seleniumservice
 from src.services.filemanger_service import FileManagerService
 from selenium.webdriver.common.by import By
 import re
+from src.utils.prompt import assemble_prompt
 logger = logging.getLogger(__name__)
 
 
@@ -19,7 +20,8 @@ class FileManagerTabNode(BaseNode):
         self.filemanager_services = FileManagerService()
 
     async def execute(self, state: AssistantState) -> AssistantState:
-        system_msg = self.get_system_message()
+        routing = state.get("routing") or {}
+        system_msg = self.get_system_message(routing.get("tab_index"), routing.get("path"))
         user_query = self._extract_latest_user_query(state["messages"])
         if not user_query:
             return {
@@ -46,7 +48,7 @@ class FileManagerTabNode(BaseNode):
             "messages": [response],
         }
 
-    def get_system_message(self) -> str:
+    def get_system_message(self, tab_index: int = None, path: str = None) -> str:
         """Generate system message with current File Manager state and instructions"""
 
         fm_state = self._get_detailed_filemanager_state()
@@ -56,15 +58,8 @@ class FileManagerTabNode(BaseNode):
         current_path = None
         if current_element:
               current_path = current_element.text[9:]
-        return f"""You are a File Manager assistant. Your task is to identify the correct File Manager tab based on user descriptions and perform the requested actions.
-        {fm_state}
-        ---
-        CURRENT PATH: {current_path}
-            
-        ---
-        
-        AVAILABLE FOLDERS AND FILES:
-        {self.filemanager_services.get_folder_contents(current_path)}
+        return assemble_prompt(f"""You are a File Manager assistant. Your task is to identify the correct File Manager tab based on user descriptions and perform the requested actions.
+        The open windows, current path and its folder contents are listed under CURRENT CONTEXT at the end.
         
         ---
         
@@ -100,14 +95,22 @@ class FileManagerTabNode(BaseNode):
         
         IMPORTANT:
         - ALWAYS provide the exact tab index number (0-based) when using tools
-        - Double-check the tab list above before choosing an index
+        - Double-check the window list in the current context before choosing an index
         - If unsure, pick the most logical match based on user intent
         - For new_tab only give a local folder path (do NOT add http:// or https://)
         - Don't open file in new tab
         
         RESPONSE FORMAT:
         - Execute the action using the appropriate tool
-        - Confirm what was done with specific details (e.g., "Closed tab 2: 'Documents'")"""
+        - Confirm what was done with specific details (e.g., "Closed tab 2: 'Documents'")""",
+            {
+                "CURRENT PATH": current_path,
+                "AVAILABLE FOLDERS AND FILES": self.filemanager_services.get_folder_contents(current_path),
+                "Tab index suggested by the router": tab_index,
+                "Path suggested by the router": path,
+            },
+            tail=fm_state,
+        )
 
     def _get_detailed_filemanager_state(self) -> str:
         """Get detailed File Manager state information for LLM decision making"""
@@ -2,18 +2,17 @@ import asyncio
 from abc import ABC, abstractmethod
 from typing import Any, Dict
 from src.core.state import AssistantState
-from src.services.llm_service import LLMService
+from src.services.llm_service import llm_service as shared_llm_service
 from src.utils.conversation import ConversationFormatter
-from datetime import datetime
-from zoneinfo import ZoneInfo
+from src.utils.prompt import bucketed_time
 
 
 class BaseNode(ABC):
     """Base class for all nodes in the assistant graph."""
 
-    def __init__(self, config=None):
+    def __init__(self, config=None, llm_service=None):
         self.ConversationFormatter = ConversationFormatter()
-        self.llm_service = LLMService()
+        self.llm_service = llm_service or shared_llm_service
         self.config = config or {}
         self.formatter = self.ConversationFormatter.format_conversation
         self.formatter_without_tools = self.ConversationFormatter.format_conversation_without_tools
@@ -90,7 +89,7 @@ class BaseNode(ABC):
         pass
 
     def _get_current_time(self):
-        return datetime.now(ZoneInfo("Asia/Kolkata"))
+        return bucketed_time()
 
     def execute_sync_wrapper(self, state: AssistantState) -> Dict[str, Any]:
         """Wrapper to run async execute in sync context."""
@@ -4,6 +4,7 @@ from src.nodes.base_node import BaseNode
 from src.core.state import AssistantState
 from pydantic import BaseModel, Field
 from src.config.settings import settings
+from src.services.llm_scheduler import Priority
 
 
 class DataOutput(BaseModel):
@@ -19,7 +20,9 @@ class KeyboardNode(BaseNode):
         user_query = self._extract_latest_user_query(state["messages"])
         human_msg = self._format_human_message(state["messages"], user_query)
         messages = [SystemMessage(content=system_msg), HumanMessage(content=human_msg)]
-        llm = self.llm_service.llm.with_structured_output(DataOutput)
+        llm = self.llm_service.with_structured_output(
+            DataOutput, priority=Priority.ROUTING, cache_namespace="mode"
+        )
         res_data = await llm.ainvoke(messages)
         mode = res_data.next_mode
         if mode == "keyboard":
@@ -33,7 +33,7 @@ class KeyboardPressNode(BaseNode):
             human_msg = self._format_human_message(state["messages"], user_query)
             messages = [SystemMessage(content=system_msg), HumanMessage(content=human_msg)]
 
-            llm = self.llm_service.llm.with_structured_output(DataOutput)
+            llm = self.llm_service.with_structured_output(DataOutput, cache_namespace="keyboard")
             response = await llm.ainvoke(messages)
 
             if response.not_related:
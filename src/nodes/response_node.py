@@ -0,0 +1,25 @@
+from langchain_core.messages import AIMessage, ToolMessage
+from .base_node import BaseNode
+from src.core.state import AssistantState
+from src.utils.response import current_turn, response_stats
+
+
+class ResponseNode(BaseNode):
+    """Finishes a turn without an LLM call when the result text is already user-ready."""
+
+    def __init__(self):
+        super().__init__()
+
+    async def execute(self, state) -> AssistantState:
+        turn = current_turn(state["messages"])
+        response_stats.record(templated=True)
+        if turn and isinstance(turn[-1], AIMessage) and not turn[-1].tool_calls:
+            # The node already answered directly; nothing to add.
+            return {}
+        results = [m for m in turn if isinstance(m, ToolMessage)]
+        return {"messages": [AIMessage(content=self.render(results))]}
+
+    @staticmethod
+    def render(results) -> str:
+        lines = [str(r.content).strip() for r in results if str(r.content).strip()]
+        return "\n".join(lines) or "Done."
@@ -0,0 +1,153 @@
+import logging
+from typing import Optional
+from langchain_core.messages import SystemMessage, HumanMessage
+from pydantic import BaseModel, Field
+from .base_node import BaseNode
+from src.config.settings import settings
+from src.core.state import AssistantState
+from src.edges.redirector_edge import RedirectorEdge
+from src.edges.calendar_edge import CalendarRedirectorEdge
+from src.edges.chrome_edge import ChromeRedirectorEdge
+from src.edges.file_manager_edge import FileManagerRedirectorEdge
+from src.services.llm_scheduler import Priority
+from src.utils.prompt import assemble_prompt
+
+logger = logging.getLogger(__name__)
+
+
+class RoutingDecision(BaseModel):
+    route: str = Field(default="", description="Top-level component that handles the request")
+    sub_route: str = Field(default="", description="Node inside the chosen component")
+    next_mode: Optional[str] = Field(default=None, description="Mode after this request: normal, chrome or filemanager")
+    start_date: Optional[str] = Field(default=None, description="Calendar range start, YYYY-MM-DDTHH:MM:SS")
+    end_date: Optional[str] = Field(default=None, description="Calendar range end, YYYY-MM-DDTHH:MM:SS")
+    tab_index: Optional[int] = Field(default=None, description="0-based tab index the user refers to")
+    path: Optional[str] = Field(default=None, description="File or folder path the user refers to")
+
+
+# Top-level routes whose sub-graphs would otherwise make a second routing call.
+SUB_ROUTES = {
+    "calendar_node": CalendarRedirectorEdge.VALID_NODES,
+    "chrome_node": ChromeRedirectorEdge.VALID_NODES,
+    "filemanager_node": FileManagerRedirectorEdge.VALID_NODES,
+}
+
+MODE_ROUTES = {"chrome": "chrome_node", "filemanager": "filemanager_node"}
+
+
+class RoutingNode(BaseNode):
+    """Resolves route, sub-route and slots with one structured call.
+
+    Without it a calendar, chrome or file-manager turn pays for two routing
+    calls (e.g. date parsing then CalendarRedirectorEdge, or the mode check then
+    ChromeRedirectorEdge). The decision is stored in ``state["routing"]``; the
+    edges and nodes downstream use it and fall back to their own call when a
+    field is missing or invalid.
+    """
+
+    def __init__(self, redirector: RedirectorEdge = None):
+        super().__init__()
+        self.redirector = redirector or RedirectorEdge()
+
+    async def execute(self, state) -> AssistantState:
+        mode = settings.mode
+        if mode == "keyboard":
+            return {"routing": {}}
+
+        user_query = self._extract_latest_user_query(state["messages"])
+        route = MODE_ROUTES.get(mode)
+        source = "combined"
+        if route is None:
+            route, source = self.redirector.local_route(user_query)
+            if route and route not in SUB_ROUTES:
+                return {"routing": {"route": route, "source": source}}
+
+        messages = [
+            SystemMessage(content=self.get_system_message(route)),
+            HumanMessage(content=self._format_human_message(state["messages"], user_query, mode)),
+        ]
+        try:
+            llm = self.llm_service.with_structured_output(
+                RoutingDecision, use_pro=True, priority=Priority.ROUTING, cache_namespace="routing"
+            )
+            decision = await llm.ainvoke(messages)
+        except Exception as e:
+            logger.warning(f"Combined router error: {e}, falling back to per-hop routing")
+            return {"routing": {"route": route, "source": source} if route else {}}
+
+        routing = self._validate(decision, route)
+        if route:
+            routing["source"] = source
+        logger.debug(f"Router decision (combined): {routing}")
+        return {"routing": routing}
+
+    @staticmethod
+    def _validate(decision: RoutingDecision, forced_route: str = None) -> dict:
+        route = forced_route or decision.route.strip().lower()
+        if route not in RedirectorEdge.VALID_NODES:
+            return {}
+        routing = {"route": route}
+        sub_route = decision.sub_route.strip().lower()
+        if sub_route in SUB_ROUTES.get(route, ()):
+            routing["sub_route"] = sub_route
+        if route in ("chrome_node", "filemanager_node"):
+            mode = route.removesuffix("_node")
+            if decision.next_mode in (mode, "normal"):
+                routing["next_mode"] = decision.next_mode
+        for slot in ("start_date", "end_date", "tab_index", "path"):
+            value = getattr(decision, slot)
+            if value not in (None, ""):
+                routing[slot] = value
+        return routing
+
+    def get_system_message(self, route: str = None) -> str:
+        if route:
+            top = f"The top-level route is already decided: route = {route}."
+        else:
+            top = """Choose route (top-level component):
+- network_search: internet searches, news, weather, Wikipedia
+- calendar_node: calendar events, meetings, scheduling, reminders
+- chrome_node: web browser control, websites, entering chrome mode
+- filemanager_node: files, folders, file manager mode
+- system_node: brightness, volume, wifi, bluetooth, CPU/RAM/GPU performance
+- software_node: launch or check applications, security scans
+- keyboard_node: enable or use keyboard mode
+- youtube_node: YouTube videos, playing songs
+- chatbot: general conversation answerable without tools"""
+        return assemble_prompt(f"""You are the request router for a Windows voice assistant. Decide every routing step for the latest user message in a single answer.
+
+{top}
+
+Then fill the fields for the chosen route; leave the others empty.
+
+calendar_node:
+- sub_route: calendar_create (add a new event), calendar_update (change or reschedule an existing event), calendar_delete (cancel or remove an event), calendar_final (viewing, checking or anything else)
+- start_date / end_date: date range to load events for. "today" = today 00:00:00 to 23:59:59, "this week" = Monday to Sunday, "this month" = first to last day; no date = today. For update or delete, keep the broader range from earlier in the conversation so the event is found.
+
+chrome_node:
+- next_mode: "normal" only when the user clearly wants to exit chrome mode or is done; otherwise "chrome" ("close the chrome window" stays "chrome").
+- sub_route: chrome_close_node (close the Chrome window), chrome_tab_node (open, close or switch tabs, open a page in a new tab), chrome_func_node (scroll, click, fill forms, open a page in the current tab), chatbot (chrome mode exited)
+- tab_index: 0-based tab the user refers to ("first tab" = 0, "tab 2" = 1), if any
+
+filemanager_node:
+- next_mode: "normal" only when the user clearly wants to exit file manager mode; otherwise "filemanager".
+- sub_route: filemanager_close_node (close the window), filemanager_tab_node (open, close or switch tabs, open a folder in a new tab), filemanager_read_node (browse, open, scroll or read without changing anything), filemanager_write_node (create, delete, copy, cut, paste), chatbot (file manager mode exited)
+- tab_index: 0-based tab the user refers to, if any
+- path: file or folder path or name the user refers to, if any
+
+Other routes: sub_route empty.
+Dates are ISO strings without timezone.""", {"Current time": self._get_current_time()})
+
+    def _extract_latest_user_query(self, messages):
+        for i in range(len(messages) - 1, -1, -1):
+            if isinstance(messages[i], HumanMessage):
+                return messages[i].content
+        return ""
+
+    def _format_human_message(self, messages, user_query, mode):
+        return f"""CONVERSATION CONTEXT:
+{self.formatter_without_tools(messages)}
+
+CURRENT MODE: {mode}
+USER REQUEST: "{user_query}"
+"""
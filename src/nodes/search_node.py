@@ -4,6 +4,7 @@ from .base_node import BaseNode
 from src.config.settings import settings
 from src.core.state import AssistantState
 from src.tools.search_tools import search_tools
+from src.utils.prompt import assemble_prompt
 
 class SearchNode(BaseNode):
     def __init__(self):
@@ -22,8 +23,7 @@ class SearchNode(BaseNode):
         return {"messages": [response]}
 
     def get_system_message(self) -> str:
-        return f"""You are {settings.assistant_name}, a Windows AI assistant with internet search capabilities.
-Current time: {self._get_current_time()}
+        return assemble_prompt(f"""You are {settings.assistant_name}, a Windows AI assistant with internet search capabilities.
 
 ROLE: Information Retrieval Specialist
 GOAL: Find accurate, current information using appropriate search tools
@@ -54,7 +54,7 @@ RESPONSE GUIDELINES:
 - If information conflicts, mention different perspectives
 - For weather: Include current conditions and forecasts
 
-Execute searches immediately when information is requested."""
+Execute searches immediately when information is requested.""", {"Current time": self._get_current_time()})
     def _extract_latest_user_query(self, messages):
         from langchain_core.messages import HumanMessage
         for i in range(len(messages) - 1, -1, -1):
@@ -4,6 +4,7 @@ from .base_node import BaseNode
 from src.config.settings import settings
 from src.core.state import AssistantState
 from src.tools.softwares_tool import software_tools
+from src.utils.prompt import assemble_prompt
 
 
 class SoftwareNode(BaseNode):
@@ -23,8 +24,7 @@ class SoftwareNode(BaseNode):
         return {"messages": [response]}
 
     def get_system_message(self) -> str:
-        return f"""You are {settings.assistant_name}, a Windows AI assistant specializing in software management.
-Current time: {self._get_current_time()}
+        return assemble_prompt(f"""You are {settings.assistant_name}, a Windows AI assistant specializing in software management.
 
 ROLE: Software Management Specialist
 GOAL: Execute software-related tasks using appropriate tools
@@ -56,7 +56,7 @@ RESPONSE FORMAT:
 - Failure: "[Issue]: [Reason]"
 - Security: Detailed threat analysis with recommendations
 
-Execute tool calls immediately upon request identification."""
+Execute tool calls immediately upon request identification.""", {"Current time": self._get_current_time()})
 
     def _extract_latest_user_query(self, messages):
         from langchain_core.messages import HumanMessage
@@ -4,6 +4,7 @@ from .base_node import BaseNode
 from src.config.settings import settings
 from src.core.state import AssistantState
 from src.tools.system_tools import system_tools
+from src.utils.prompt import assemble_prompt
 
 class SystemNode(BaseNode):
     def __init__(self):
@@ -32,9 +33,8 @@ class SystemNode(BaseNode):
         return {"messages": [response]}
 
     def get_system_message(self) -> str:
-        return f"""
+        return assemble_prompt(f"""
         You are {settings.assistant_name}, an AI voice assistant for Windows.
-        Current time: {self._get_current_time()}
     
         === SYSTEM CONTROL NODE ===
         You MUST use the appropriate tool function calls to control the system. 
@@ -105,7 +105,7 @@ class SystemNode(BaseNode):
           and highlight the relevant component metrics in the returned output.
         
         EXECUTE FUNCTION CALLS IMMEDIATELY UPON REQUEST.
-        """
+        """, {"Current time": self._get_current_time()})
 
     def _extract_latest_user_query(self, messages):
         from langchain_core.messages import HumanMessage
@@ -2,7 +2,6 @@ from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 from src.nodes.base_node import BaseNode
 from src.config.settings import settings
 from src.core.state import AssistantState
-from src.tools.browser_tools import browser_tools
 from langchain_community.tools import YouTubeSearchTool
 from pydantic import BaseModel, Field
 import webbrowser
@@ -33,7 +32,7 @@ class YoutubeNode(BaseNode):
         human_msg = self._format_human_message(state["messages"], user_query)
 
         messages = [SystemMessage(content=system_msg), HumanMessage(content=human_msg)]
-        llm = self.llm_service.llm.with_structured_output(DataOutput)
+        llm = self.llm_service.with_structured_output(DataOutput, cache_namespace="youtube")
         response = await llm.ainvoke(messages)
         if response.not_related:
             return {"messages": [AIMessage(content=response.reasoning)]}
@@ -0,0 +1,259 @@
+import json
+import logging
+import os
+import subprocess
+import threading
+import time
+from typing import Callable, Dict, List, Tuple
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+INDEX_VERSION = 1
+
+SYSTEM_APPS = {
+    'Calculator': 'calc.exe',
+    'Notepad': 'notepad.exe',
+    'Paint': 'mspaint.exe',
+    'Command Prompt': 'cmd.exe',
+    'PowerShell': 'powershell.exe',
+    'Registry Editor': 'regedit.exe',
+    'Task Manager': 'taskmgr.exe',
+    'Control Panel': 'control.exe',
+    'File Explorer': 'explorer.exe',
+    'System Information': 'msinfo32.exe',
+    'Character Map': 'charmap.exe',
+    'Disk Cleanup': 'cleanmgr.exe',
+    'Device Manager': 'devmgmt.msc',
+    'Disk Management': 'diskmgmt.msc',
+    'Event Viewer': 'eventvwr.msc',
+    'Services': 'services.msc',
+    'Computer Management': 'compmgmt.msc',
+    'System Configuration': 'msconfig.exe',
+    'Resource Monitor': 'resmon.exe',
+    'Performance Monitor': 'perfmon.exe',
+    'Windows Memory Diagnostic': 'mdsched.exe',
+    'Windows Settings': 'ms-settings:',
+    'Microsoft Store': 'ms-windows-store:',
+    'Windows Security': 'windowsdefender:',
+    'Magnifier': 'magnify.exe',
+    'On-Screen Keyboard': 'osk.exe',
+    'Narrator': 'narrator.exe',
+    'Sound Recorder': 'soundrecorder.exe',
+    'Steps Recorder': 'psr.exe',
+    'Snipping Tool': 'snippingtool.exe',
+    'Windows Media Player': 'wmplayer.exe',
+}
+
+COMMON_STORE_APPS = {
+    'Microsoft Edge': 'msedge.exe',
+    'Photos': 'ms-photos:',
+    'Camera': 'microsoft.windowscamera:',
+    'Movies & TV': 'mswindowsvideo:',
+    'Groove Music': 'mswindowsmusic:',
+    'Mail': 'outlookmail:',
+    'Calendar': 'outlookcal:',
+    'Maps': 'bingmaps:',
+    'Weather': 'msnweather:',
+    'News': 'bingnews:',
+    'Microsoft Teams': 'msteams:',
+    'Xbox': 'ms-xbl-3d8b930f:',
+    'Microsoft To Do': 'ms-todo:',
+    'Sticky Notes': 'ms-stickynotes:',
+    'Voice Recorder': 'ms-callrecording:',
+    'Clock': 'ms-clock:',
+    'LinkedIn': 'LinkedIn',
+}
+
+
+def start_menu_roots() -> List[str]:
+    return [
+        os.path.expandvars(r"%ProgramData%\Microsoft\Windows\Start Menu\Programs"),
+        os.path.expandvars(r"%AppData%\Microsoft\Windows\Start Menu\Programs"),
+    ]
+
+
+class FileSystemBackend:
+    """Directory access used by the index; swap it out to scan a fake tree."""
+
+    def exists(self, path: str) -> bool:
+        return os.path.isdir(path)
+
+    def mtime(self, path: str) -> float:
+        return os.stat(path).st_mtime
+
+    def listdir(self, path: str) -> Tuple[List[str], List[str]]:
+        """Return (subdirectory paths, file names) directly under ``path``."""
+        dirs, files = [], []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    dirs.append(entry.path)
+                elif entry.is_file():
+                    files.append(entry.name)
+        return dirs, files
+
+
+def powershell_store_apps() -> Dict[str, str]:
+    """Microsoft Store apps from ``Get-StartApps`` (name -> AppID)."""
+    cmd = [
+        'powershell', '-Command',
+        'Get-StartApps | Where-Object {$_.AppID -like "*!*"} | Select-Object Name, AppID | ConvertTo-Json'
+    ]
+    apps = {}
+    try:
+        result = subprocess.run(cmd, capture_output=True, text=True, timeout=15, shell=True)
+        if result.returncode == 0 and result.stdout.strip():
+            store_apps = json.loads(result.stdout)
+            if isinstance(store_apps, dict):
+                store_apps = [store_apps]
+            for app_data in store_apps:
+                if isinstance(app_data, dict) and app_data.get('Name') and app_data.get('AppID'):
+                    apps[app_data['Name']] = app_data['AppID']
+    except Exception as e:
+        logger.warning(f"Store app scan failed: {e}")
+    return apps
+
+
+class AppIndex:
+    """On-disk index of launchable applications.
+
+    Start Menu shortcuts are stored per directory together with the directory's
+    mtime. Adding or removing an entry changes the mtime of its parent only, so
+    a refresh stats every indexed directory but lists just the ones that
+    changed. Store apps come from a slow PowerShell call and are refreshed in
+    the background; until then the last known list is used.
+    """
+
+    def __init__(
+        self,
+        path: str = None,
+        roots: List[str] = None,
+        backend: FileSystemBackend = None,
+        store_provider: Callable[[], Dict[str, str]] = None,
+    ):
+        self.path = path or settings.app_index_path
+        self.roots = roots
+        self.backend = backend or FileSystemBackend()
+        self.store_provider = store_provider or powershell_store_apps
+        self._lock = threading.Lock()
+        self._loaded = False
+        self.dirs: Dict[str, dict] = {}
+        self.store: Dict[str, str] = {}
+        self.store_refreshed = 0.0
+        self.last_scan = {"listed": 0, "reused": 0, "seconds": 0.0}
+
+    def _load(self):
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.dirs = data.get("dirs", {})
+        self.store = data.get("store", {})
+        self.store_refreshed = data.get("store_refreshed", 0.0)
+
+    def save(self):
+        with self._lock:
+            data = {
+                "version": INDEX_VERSION,
+                "dirs": self.dirs,
+                "store": self.store,
+                "store_refreshed": self.store_refreshed,
+            }
+        tmp = f"{self.path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write app index: {e}")
+
+    def _scan(self, path: str, old: dict, new: dict, counts: dict):
+        try:
+            mtime = self.backend.mtime(path)
+        except OSError:
+            return
+        entry = old.get(path)
+        if entry is None or entry["mtime"] != mtime:
+            try:
+                subdirs, files = self.backend.listdir(path)
+            except OSError:
+                return
+            apps = {
+                os.path.splitext(name)[0]: os.path.join(path, name)
+                for name in files
+                if name.endswith(".lnk")
+            }
+            entry = {"mtime": mtime, "subdirs": sorted(subdirs), "apps": apps}
+            counts["listed"] += 1
+        else:
+            counts["reused"] += 1
+        new[path] = entry
+        # A change deep in the tree leaves the ancestors' mtimes alone, so unchanged
+        # directories are still descended into (a stat each, no listing).
+        for subdir in entry["subdirs"]:
+            self._scan(subdir, old, new, counts)
+
+    def refresh(self) -> Dict[str, str]:
+        """Bring the shortcut part of the index up to date and return all apps."""
+        start = time.perf_counter()
+        self._load()
+        counts = {"listed": 0, "reused": 0}
+        new = {}
+        for root in self.roots or start_menu_roots():
+            if self.backend.exists(root):
+                self._scan(root, self.dirs, new, counts)
+        changed = counts["listed"] > 0 or new.keys() != self.dirs.keys()
+        with self._lock:
+            self.dirs = new
+        if changed:
+            self.save()
+        self.last_scan = {**counts, "seconds": round(time.perf_counter() - start, 4)}
+        logger.info(f"App index: {self.last_scan}")
+        return self.apps()
+
+    def apps(self) -> Dict[str, str]:
+        """Shortcuts first, then built-in system apps, store apps and well-known protocols."""
+        with self._lock:
+            apps = {}
+            for entry in self.dirs.values():
+                apps.update(entry["apps"])
+            for source in (SYSTEM_APPS, self.store, COMMON_STORE_APPS):
+                for name, target in source.items():
+                    apps.setdefault(name, target)
+        return apps
+
+    def refresh_store(self, on_update: Callable[[Dict[str, str]], None] = None) -> threading.Thread:
+        """Re-read store apps in a daemon thread and call ``on_update`` with the merged apps if they changed."""
+
+        def run():
+            store = self.store_provider()
+            if not store or store == self.store:
+                return
+            with self._lock:
+                self.store = store
+                self.store_refreshed = time.time()
+            self.save()
+            if on_update is not None:
+                on_update(self.apps())
+
+        thread = threading.Thread(target=run, name="app-index-store", daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self) -> dict:
+        return {
+            "directories": len(self.dirs),
+            "shortcuts": sum(len(entry["apps"]) for entry in self.dirs.values()),
+            "store_apps": len(self.store),
+            "last_scan": self.last_scan,
+        }
+
+
+app_index = AppIndex()
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import aiohttp
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class HttpService:
+    """One long-lived aiohttp session for every outgoing API call.
+
+    Creating a ClientSession per request throws away the connection pool, so
+    each call pays for DNS, TCP and TLS again. The shared session keeps
+    connections alive and caches DNS. aiohttp sessions belong to the event loop
+    they were created on; a call from another loop (e.g. a fresh
+    ``asyncio.run`` in a benchmark) gets its own session.
+    """
+
+    def __init__(self):
+        self._session = None
+        self._loop = None
+        self.requests = 0
+
+    def _new_session(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(
+            limit=settings.http_pool_size,
+            limit_per_host=settings.http_pool_per_host,
+            ttl_dns_cache=settings.http_dns_ttl,
+            keepalive_timeout=settings.http_keepalive,
+        )
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=settings.http_timeout),
+        )
+
+    def _retire(self):
+        """Let go of a session that belongs to another event loop.
+
+        A loop still running (in another thread) closes it itself; a stopped or
+        closed loop cannot run the close any more, so the session is detached
+        and its sockets are left to the garbage collector.
+        """
+        old, loop = self._session, self._loop
+        if old is None or old.closed:
+            return
+        if loop is not None and loop.is_running() and not loop.is_closed():
+            asyncio.run_coroutine_threadsafe(old.close(), loop)
+        else:
+            logger.debug("Detaching an HTTP session left open on a finished event loop")
+            old.detach()
+
+    def session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._retire()
+            self._session = self._new_session()
+            self._loop = loop
+        return self._session
+
+    async def get_json(self, url: str, params: dict = None, headers: dict = None):
+        self.requests += 1
+        async with self.session().get(url, params=params, headers=headers) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    async def post_json(self, url: str, payload: dict = None, headers: dict = None):
+        self.requests += 1
+        async with self.session().post(url, json=payload, headers=headers) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    async def get_text(self, url: str, headers: dict = None, timeout: float = None, max_bytes: int = None):
+        """GET without raising on HTTP errors; returns (status, headers, text) with the body cut at max_bytes."""
+        self.requests += 1
+        options = {"timeout": aiohttp.ClientTimeout(total=timeout)} if timeout else {}
+        async with self.session().get(url, headers=headers, **options) as response:
+            chunks, size = [], 0
+            async for chunk in response.content.iter_chunked(64 * 1024):
+                chunks.append(chunk)
+                size += len(chunk)
+                if max_bytes and size >= max_bytes:
+                    break
+            body = b"".join(chunks)[:max_bytes]
+            return response.status, response.headers, body.decode(response.charset or "utf-8", errors="replace")
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._loop = None
+
+    def stats(self) -> dict:
+        connector = self._session.connector if self._session is not None else None
+        return {
+            "requests": self.requests,
+            "open_session": self._session is not None and not self._session.closed,
+            "pool_limit": connector.limit if connector is not None else settings.http_pool_size,
+        }
+
+
+http_service = HttpService()
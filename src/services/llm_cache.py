@@ -0,0 +1,140 @@
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+import time
+from langchain_core.messages import message_to_dict, messages_from_dict, BaseMessage
+from pydantic import BaseModel
+from src.config.settings import settings
+
+# Full timestamps with sub-second precision make every prompt unique; such prompts are never cached.
+VOLATILE_TIME = re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}\.\d+")
+
+
+class LLMResponseCache:
+    """SQLite-backed LLM response cache with per-namespace TTL and size-bounded LRU eviction."""
+
+    def __init__(self, path: str = None, max_entries: int = None):
+        self.path = path or settings.llm_cache_path
+        self.max_entries = max_entries or settings.llm_cache_max_entries
+        self.enabled = settings.llm_cache_enabled
+        self._lock = threading.Lock()
+        self._conn = None
+        self.hits = 0
+        self.misses = 0
+        self.skipped_volatile = 0
+        self.evictions = 0
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    namespace TEXT,
+                    kind TEXT,
+                    value TEXT,
+                    expires REAL,
+                    last_access REAL
+                )"""
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_access ON llm_cache(last_access)")
+        return self._conn
+
+    @staticmethod
+    def _canonical_messages(messages):
+        if isinstance(messages, str):
+            return [{"type": "human", "content": messages}]
+        return [{"type": m.type, "content": m.content} for m in messages]
+
+    def make_key(self, model: str, temperature, messages, extra=None) -> str | None:
+        """Canonical hash of model, temperature and messages; None if the prompt is volatile."""
+        canonical = self._canonical_messages(messages)
+        if any(VOLATILE_TIME.search(str(m["content"])) for m in canonical):
+            self.skipped_volatile += 1
+            return None
+        payload = json.dumps(
+            {"model": model, "temperature": temperature, "messages": canonical, "extra": extra},
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, schema=None):
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT kind, value, expires FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None or row[2] < now:
+                if row is not None:
+                    conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                    conn.commit()
+                self.misses += 1
+                return None
+            conn.execute("UPDATE llm_cache SET last_access = ? WHERE key = ?", (now, key))
+            conn.commit()
+        kind, value, _ = row
+        try:
+            if kind == "message":
+                result = messages_from_dict([json.loads(value)])[0]
+                # A reused id would make add_messages replace the earlier message in state.
+                result.id = None
+            elif kind == "model" and schema is not None:
+                result = schema.model_validate_json(value)
+            else:
+                result = json.loads(value)
+        except Exception:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return result
+
+    def set(self, key: str, namespace: str, value, ttl: float):
+        if isinstance(value, BaseMessage):
+            kind, data = "message", json.dumps(message_to_dict(value))
+        elif isinstance(value, BaseModel):
+            kind, data = "model", value.model_dump_json()
+        else:
+            kind, data = "json", json.dumps(value, default=str)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key, namespace, kind, data, now + ttl, now),
+            )
+            count = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+            if count > self.max_entries:
+                excess = count - self.max_entries
+                conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN (SELECT key FROM llm_cache ORDER BY last_access LIMIT ?)",
+                    (excess,),
+                )
+                self.evictions += excess
+            conn.commit()
+
+    def clear(self, namespace: str = None):
+        with self._lock:
+            conn = self._connection()
+            if namespace:
+                conn.execute("DELETE FROM llm_cache WHERE namespace = ?", (namespace,))
+            else:
+                conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "skipped_volatile": self.skipped_volatile,
+            "evictions": self.evictions,
+        }
+
+
+llm_cache = LLMResponseCache()
@@ -0,0 +1,82 @@
+import threading
+from typing import Optional
+from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_ollama import ChatOllama
+from src.config.settings import settings
+
+
+class LLMClientRegistry:
+    """Process-wide pool of chat model clients keyed by (provider, model, temperature).
+
+    Every node and edge used to build its own pair of clients, each with its own
+    HTTP connection pool. Clients are now created once and shared, so keep-alive
+    connections are reused across nodes and turns.
+    """
+
+    def __init__(self):
+        self._clients = {}
+        self._lock = threading.Lock()
+        self.lookups = 0
+        self.created = 0
+
+    def get(self, provider: str, model: str, temperature: float):
+        key = (provider, model, temperature)
+        with self._lock:
+            self.lookups += 1
+            client = self._clients.get(key)
+            if client is None:
+                client = self._create(provider, model, temperature)
+                self._clients[key] = client
+                self.created += 1
+            return client
+
+    def _create(self, provider: str, model: str, temperature: float):
+        if provider == "google":
+            return ChatGoogleGenerativeAI(
+                model=model,
+                temperature=temperature,
+                google_api_key=settings.on_llm_key,
+            )
+        return ChatOllama(
+            model=model,
+            temperature=temperature,
+            keep_alive=settings.ollama_keep_alive,
+        )
+
+    @staticmethod
+    def _pool_connections(http_client) -> Optional[int]:
+        """Open connections in an httpx client's pool, or None if the pool is not reachable."""
+        pool = getattr(getattr(http_client, "_transport", None), "_pool", None)
+        connections = getattr(pool, "connections", None)
+        return None if connections is None else len(connections)
+
+    def _live_connections(self, client) -> Optional[int]:
+        """Open connections of an Ollama client's httpx pools.
+
+        None means unknown: Gemini talks gRPC and exposes no pool, and other
+        ollama/httpx versions may not have the attributes probed here.
+        """
+        if not isinstance(client, ChatOllama):
+            return None
+        counts = []
+        for attr in ("_client", "_async_client"):
+            wrapper = getattr(client, attr, None)
+            http_client = getattr(wrapper, "_client", None)
+            if http_client is not None:
+                counts.append(self._pool_connections(http_client))
+        counts = [count for count in counts if count is not None]
+        return sum(counts) if counts else None
+
+    def stats(self) -> dict:
+        with self._lock:
+            clients = list(self._clients.items())
+            return {
+                "clients": len(clients),
+                "lookups": self.lookups,
+                "reused": self.lookups - self.created,
+                # Per client; None where the provider does not expose its connections.
+                "connections": {f"{p}:{m}@{t}": self._live_connections(c) for (p, m, t), c in clients},
+            }
+
+
+llm_registry = LLMClientRegistry()
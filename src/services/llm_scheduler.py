@@ -0,0 +1,118 @@
+import asyncio
+import heapq
+import itertools
+import time
+from collections import defaultdict
+from enum import IntEnum
+from src.config.settings import settings
+
+
+class Priority(IntEnum):
+    """Scheduling classes; lower values are served first."""
+
+    ROUTING = 0
+    TOOL_SELECTION = 1
+    GENERATION = 2
+
+
+class PriorityLimiter:
+    """Concurrency limit whose waiters are released in priority order."""
+
+    def __init__(self, limit: int):
+        self.limit = max(1, limit)
+        self.active = 0
+        self._waiters = []
+        self._seq = itertools.count()
+
+    @property
+    def queued(self) -> int:
+        return sum(1 for _, _, fut in self._waiters if not fut.done())
+
+    async def acquire(self, priority: int):
+        if self.active < self.limit and not self.queued:
+            self.active += 1
+            return
+        fut = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._seq), fut))
+        try:
+            await fut
+        except asyncio.CancelledError:
+            # The slot may have been handed over just before the cancellation landed.
+            if fut.done() and not fut.cancelled():
+                self.release()
+            raise
+
+    def release(self):
+        while self._waiters:
+            _, _, fut = heapq.heappop(self._waiters)
+            if not fut.done():
+                # Hand the slot straight to the next waiter; active count is unchanged.
+                fut.set_result(None)
+                return
+        self.active -= 1
+
+
+class LLMScheduler:
+    """Bounded, prioritised execution of LLM calls with per-model limits and timeouts."""
+
+    def __init__(self, default_limit: int = None, timeout: float = None):
+        self.default_limit = default_limit or settings.llm_concurrency
+        self.timeout = timeout or settings.llm_timeout
+        self._limiters = {}
+        self.metrics = defaultdict(
+            lambda: {
+                "calls": 0,
+                "timeouts": 0,
+                "errors": 0,
+                "queue_wait": 0.0,
+                "max_queue_wait": 0.0,
+                "run_time": 0.0,
+            }
+        )
+
+    def _limiter(self, model: str) -> PriorityLimiter:
+        limiter = self._limiters.get(model)
+        if limiter is None:
+            limit = settings.llm_model_concurrency.get(model, self.default_limit)
+            limiter = self._limiters[model] = PriorityLimiter(limit)
+        return limiter
+
+    async def run(self, model: str, call, priority: Priority = Priority.GENERATION, timeout: float = None):
+        """Run ``call()`` (a coroutine factory) once a slot for ``model`` is free."""
+        limiter = self._limiter(model)
+        stats = self.metrics[model]
+        queued_at = time.perf_counter()
+        await limiter.acquire(priority)
+        started = time.perf_counter()
+        wait = started - queued_at
+        stats["calls"] += 1
+        stats["queue_wait"] += wait
+        stats["max_queue_wait"] = max(stats["max_queue_wait"], wait)
+        try:
+            return await asyncio.wait_for(call(), timeout or self.timeout)
+        except asyncio.TimeoutError:
+            stats["timeouts"] += 1
+            raise
+        except Exception:
+            stats["errors"] += 1
+            raise
+        finally:
+            stats["run_time"] += time.perf_counter() - started
+            limiter.release()
+
+    def stats(self) -> dict:
+        report = {}
+        for model, stats in self.metrics.items():
+            limiter = self._limiters.get(model)
+            calls = stats["calls"] or 1
+            report[model] = {
+                **stats,
+                "avg_queue_wait": stats["queue_wait"] / calls,
+                "avg_run_time": stats["run_time"] / calls,
+                "active": limiter.active if limiter else 0,
+                "queued": limiter.queued if limiter else 0,
+            }
+        return report
+
+
+llm_scheduler = LLMScheduler()
@@ -1,44 +1,144 @@
 import asyncio
-from langchain_google_genai import ChatGoogleGenerativeAI
+import copy
+from langchain_core.messages import BaseMessage
 from src.config.settings import settings
+from src.services.llm_registry import llm_registry
+from src.services.llm_scheduler import llm_scheduler, Priority
+from src.services.llm_cache import llm_cache
+from src.services.single_flight import single_flight
+from src.utils.prompt import prompt_cache_stats
 import logging
 
-from langchain_ollama import ChatOllama
 logger = logging.getLogger(__name__)
 
+
+class ScheduledRunnable:
+    """Wraps a bound/structured runnable so its calls go through the scheduler.
+
+    Only ``ainvoke`` is offered: a synchronous call could not wait for a
+    scheduler slot and would bypass the concurrency limits.
+    """
+
+    def __init__(self, service, runnable, model, priority, cache_namespace=None, schema=None, cache_extra=None):
+        self.service = service
+        self.runnable = runnable
+        self.model = model
+        self.priority = priority
+        self.cache_namespace = cache_namespace
+        self.schema = schema
+        self.cache_extra = cache_extra
+
+    async def ainvoke(self, messages, timeout=None, **kwargs):
+        return await self.service._run(
+            self.runnable,
+            messages,
+            self.model,
+            self.priority,
+            timeout,
+            cache_namespace=self.cache_namespace,
+            schema=self.schema,
+            cache_extra=self.cache_extra,
+            **kwargs,
+        )
+
+
 class LLMService:
-    def __init__(self):
-        self.llm = ChatGoogleGenerativeAI(
-            model=settings.on_llm_model,
-            temperature=settings.temperature,
-            google_api_key=settings.on_llm_key,
-        ) if settings.isOnline else ChatOllama(
-            model=settings.llm_model,
-            temperature=settings.temperature
-        ) 
-        self.llm_pro = ChatGoogleGenerativeAI(
-            model=settings.on_llm_model_pro,
-            temperature=settings.temperature,
-            google_api_key=settings.on_llm_key,
-        ) if settings.isOnline else ChatOllama(
-            model=settings.llm_model_pro, 
-            temperature=settings.temperature
+    def __init__(self, registry=None, scheduler=None, cache=None):
+        registry = registry or llm_registry
+        self.scheduler = scheduler or llm_scheduler
+        self.cache = cache or llm_cache
+        provider = "google" if settings.isOnline else "ollama"
+        self.model = settings.on_llm_model if settings.isOnline else settings.llm_model
+        self.model_pro = settings.on_llm_model_pro if settings.isOnline else settings.llm_model_pro
+        self.llm = registry.get(provider, self.model, settings.temperature)
+        self.llm_pro = registry.get(provider, self.model_pro, settings.temperature)
+
+    def _select(self, use_pro):
+        return (self.llm_pro, self.model_pro) if use_pro else (self.llm, self.model)
+
+    def _request_key(self, model, messages, namespace, extra, kwargs):
+        """Key for the response cache and for coalescing concurrent calls; None if the call is neither."""
+        if not namespace or namespace not in settings.llm_cache_ttl:
+            return None
+        return self.cache.make_key(
+            model, settings.temperature, messages, extra={"extra": extra, "kwargs": kwargs}
         )
-    
-    async def ainvoke(self, messages, use_pro=False):
-        """Async invoke LLM."""
-        llm = self.llm_pro if use_pro else self.llm
+
+    @staticmethod
+    def _share(result):
+        result = copy.deepcopy(result)
+        if isinstance(result, BaseMessage):
+            # Same reason as in the response cache: a reused id would replace a message in state.
+            result.id = None
+        return result
+
+    async def _run(self, runnable, messages, model, priority, timeout=None, cache_namespace=None, schema=None, cache_extra=None, **kwargs):
+        key = self._request_key(model, messages, cache_namespace, cache_extra, kwargs)
+        if key and self.cache.enabled:
+            cached = self.cache.get(key, schema)
+            if cached is not None:
+                return cached
+        call = lambda: self._call(runnable, messages, model, priority, timeout, key, cache_namespace, **kwargs)
+        if key:
+            # Identical requests in flight from other sessions or tool calls wait on this one.
+            return await single_flight.do(f"llm:{cache_namespace}", key, call, share=self._share)
+        return await call()
+
+    async def _call(self, runnable, messages, model, priority, timeout, cache_key, cache_namespace, **kwargs):
         try:
-            response = await asyncio.to_thread(llm.invoke, messages)
-            return response
+            result = await self.scheduler.run(
+                str(model),
+                lambda: runnable.ainvoke(messages, **kwargs),
+                priority=priority,
+                timeout=timeout,
+            )
+            prompt_cache_stats.record(str(model), messages, result)
+            if cache_key and self.cache.enabled and result is not None:
+                self.cache.set(cache_key, cache_namespace, result, settings.llm_cache_ttl[cache_namespace])
+            return result
+        except asyncio.TimeoutError:
+            logger.error(f"LLM call to {model} timed out")
+            raise
         except Exception as e:
             logger.error(f"LLM invocation error: {e}")
             raise
-    
-    async def abind_tools(self, tools, use_pro=False):
+
+    async def ainvoke(self, messages, use_pro=False, priority=Priority.GENERATION, timeout=None, cache_namespace=None):
+        """Async invoke LLM through the provider's native async API."""
+        llm, model = self._select(use_pro)
+        return await self._run(llm, messages, model, priority, timeout, cache_namespace=cache_namespace)
+
+    def with_structured_output(self, schema, use_pro=False, priority=Priority.GENERATION, cache_namespace=None):
+        """Structured-output runnable whose ainvoke is scheduled (and cached when a namespace is given)."""
+        llm, model = self._select(use_pro)
+        return ScheduledRunnable(
+            self,
+            llm.with_structured_output(schema),
+            model,
+            priority,
+            cache_namespace=cache_namespace,
+            schema=schema,
+            cache_extra={"schema": schema.__name__, "fields": sorted(schema.model_fields)},
+        )
+
+    def bind_tools(self, tools, use_pro=False, priority=Priority.TOOL_SELECTION, cache_namespace=None):
+        """Tool-bound runnable whose ainvoke is scheduled (and cached when a namespace is given)."""
+        llm, model = self._select(use_pro)
+        return ScheduledRunnable(
+            self,
+            llm.bind_tools(tools=tools),
+            model,
+            priority,
+            cache_namespace=cache_namespace,
+            cache_extra={"tools": [(t.name, t.description) for t in tools]},
+        )
+
+    async def abind_tools(self, tools, use_pro=False, priority=Priority.TOOL_SELECTION, cache_namespace=None):
         """Async bind tools to LLM."""
-        llm = self.llm_pro if use_pro else self.llm
-        return llm.bind_tools(tools=tools)
+        return self.bind_tools(tools, use_pro=use_pro, priority=priority, cache_namespace=cache_namespace)
+
+
+llm_service = LLMService()
 
 # import asyncio
 # from langchain_ollama import ChatOllama
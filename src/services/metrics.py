@@ -0,0 +1,175 @@
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List
+import psutil
+from src.config.settings import settings
+from src.services.telemetry import telemetry
+
+logger = logging.getLogger(__name__)
+
+REPORT_WINDOW = re.compile(r"(\d+(?:\.\d+)?)\s*(sec|second|seconds|s|min|mins|minute|minutes)\b", re.IGNORECASE)
+
+
+@dataclass
+class MetricProvider:
+    name: str
+    pattern: re.Pattern
+    collect: Callable[[float], List[str]]
+    timeout: float
+
+
+class MetricRegistry:
+    """Named metric providers, selected by keywords in the query and collected concurrently.
+
+    A query that names no metric ("how is my system doing") runs every
+    provider. Each provider has its own timeout; one that misses it is
+    reported as timed out without holding back the others.
+    """
+
+    def __init__(self, max_workers: int = 8):
+        self.providers: Dict[str, MetricProvider] = {}
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="metrics")
+
+    def register(self, name: str, keywords: str, timeout: float = None):
+        """Decorator: ``keywords`` is a regex matched case-insensitively against the query."""
+
+        def decorator(fn):
+            self.providers[name] = MetricProvider(
+                name, re.compile(keywords, re.IGNORECASE), fn, timeout or settings.metric_timeout
+            )
+            return fn
+
+        return decorator
+
+    def select(self, query: str) -> List[str]:
+        names = [name for name, provider in self.providers.items() if provider.pattern.search(query or "")]
+        return names or list(self.providers)
+
+    @staticmethod
+    def window(query: str) -> float:
+        """Seconds of history to summarise: "last 5 minutes" in the query, else the configured default."""
+        match = REPORT_WINDOW.search(query or "")
+        if not match:
+            return settings.telemetry_report_seconds
+        amount = float(match.group(1))
+        return amount * 60 if match.group(2).lower().startswith("min") else amount
+
+    def collect(self, names: List[str], seconds: float) -> Dict[str, List[str]]:
+        start = time.monotonic()
+        futures = {name: self._pool.submit(self.providers[name].collect, seconds) for name in names}
+        results = {}
+        for name, future in futures.items():
+            provider = self.providers[name]
+            remaining = max(0.0, start + provider.timeout - time.monotonic())
+            try:
+                results[name] = future.result(timeout=remaining)
+            except TimeoutError:
+                future.cancel()
+                results[name] = [f"{name.upper()}: no reading within {provider.timeout:.1f}s"]
+            except Exception as e:
+                logger.warning(f"Metric provider '{name}' failed: {e}")
+                results[name] = [f"{name.upper()}: Unable to retrieve ({e})"]
+        return results
+
+    def report(self, query: str = "") -> str:
+        names = self.select(query)
+        results = self.collect(names, self.window(query))
+        return "\n".join(line for name in names for line in results[name])
+
+
+metric_registry = MetricRegistry()
+
+
+def _describe(label: str, metric: dict, unit: str, span: float) -> str:
+    if metric is None:
+        return f"{label}: N/A"
+    return (
+        f"{label}: {metric['current']:.1f}{unit} now, avg {metric['avg']:.1f}{unit}, "
+        f"min {metric['min']:.1f}{unit}, max {metric['max']:.1f}{unit} over the last {round(span)}s ({metric['trend']})"
+    )
+
+
+def _sampled_timeout(samples: int) -> float:
+    """Deadline for a provider that waits for ``samples`` telemetry samples.
+
+    A cold sampler takes its first sample one interval after it starts (after
+    priming cpu_percent) and one more per interval after that.
+    """
+    return max(settings.metric_timeout, telemetry.interval * (samples + 1))
+
+
+def _summary(seconds: float, samples: int = 1) -> dict:
+    """Telemetry statistics; gauges need one sample, byte-counter rates need two."""
+    telemetry.start()
+    telemetry.wait_ready(samples)
+    return telemetry.summary(seconds)
+
+
+def _slow() -> dict:
+    return telemetry.slow or telemetry.refresh_slow()
+
+
+@metric_registry.register("cpu", r"\bcpu\b|processor|\bcores?\b|\bload\b", timeout=_sampled_timeout(2))
+def cpu_metrics(seconds: float) -> List[str]:
+    # cpu_percent is itself a rate since the previous call, so one sample is not enough.
+    stats = _summary(seconds, samples=2)
+    return [_describe("CPU Usage", stats.get("cpu"), "%", stats["span"])]
+
+
+@metric_registry.register("temperature", r"\btemp|thermal|\bhot\b|\bheat|\bfans?\b", timeout=3.0)
+def temperature_metrics(seconds: float) -> List[str]:
+    slow = _slow()
+    return [f"CPU Temperature: {slow.get('cpu_temp', 'N/A')}", f"Fan Speed: {slow.get('fan_speed', 'N/A')}"]
+
+
+@metric_registry.register("ram", r"\bram\b|(?<!gpu )(?<!video )(?<!graphics )\bmemory\b", timeout=_sampled_timeout(1))
+def ram_metrics(seconds: float) -> List[str]:
+    mem = psutil.virtual_memory()
+    stats = _summary(seconds)
+    return [
+        f"RAM Usage: {mem.percent}% ({round(mem.used/(1024**3), 2)}GB / {round(mem.total/(1024**3), 2)}GB)",
+        _describe("RAM Trend", stats.get("ram"), "%", stats["span"]),
+    ]
+
+
+@metric_registry.register(
+    "disk", r"\bdisk|storage|\bssd\b|\bhdd\b|\bdrives?\b|\bspace\b|\bread|\bwrit", timeout=_sampled_timeout(2)
+)
+def disk_metrics(seconds: float) -> List[str]:
+    disk = psutil.disk_usage("/")
+    stats = _summary(seconds, samples=2)
+    return [
+        f"Disk Usage: {disk.percent}% ({round(disk.used/(1024**3), 2)}GB / {round(disk.total/(1024**3), 2)}GB)",
+        _describe("Disk Read", stats.get("disk_read"), "MB/s", stats["span"]),
+        _describe("Disk Write", stats.get("disk_write"), "MB/s", stats["span"]),
+    ]
+
+
+@metric_registry.register("gpu", r"\bgpu|graphics|video (card|memory)|\bvram\b|nvidia", timeout=3.0)
+def gpu_metrics(seconds: float) -> List[str]:
+    gpus = _slow().get("gpus")
+    if gpus is None:
+        return ["GPU: Unable to retrieve GPU information"]
+    if not gpus:
+        return [" GPU: No dedicated GPU detected"]
+    gpu = gpus[0]
+    return [
+        f"GPU: {gpu['name']}",
+        f"    ▸ Load: {gpu['load']:.1f}%",
+        f"    ▸ Temperature: {gpu['temperature']}°C",
+        f"    ▸ Memory: {gpu['memory_used']}MB / {gpu['memory_total']}MB",
+    ]
+
+
+@metric_registry.register(
+    "network", r"network|internet|upload|download|bandwidth|connection|\bnet\b|wi-?fi", timeout=_sampled_timeout(2)
+)
+def network_metrics(seconds: float) -> List[str]:
+    stats = _summary(seconds, samples=2)
+    return [
+        _describe("Network Upload", stats.get("net_sent"), "MB/s", stats["span"]),
+        _describe("Network Download", stats.get("net_recv"), "MB/s", stats["span"]),
+    ]
@@ -0,0 +1,150 @@
+import asyncio
+import logging
+import sqlite3
+import threading
+import time
+import weakref
+from collections import defaultdict
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+import aiohttp
+from src.config.settings import settings
+from src.services.http_service import http_service
+from src.services.single_flight import single_flight
+from src.utils.html_text import extract_text, is_html
+
+logger = logging.getLogger(__name__)
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/126.0 Safari/537.36"
+
+
+class PageFetcher:
+    """Downloads search hits concurrently and keeps their readable text.
+
+    Requests share the pooled session from http_service, at most
+    ``settings.page_fetch_per_host`` run against one host at a time, each has
+    ``settings.page_fetch_timeout`` and ``fetch_all`` returns whatever finished
+    within ``settings.page_fetch_deadline``. Extracted text is cached in SQLite
+    by URL with the page's ETag / Last-Modified: within ``page_cache_fresh``
+    seconds it is reused outright, after that it is revalidated with a
+    conditional request and a 304 reuses it without downloading or parsing.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path or settings.page_cache_path
+        self._lock = threading.Lock()
+        self._conn = None
+        # Per-host semaphores for each event loop; dropped with the loop.
+        self._hosts = weakref.WeakKeyDictionary()
+        self.counts = defaultdict(int)
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS page_cache (
+                    url TEXT PRIMARY KEY,
+                    etag TEXT,
+                    last_modified TEXT,
+                    title TEXT,
+                    text TEXT,
+                    checked REAL
+                )"""
+            )
+        return self._conn
+
+    def _cached(self, url: str) -> Optional[tuple]:
+        with self._lock:
+            return self._connection().execute(
+                "SELECT etag, last_modified, title, text, checked FROM page_cache WHERE url = ?", (url,)
+            ).fetchone()
+
+    def _store(self, url: str, etag: str, last_modified: str, title: str, text: str):
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO page_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (url, etag, last_modified, title, text, time.time()),
+            )
+            conn.commit()
+
+    def _touch(self, url: str):
+        with self._lock:
+            conn = self._connection()
+            conn.execute("UPDATE page_cache SET checked = ? WHERE url = ?", (time.time(), url))
+            conn.commit()
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        # Semaphores belong to one event loop, like the HTTP session.
+        hosts = self._hosts.setdefault(asyncio.get_running_loop(), {})
+        host = urlsplit(url).hostname
+        limit = hosts.get(host)
+        if limit is None:
+            limit = hosts[host] = asyncio.Semaphore(settings.page_fetch_per_host)
+        return limit
+
+    async def _fetch(self, url: str) -> Optional[dict]:
+        cached = self._cached(url)
+        if cached and time.time() - cached[4] < settings.page_cache_fresh:
+            self.counts["cache_hits"] += 1
+            return {"url": url, "title": cached[2], "text": cached[3]}
+
+        headers = {"User-Agent": USER_AGENT, "Accept": "text/html,application/xhtml+xml"}
+        if cached and cached[0]:
+            headers["If-None-Match"] = cached[0]
+        if cached and cached[1]:
+            headers["If-Modified-Since"] = cached[1]
+        try:
+            async with self._host_limit(url):
+                status, response_headers, body = await http_service.get_text(
+                    url, headers, timeout=settings.page_fetch_timeout, max_bytes=settings.page_fetch_max_bytes
+                )
+        except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeError, ValueError) as e:
+            self.counts["failures"] += 1
+            logger.debug(f"Fetching {url} failed: {e!r}")
+            return None
+
+        if status == 304 and cached:
+            self.counts["not_modified"] += 1
+            self._touch(url)
+            return {"url": url, "title": cached[2], "text": cached[3]}
+        if status != 200 or not is_html(response_headers.get("Content-Type", "")):
+            self.counts["skipped"] += 1
+            return None
+        self.counts["downloaded"] += 1
+        title, text = extract_text(body, settings.page_text_chars)
+        self._store(url, response_headers.get("ETag"), response_headers.get("Last-Modified"), title, text)
+        return {"url": url, "title": title, "text": text}
+
+    async def fetch_all(self, urls: List[str], deadline: float = None) -> Dict[str, dict]:
+        """Fetch ``urls`` concurrently; returns {url: {"url", "title", "text"}} for pages with text."""
+        urls = list(dict.fromkeys(u for u in urls if u and u.startswith(("http://", "https://"))))
+        if not urls:
+            return {}
+        tasks = {
+            asyncio.ensure_future(single_flight.do("page", url, lambda url=url: self._fetch(url))): url
+            for url in urls
+        }
+        done, pending = await asyncio.wait(tasks, timeout=deadline or settings.page_fetch_deadline)
+        for task in pending:
+            task.cancel()
+        self.counts["late"] += len(pending)
+        pages = {}
+        for task in done:
+            if task.cancelled():
+                continue
+            if task.exception() is not None:
+                # _fetch handles network errors itself; anything else is a bug worth seeing.
+                self.counts["errors"] += 1
+                logger.warning(f"Fetching {tasks[task]} raised {task.exception()!r}")
+                continue
+            page = task.result()
+            if page and page["text"]:
+                pages[tasks[task]] = page
+        return pages
+
+    def stats(self) -> dict:
+        return dict(self.counts)
+
+
+page_fetcher = PageFetcher()
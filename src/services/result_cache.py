@@ -0,0 +1,170 @@
+import asyncio
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Awaitable, Callable, Optional, Tuple
+from src.config.settings import settings
+from src.services.single_flight import single_flight
+
+logger = logging.getLogger(__name__)
+
+FRESH, STALE = "fresh", "stale"
+
+
+def normalize_query(query: str) -> str:
+    return " ".join(str(query).lower().split()).strip(" ?!.,")
+
+
+class ResultCache:
+    """Two-tier cache for search tool results with per-tool freshness.
+
+    An in-memory LRU sits in front of a SQLite table, so repeats within a
+    session cost a dict lookup and results survive restarts. Each tool has a
+    TTL (``settings.result_cache_ttl``) and a further stale window
+    (``settings.result_cache_stale``). A stale entry triggers a refresh; if the
+    upstream API fails or takes longer than ``settings.result_cache_stale_wait``
+    the stale value is returned and the refresh finishes in the background.
+    Concurrent fetches of one key share a single upstream call (single_flight).
+    """
+
+    def __init__(self, path: str = None, memory_entries: int = None):
+        self.path = path or settings.result_cache_path
+        self.memory_entries = memory_entries or settings.result_cache_memory_entries
+        self.enabled = settings.result_cache_enabled
+        self._lock = threading.Lock()
+        self._conn = None
+        self._memory: "OrderedDict[str, Tuple[str, float, float]]" = OrderedDict()
+        self.counts = defaultdict(lambda: defaultdict(int))
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS result_cache (
+                    key TEXT PRIMARY KEY,
+                    tool TEXT,
+                    query TEXT,
+                    value TEXT,
+                    stored REAL,
+                    expires REAL
+                )"""
+            )
+        return self._conn
+
+    @staticmethod
+    def make_key(tool: str, query: str) -> str:
+        return hashlib.sha256(f"{tool}\0{normalize_query(query)}".encode("utf-8")).hexdigest()
+
+    def _lookup(self, key: str) -> Tuple[Optional[Tuple[str, float, float]], str]:
+        """Return (entry, tier) with tier "memory" or "disk"; entry is None when the key is unknown."""
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+                return entry, "memory"
+            row = self._connection().execute(
+                "SELECT value, stored, expires FROM result_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                self._remember(key, row)
+            return row, "disk"
+
+    def _remember(self, key: str, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    def store(self, tool: str, query: str, value: str):
+        now = time.time()
+        key = self.make_key(tool, query)
+        entry = (value, now, now + settings.result_cache_ttl.get(tool, 0))
+        with self._lock:
+            self._remember(key, entry)
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO result_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (key, tool, normalize_query(query), *entry),
+            )
+            # Rows past their stale window can never be served again.
+            conn.execute(
+                "DELETE FROM result_cache WHERE tool = ? AND expires < ?",
+                (tool, now - settings.result_cache_stale.get(tool, 0)),
+            )
+            conn.commit()
+
+    def _state(self, tool: str, entry) -> Optional[str]:
+        if entry is None:
+            return None
+        now = time.time()
+        if now < entry[2]:
+            return FRESH
+        if now < entry[2] + settings.result_cache_stale.get(tool, 0):
+            return STALE
+        return None
+
+    def _refresh(self, tool: str, query: str, key: str, fetch: Callable[[], Awaitable[str]]) -> asyncio.Task:
+        async def run():
+            try:
+                value = await fetch()
+            except Exception:
+                self.counts[tool]["refresh_failures"] += 1
+                raise
+            self.store(tool, query, value)
+            self.counts[tool]["refreshes"] += 1
+            return value
+
+        task = asyncio.ensure_future(single_flight.do(tool, key, run))
+        # A refresh that outlives its caller still stores its result; nothing awaits its error.
+        task.add_done_callback(lambda t: t.cancelled() or t.exception())
+        return task
+
+    async def get_or_fetch(self, tool: str, query: str, fetch: Callable[[], Awaitable[str]]) -> str:
+        """Return a cached result for ``tool``/``query`` or call ``fetch``; ``fetch`` raises on failure."""
+        key = self.make_key(tool, query)
+        if not self.enabled or tool not in settings.result_cache_ttl:
+            return await single_flight.do(tool, key, fetch)
+        entry, tier = self._lookup(key)
+        state = self._state(tool, entry)
+        if state == FRESH:
+            self.counts[tool][f"{tier}_hits"] += 1
+            return entry[0]
+        if state is None:
+            self.counts[tool]["misses"] += 1
+            value = await self._refresh(tool, query, key, fetch)
+            return value
+
+        self.counts[tool]["stale"] += 1
+        task = self._refresh(tool, query, key, fetch)
+        try:
+            return await asyncio.wait_for(asyncio.shield(task), settings.result_cache_stale_wait)
+        except Exception as e:
+            reason = "slow" if isinstance(e, asyncio.TimeoutError) else f"failed: {e}"
+            logger.info(f"Serving stale {tool} result (upstream {reason})")
+            self.counts[tool]["stale_served"] += 1
+            return entry[0]
+
+    def clear(self, tool: str = None):
+        with self._lock:
+            self._memory.clear()
+            conn = self._connection()
+            if tool:
+                conn.execute("DELETE FROM result_cache WHERE tool = ?", (tool,))
+            else:
+                conn.execute("DELETE FROM result_cache")
+            conn.commit()
+
+    def stats(self) -> dict:
+        per_tool = {}
+        for tool, counts in self.counts.items():
+            # Only fresh entries are hits; a stale one still waits on the upstream refresh.
+            hits = counts["memory_hits"] + counts["disk_hits"]
+            lookups = hits + counts["stale"] + counts["misses"]
+            per_tool[tool] = {**counts, "hit_rate": round(hits / lookups, 3) if lookups else 0.0}
+        return {"memory_entries": len(self._memory), "tools": per_tool}
+
+
+result_cache = ResultCache()
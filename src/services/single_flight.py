@@ -0,0 +1,74 @@
+import asyncio
+import copy
+import logging
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class _Flight:
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesces concurrent identical async requests into one upstream call.
+
+    The first caller for a ``(namespace, key)`` starts ``fn``; callers that arrive
+    while it is in flight await the same task. Followers get ``share(result)``, a
+    deep copy by default, so no two sessions share a mutable object; everyone
+    sees the same exception if the call fails. A caller that is cancelled leaves
+    the call running for the others; it is cancelled only when nobody is waiting.
+    Nothing is remembered once the call completes - that is the caches' job.
+    """
+
+    def __init__(self):
+        self._flights = {}
+        self.counts = defaultdict(lambda: defaultdict(int))
+
+    async def do(self, namespace: str, key: Hashable, fn: Callable[[], Awaitable[Any]], share: Callable = copy.deepcopy):
+        loop = asyncio.get_running_loop()
+        # Tasks belong to one event loop; a call from another loop starts its own flight.
+        flight_key = (namespace, key, id(loop))
+        counts = self.counts[namespace]
+        counts["calls"] += 1
+        flight = self._flights.get(flight_key)
+        leader = flight is None
+        if leader:
+            counts["upstream"] += 1
+            flight = self._flights[flight_key] = _Flight(loop.create_task(fn()))
+            flight.task.add_done_callback(lambda _: self._forget(flight_key, flight))
+        else:
+            counts["collapsed"] += 1
+            logger.debug(f"Joined in-flight {namespace} request")
+
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                self._forget(flight_key, flight)
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+        return result if leader else share(result)
+
+    def _forget(self, flight_key, flight: _Flight):
+        if self._flights.get(flight_key) is flight:
+            del self._flights[flight_key]
+
+    def in_flight(self) -> int:
+        return len(self._flights)
+
+    def stats(self) -> dict:
+        return {
+            "in_flight": len(self._flights),
+            "namespaces": {namespace: dict(counts) for namespace, counts in self.counts.items()},
+            "collapsed": sum(counts["collapsed"] for counts in self.counts.values()),
+        }
+
+
+single_flight = SingleFlight()
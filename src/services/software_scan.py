@@ -0,0 +1,223 @@
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Optional
+from pydantic import BaseModel, Field
+from src.config.settings import settings
+from src.services.app_index import SYSTEM_APPS, COMMON_STORE_APPS
+from src.services.llm_scheduler import Priority
+from src.services.llm_service import llm_service
+
+logger = logging.getLogger(__name__)
+
+HIGH, LOW, SAFE = "high", "low", "safe"
+
+
+class HarmfullSoftwaresOutput(BaseModel):
+    more_harmfull: List[str] = Field(description="List of applications that are potentially more harmful or suspicious")
+    less_harmfull: List[str] = Field(description="List of applications that may have minor security concerns but are generally safe")
+    have_apps: bool = Field(description="True if any potentially harmful applications were found, False if none detected")
+
+
+# Names that never need a model opinion.
+KNOWN_GOOD_NAMES = set(SYSTEM_APPS) | set(COMMON_STORE_APPS)
+KNOWN_GOOD = re.compile(
+    r"^(microsoft|windows|google|mozilla|adobe|visual studio|python|git|node\.?js|nvidia|intel|amd|realtek"
+    r"|steam|discord|spotify|zoom|slack|vlc|7-zip|notepad\+\+|obs studio|libreoffice|docker|oracle vm"
+    r"|uninstall|readme|help|documentation|release notes|license)\b",
+    re.IGNORECASE,
+)
+KNOWN_BAD = re.compile(
+    r"crack|keygen|kmspico|kms ?auto|activator|xmrig|nicehash|cryptominer|\bminer\b|keylogger"
+    r"|\brat\b|njrat|darkcomet|remcos|hack ?tool|password stealer",
+    re.IGNORECASE,
+)
+KNOWN_PUP = re.compile(
+    r"toolbar|driver booster|driver updater|pc optimizer|speed ?up|registry cleaner|cleaner|utorrent"
+    r"|bittorrent|search protect|coupon|mcafee webadvisor|wajam|conduit",
+    re.IGNORECASE,
+)
+
+
+def classify_known(name: str) -> Optional[str]:
+    if KNOWN_BAD.search(name):
+        return HIGH
+    if KNOWN_PUP.search(name):
+        return LOW
+    if name in KNOWN_GOOD_NAMES or KNOWN_GOOD.search(name):
+        return SAFE
+    return None
+
+
+def fingerprint(name: str, target: str) -> str:
+    """Cache key for an app: its name plus where it points and, for files, their size and mtime."""
+    parts = [name, target or ""]
+    try:
+        stat = os.stat(target)
+        parts += [str(stat.st_size), str(int(stat.st_mtime))]
+    except (OSError, TypeError, ValueError):
+        pass
+    return hashlib.sha1("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+class SoftwareScanner:
+    """Risk analysis of installed applications.
+
+    Apps matching the known-good/known-bad lists are classified locally. The
+    rest are checked against a verdict cache keyed by name and path
+    fingerprint, and only cache misses go to the LLM, in chunks of
+    ``settings.software_scan_chunk`` names that run concurrently. A rescan
+    therefore only pays for newly installed or changed apps.
+    """
+
+    def __init__(self, path: str = None, chunk_size: int = None):
+        self.path = path or settings.software_verdict_path
+        self.chunk_size = chunk_size or settings.software_scan_chunk
+        self._lock = threading.Lock()
+        self._verdicts: Optional[Dict[str, dict]] = None
+        self.last_scan = {}
+
+    def _load(self) -> Dict[str, dict]:
+        if self._verdicts is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    self._verdicts = json.load(f)
+            except (OSError, ValueError):
+                self._verdicts = {}
+        return self._verdicts
+
+    def _save(self):
+        tmp = f"{self.path}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._verdicts, f, ensure_ascii=False)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Could not write software verdicts: {e}")
+
+    @staticmethod
+    def _prompt(names: List[str]) -> str:
+        app_list = "\n".join(f"- {name}" for name in names)
+        return f"""TASK: Security analysis of installed applications
+
+INSTALLED APPLICATIONS:
+{app_list}
+
+CLASSIFICATION CRITERIA:
+
+HIGH RISK (more_harmfull):
+- Known malware signatures
+- Cryptocurrency miners
+- Keyloggers and spyware
+- Remote access trojans
+- Browser hijackers
+- Cracked software with potential backdoors
+- Suspicious unknown executables
+
+LOW RISK (less_harmfull):
+- Legitimate apps with privacy concerns
+- Outdated software versions
+- Potentially unwanted programs (PUPs)
+- Aggressive advertising software
+- System optimizers with questionable practices
+
+ANALYSIS RULES:
+1. Only flag applications with genuine security concerns
+2. Distinguish between legitimate and suspicious software
+3. Include only application names, exactly as listed, in output lists
+4. Set have_apps=True if ANY threats found
+5. Prioritize actual security risks over preferences
+
+THREAT INDICATORS:
+- Suspicious naming patterns
+- Known malware families
+- Applications commonly used maliciously
+
+Perform security analysis now."""
+
+    async def _analyze_chunk(self, llm, names: List[str]) -> Dict[str, str]:
+        result = await llm.ainvoke(self._prompt(names))
+        verdicts = {name: SAFE for name in names}
+        # Only names from this chunk count; anything else the model returns is ignored.
+        for name in result.less_harmfull:
+            if name in verdicts:
+                verdicts[name] = LOW
+        for name in result.more_harmfull:
+            if name in verdicts:
+                verdicts[name] = HIGH
+        return verdicts
+
+    async def scan(self, apps: Dict[str, str]) -> HarmfullSoftwaresOutput:
+        start = time.perf_counter()
+        risks: Dict[str, str] = {}
+        keys: Dict[str, str] = {}
+        known_count = cached_count = 0
+        with self._lock:
+            cache = self._load()
+            for name, target in apps.items():
+                known = classify_known(name)
+                if known is not None:
+                    risks[name] = known
+                    known_count += 1
+                    continue
+                keys[name] = fingerprint(name, target)
+                cached = cache.get(keys[name])
+                if cached is not None:
+                    risks[name] = cached["risk"]
+                    cached_count += 1
+
+        unknown = [name for name in keys if name not in risks]
+        chunks = [unknown[i:i + self.chunk_size] for i in range(0, len(unknown), self.chunk_size)]
+        errors = []
+        unanalyzed = 0
+        if chunks:
+            llm = llm_service.with_structured_output(HarmfullSoftwaresOutput, priority=Priority.GENERATION)
+            results = await asyncio.gather(
+                *(self._analyze_chunk(llm, chunk) for chunk in chunks), return_exceptions=True
+            )
+            now = time.time()
+            with self._lock:
+                cache = self._load()
+                for chunk, result in zip(chunks, results):
+                    if isinstance(result, Exception):
+                        logger.warning(f"Software scan chunk of {len(chunk)} apps failed: {result}")
+                        errors.append(str(result))
+                        unanalyzed += len(chunk)
+                        continue
+                    for name, risk in result.items():
+                        risks[name] = risk
+                        cache[keys[name]] = {"name": name, "risk": risk, "at": now}
+                self._save()
+
+        self.last_scan = {
+            "apps": len(apps),
+            "known": known_count,
+            "cached": cached_count,
+            "analyzed": len(unknown),
+            "chunks": len(chunks),
+            "failed_chunks": len(errors),
+            "unanalyzed": unanalyzed,
+            "seconds": round(time.perf_counter() - start, 3),
+        }
+        logger.info(f"Software scan: {self.last_scan}")
+
+        more = sorted(name for name, risk in risks.items() if risk == HIGH)
+        less = sorted(name for name, risk in risks.items() if risk == LOW)
+        if errors:
+            # A partial scan must not read as a clean bill of health.
+            more.append(f"Error analyzing {unanalyzed} of {len(apps)} applications: {errors[0]}")
+            return HarmfullSoftwaresOutput(more_harmfull=more, less_harmfull=less, have_apps=True)
+        return HarmfullSoftwaresOutput(more_harmfull=more, less_harmfull=less, have_apps=bool(more or less))
+
+    def clear(self):
+        with self._lock:
+            self._verdicts = {}
+            self._save()
+
+
+software_scanner = SoftwareScanner()
@@ -0,0 +1,224 @@
+import logging
+import platform
+import threading
+import time
+from typing import Dict, List, Tuple
+import numpy as np
+import psutil
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Sampled every tick. Counters are cumulative byte totals; summaries report them as rates.
+GAUGES = ("cpu", "ram")
+COUNTERS = ("disk_read", "disk_write", "net_sent", "net_recv")
+FIELDS = GAUGES + COUNTERS
+
+
+class RingBuffer:
+    """Fixed-size buffer of timestamped samples backed by NumPy arrays."""
+
+    def __init__(self, capacity: int, fields: Tuple[str, ...]):
+        self.capacity = capacity
+        self.fields = fields
+        self._times = np.zeros(capacity)
+        self._data = np.zeros((capacity, len(fields)))
+        self._next = 0
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, timestamp: float, values):
+        with self._lock:
+            self._times[self._next] = timestamp
+            self._data[self._next] = values
+            self._next = (self._next + 1) % self.capacity
+            self._size = min(self._size + 1, self.capacity)
+
+    def window(self, seconds: float = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Samples from the last ``seconds`` (all if None), oldest first."""
+        with self._lock:
+            if self._size < self.capacity:
+                times, data = self._times[:self._size].copy(), self._data[:self._size].copy()
+            else:
+                order = np.roll(np.arange(self.capacity), -self._next)
+                times, data = self._times[order], self._data[order]
+        if seconds is not None and len(times):
+            keep = times >= times[-1] - seconds
+            times, data = times[keep], data[keep]
+        return times, data
+
+
+def _trend(times: np.ndarray, values: np.ndarray) -> Tuple[float, str]:
+    """Least-squares slope per minute and a rising/falling/steady label."""
+    if len(values) < 3 or times[-1] == times[0]:
+        return 0.0, "steady"
+    slope = float(np.polyfit(times - times[0], values, 1)[0])
+    change = slope * (times[-1] - times[0])
+    if abs(change) < max(1.0, 0.05 * abs(float(values.mean()))):
+        return slope * 60, "steady"
+    return slope * 60, "rising" if change > 0 else "falling"
+
+
+def _describe(times: np.ndarray, values: np.ndarray) -> Dict[str, float]:
+    slope, label = _trend(times, values)
+    return {
+        "current": float(values[-1]),
+        "avg": float(values.mean()),
+        "min": float(values.min()),
+        "max": float(values.max()),
+        "per_minute": slope,
+        "trend": label,
+    }
+
+
+class TelemetrySampler:
+    """Samples CPU, RAM, disk IO and network counters in a daemon thread.
+
+    ``system_performance_monitor`` used to block for more than 5 s per call
+    (a 1 s CPU sample, a 20 MB disk write/read and a 3 s network wait). Reading
+    the buffers instead takes milliseconds. Slow sources (CPU temperature, fan,
+    GPU) are refreshed every ``settings.telemetry_slow_every`` ticks and kept as
+    a latest-value snapshot.
+    """
+
+    def __init__(self, interval: float = None, window: float = None):
+        self.interval = interval or settings.telemetry_interval
+        window = window or settings.telemetry_window
+        self.buffer = RingBuffer(max(2, int(window / self.interval)), FIELDS)
+        self.slow: Dict[str, object] = {}
+        self._stop = threading.Event()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> "TelemetrySampler":
+        with self._lock:
+            if not self.running:
+                self._stop.clear()
+                self._thread = threading.Thread(target=self._run, name="telemetry", daemon=True)
+                self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval * 2)
+
+    def _sample(self):
+        disk = psutil.disk_io_counters()
+        net = psutil.net_io_counters()
+        self.buffer.append(
+            time.time(),
+            (
+                psutil.cpu_percent(interval=None),
+                psutil.virtual_memory().percent,
+                disk.read_bytes if disk else 0,
+                disk.write_bytes if disk else 0,
+                net.bytes_sent if net else 0,
+                net.bytes_recv if net else 0,
+            ),
+        )
+
+    def refresh_slow(self) -> Dict[str, object]:
+        """Read temperature, fan and GPU now and update the snapshot."""
+        slow = {"cpu_temp": "N/A", "fan_speed": "N/A", "gpus": None}
+        try:
+            temps = psutil.sensors_temperatures() if hasattr(psutil, "sensors_temperatures") else {}
+            for entries in (temps or {}).values():
+                for entry in entries:
+                    if "core" in entry.label.lower() or "cpu" in entry.label.lower():
+                        slow["cpu_temp"] = f"{entry.current}°C"
+                        break
+        except Exception:
+            pass
+
+        if slow["cpu_temp"] == "N/A" and platform.system() == "Windows":
+            try:
+                import pythoncom
+                import wmi
+
+                pythoncom.CoInitialize()
+                for sensor in wmi.WMI(namespace="root\\OpenHardwareMonitor").Sensor():
+                    if sensor.SensorType == "Temperature" and "CPU" in sensor.Name:
+                        slow["cpu_temp"] = f"{sensor.Value}°C"
+                    if sensor.SensorType == "Fan" and "CPU" in sensor.Name:
+                        slow["fan_speed"] = f"{sensor.Value} RPM"
+            except Exception:
+                pass
+
+        try:
+            import GPUtil
+
+            slow["gpus"] = [
+                {
+                    "name": gpu.name,
+                    "load": gpu.load * 100,
+                    "temperature": gpu.temperature,
+                    "memory_used": gpu.memoryUsed,
+                    "memory_total": gpu.memoryTotal,
+                }
+                for gpu in GPUtil.getGPUs()
+            ]
+        except Exception:
+            slow["gpus"] = None
+        self.slow = slow
+        return slow
+
+    def _run(self):
+        # The first cpu_percent(None) call only primes psutil's internal counters and
+        # returns 0.0; the first real sample measures the interval after it.
+        psutil.cpu_percent(interval=None)
+        if self._stop.wait(self.interval):
+            return
+        tick = 0
+        while not self._stop.is_set():
+            started = time.monotonic()
+            try:
+                self._sample()
+                if tick % settings.telemetry_slow_every == 0:
+                    self.refresh_slow()
+            except Exception as e:
+                logger.warning(f"Telemetry sample failed: {e}")
+            tick += 1
+            self._stop.wait(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def wait_ready(self, samples: int = 2, timeout: float = None) -> bool:
+        """Block until ``samples`` samples exist (a rate needs two), e.g. right after start()."""
+        deadline = time.monotonic() + (timeout if timeout is not None else self.interval * (samples + 1))
+        while len(self.buffer) < samples and time.monotonic() < deadline:
+            time.sleep(min(0.05, self.interval))
+        return len(self.buffer) >= samples
+
+    def summary(self, seconds: float = None) -> Dict[str, Dict[str, float]]:
+        """Rolling statistics over the last ``seconds``.
+
+        Gauges are in percent; counters become rates in MB/s between consecutive
+        samples. Each metric has current, avg, min, max, per_minute and trend.
+        """
+        times, data = self.buffer.window(seconds)
+        result = {"samples": len(times), "span": float(times[-1] - times[0]) if len(times) > 1 else 0.0}
+        if not len(times):
+            return result
+        for i, name in enumerate(GAUGES):
+            result[name] = _describe(times, data[:, i])
+        if len(times) > 1:
+            dt = np.diff(times)
+            dt[dt <= 0] = self.interval
+            rates = np.diff(data[:, len(GAUGES):], axis=0) / dt[:, None] / (1024 * 1024)
+            # Counters can reset (e.g. an adapter reconnecting); drop negative deltas.
+            rates = np.clip(rates, 0, None)
+            for i, name in enumerate(COUNTERS):
+                result[name] = _describe(times[1:], rates[:, i])
+        return result
+
+    def stats(self) -> dict:
+        return {"running": self.running, "samples": len(self.buffer), "capacity": self.buffer.capacity}
+
+
+telemetry = TelemetrySampler()
@@ -0,0 +1,229 @@
+import argparse
+import bz2
+import gzip
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import xml.etree.ElementTree as ET
+from typing import Iterator, List, Tuple
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+WORD = re.compile(r"\w+")
+# Words that match most of the index and only slow the query down.
+STOPWORDS = frozenset(
+    "a an and are as at be by for from how in is it of on or the to was what when where which who why with".split()
+)
+TITLE_PREFIX = "Wikipedia: "
+# Title matches count this many times more than abstract matches in BM25.
+TITLE_WEIGHT = 5.0
+# Terms in more than this share of pages are recorded at build time and left out of
+# queries that have rarer terms: ranking their huge match lists dominates query time.
+COMMON_TERM_SHARE = 0.02
+
+
+def title_key(title: str) -> str:
+    return " ".join(WORD.findall(title.lower()))
+
+
+def open_dump(path: str):
+    if path.endswith(".gz"):
+        return gzip.open(path, "rb")
+    if path.endswith(".bz2"):
+        return bz2.open(path, "rb")
+    return open(path, "rb")
+
+
+def iter_abstracts(path: str) -> Iterator[Tuple[str, str]]:
+    """Stream (title, abstract) pairs from an abstracts dump (enwiki-*-abstract.xml[.gz]).
+
+    Each finished <doc> is cleared from the tree, so memory stays flat however
+    large the dump is.
+    """
+    with open_dump(path) as f:
+        root = None
+        for event, elem in ET.iterparse(f, events=("start", "end")):
+            if root is None:
+                root = elem
+            if event != "end" or elem.tag != "doc":
+                continue
+            title = (elem.findtext("title") or "").removeprefix(TITLE_PREFIX).strip()
+            abstract = " ".join((elem.findtext("abstract") or "").split())
+            # Template debris and empty stubs are not summaries.
+            if title and len(abstract) >= 20 and abstract[0] not in "{|":
+                yield title, abstract
+            elem.clear()
+            root.clear()
+
+
+def build_index(dump: str, path: str, batch: int = 5000) -> int:
+    """Index ``dump`` into a new FTS5 database at ``path``; returns the number of pages."""
+    tmp = f"{path}.tmp"
+    if os.path.exists(tmp):
+        os.remove(tmp)
+    conn = sqlite3.connect(tmp)
+    conn.execute("PRAGMA journal_mode = OFF")
+    conn.execute("PRAGMA synchronous = OFF")
+    # No stemmer: common terms are looked up by the words of the query as typed.
+    conn.execute("CREATE VIRTUAL TABLE pages USING fts5(title, abstract, tokenize = 'unicode61 remove_diacritics 2')")
+    conn.execute("CREATE TABLE titles (key TEXT PRIMARY KEY, page INTEGER) WITHOUT ROWID")
+    count, rows, start = 0, [], time.perf_counter()
+
+    def flush():
+        nonlocal count
+        conn.executemany("INSERT INTO pages(rowid, title, abstract) VALUES (?, ?, ?)", rows)
+        conn.executemany(
+            "INSERT OR IGNORE INTO titles VALUES (?, ?)", [(title_key(title), page) for page, title, _ in rows]
+        )
+        count += len(rows)
+        rows.clear()
+
+    for title, abstract in iter_abstracts(dump):
+        rows.append((count + len(rows) + 1, title, abstract))
+        if len(rows) >= batch:
+            flush()
+            logger.info(f"Indexed {count} pages ({count / (time.perf_counter() - start):.0f}/s)")
+    flush()
+    conn.execute("INSERT INTO pages(pages) VALUES ('optimize')")
+    conn.execute("CREATE VIRTUAL TABLE temp.vocab USING fts5vocab(main, pages, 'row')")
+    conn.execute(
+        "CREATE TABLE common_terms (term TEXT PRIMARY KEY, docs INTEGER) WITHOUT ROWID"
+    )
+    conn.execute(
+        "INSERT INTO common_terms SELECT term, doc FROM temp.vocab WHERE doc > ?",
+        (max(1, int(count * COMMON_TERM_SHARE)),),
+    )
+    conn.commit()
+    conn.close()
+    os.replace(tmp, path)
+    return count
+
+
+class WikiIndex:
+    """Offline Wikipedia summaries from a local FTS5 index, ranked by BM25.
+
+    Built from an abstracts dump with ``python -m src.services.wiki_index build``.
+    Unconfigured (``WIKI_INDEX_PATH`` empty) or missing, it reports itself
+    unavailable and wikipedia_search uses the live API.
+    """
+
+    def __init__(self, path: str = None):
+        self.path = path if path is not None else settings.wiki_index_path
+        self._lock = threading.Lock()
+        self._conn = None
+        self.queries = 0
+        self.misses = 0
+        self.seconds = 0.0
+
+    def available(self) -> bool:
+        return bool(self.path) and os.path.exists(self.path)
+
+    def _connection(self):
+        if self._conn is None:
+            self._conn = sqlite3.connect(f"file:{self.path}?mode=ro", uri=True, check_same_thread=False)
+        return self._conn
+
+    def _terms(self, query: str) -> Tuple[List[str], bool]:
+        """Query terms worth matching, and whether they are all common terms."""
+        words = list(dict.fromkeys(WORD.findall(query.lower())))
+        words = [w for w in words if w not in STOPWORDS] or words
+        if not words:
+            return [], False
+        common = {
+            term for (term,) in self._connection().execute(
+                f"SELECT term FROM common_terms WHERE term IN ({','.join('?' * len(words))})", words
+            )
+        }
+        rare = [w for w in words if w not in common]
+        return (rare, False) if rare else (words, True)
+
+    @staticmethod
+    def match_expressions(terms: List[str]) -> List[str]:
+        """FTS5 queries to try in order: every term, then any term.
+
+        Terms are quoted so punctuation in the query cannot break FTS syntax.
+        """
+        quoted = [f'"{term}"' for term in terms]
+        if len(quoted) <= 1:
+            return quoted
+        return [" ".join(quoted), " OR ".join(quoted)]
+
+    def search(self, query: str, limit: int = 3) -> List[Tuple[str, str]]:
+        start = time.perf_counter()
+        with self._lock:
+            conn = self._connection()
+            # A page titled exactly like the query comes first.
+            rows = conn.execute(
+                "SELECT rowid, title, abstract FROM pages WHERE rowid = (SELECT page FROM titles WHERE key = ?)",
+                (title_key(query),),
+            ).fetchall()
+            terms, common_only = self._terms(query) if len(rows) < limit else ([], False)
+            if common_only:
+                # Ranking a term found in a large share of all pages means scoring every one of
+                # them; titles that start with the query are a cheap range scan instead.
+                key = title_key(query)
+                found = conn.execute(
+                    """SELECT p.rowid, p.title, p.abstract FROM titles t JOIN pages p ON p.rowid = t.page
+                       WHERE t.key > ? AND t.key < ? LIMIT 200""",
+                    (key + " ", key + " \uffff"),
+                ).fetchall()
+                rows += sorted(found, key=lambda row: len(row[1]))
+            else:
+                for expression in self.match_expressions(terms):
+                    found = conn.execute(
+                        f"""SELECT rowid, title, abstract FROM pages WHERE pages MATCH ?
+                            ORDER BY bm25(pages, {TITLE_WEIGHT}, 1.0) LIMIT ?""",
+                        (expression, limit),
+                    ).fetchall()
+                    if found:
+                        rows += found
+                        break
+            pages = list({rowid: (title, abstract) for rowid, title, abstract in rows}.values())[:limit]
+            self.queries += 1
+            self.misses += not pages
+            self.seconds += time.perf_counter() - start
+        return pages
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> dict:
+        return {
+            "available": self.available(),
+            "queries": self.queries,
+            "misses": self.misses,
+            "avg_ms": round(self.seconds / self.queries * 1e3, 3) if self.queries else 0.0,
+        }
+
+
+wiki_index = WikiIndex()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build or query the offline Wikipedia index.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="index an abstracts dump (.xml, .xml.gz or .xml.bz2)")
+    build.add_argument("dump")
+    build.add_argument("--index", default=settings.wiki_index_path or "wiki_index.sqlite3")
+    build.add_argument("--batch", type=int, default=5000, help="rows per insert batch")
+    query = commands.add_parser("query", help="print the best matches for a query")
+    query.add_argument("text")
+    query.add_argument("--index", default=settings.wiki_index_path or "wiki_index.sqlite3")
+    query.add_argument("--limit", type=int, default=3)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    if args.command == "build":
+        start = time.perf_counter()
+        pages = build_index(args.dump, args.index, args.batch)
+        print(f"Indexed {pages} pages into {args.index} in {time.perf_counter() - start:.1f}s")
+    else:
+        for title, abstract in WikiIndex(args.index).search(args.text, args.limit):
+            print(f"{title}: {abstract}\n")
@@ -38,4 +38,7 @@ class BrowserToolFactory:
 
 _browser_factory = BrowserToolFactory()
 
-browser_tools = asyncio.run(_browser_factory.create_tools())
+
+async def get_browser_tools() -> List[Tool]:
+    """Playwright tools; the browser is launched on the first call, not at import."""
+    return await _browser_factory.create_tools()
@@ -1,10 +1,11 @@
 from typing import List
 from langchain.agents import Tool
-import time
 from src.services.selenium_service import seleniumservice
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from src.tools.executor import tool_executor
+from src.tools.registry import LazyRef, tool_registry
 
 
 class ChromeFuncToolFactory:
@@ -25,7 +26,7 @@ class ChromeFuncToolFactory:
 
         for _ in range(steps):
             driver.execute_script(f"window.scrollBy(0, {step_height});")
-            time.sleep(pause)
+            tool_executor.sleep(pause)
 
         return f"Scrolled {steps} steps {direction} by {abs(step_height)}px each"
 
@@ -38,12 +39,14 @@ class ChromeFuncToolFactory:
         except Exception as e:
             return f"Error Occurred: {e}"
 
-    def create_tools(self) -> List[Tool]:
+    @classmethod
+    def create_tools(cls, factory: LazyRef) -> List[Tool]:
         """Create and return all Selenium tools for agent usage with detailed descriptions."""
         return [
             Tool(
                 name="scroll_page",
-                func=self.scroll_page,
+                metadata={"user_ready": True},
+                func=factory.scroll_page,
                 description="""Scroll the webpage up or down in steps.
                 Input: steps, step_height, pause, direction
                 Example: "steps": 3, "step_height": 400, "direction": "down"
@@ -51,7 +54,8 @@ class ChromeFuncToolFactory:
             ),
             Tool(
                 name="open_page",
-                func=self.open_page,
+                metadata={"user_ready": True},
+                func=factory.open_page,
                 description=""" Opens a URL in the current Chrome tab.
 
         Parameters:
@@ -71,5 +75,5 @@ class ChromeFuncToolFactory:
         ]
 
 
-_chrome_func_factory = ChromeFuncToolFactory()
-chrome_func_tools = _chrome_func_factory.create_tools()
+_chrome_func_factory = tool_registry.register("chrome_func", ChromeFuncToolFactory)
+chrome_func_tools = ChromeFuncToolFactory.create_tools(_chrome_func_factory)
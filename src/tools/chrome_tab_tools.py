@@ -3,6 +3,7 @@ from langchain.agents import Tool
 import time
 import asyncio
 from src.services.selenium_service import seleniumservice
+from src.tools.registry import LazyRef, tool_registry
 
 class ChromeTabToolFactory:
     def __init__(self): 
@@ -60,13 +61,14 @@ class ChromeTabToolFactory:
         
         return return_msg
 
-    def create_tools(self) -> List[Tool]: 
+    @classmethod
+    def create_tools(cls, factory: LazyRef) -> List[Tool]:
         """Create tools for the agent system"""
         
         def switch_tab_wrapper(query):
             try:
                 tab_index = int(query.strip())
-                return self.switch_tab(tab_index)
+                return factory.switch_tab(tab_index)
             except ValueError:
                 return f"Error: '{query}' is not a valid tab index. Please provide an integer."
             except Exception as e:
@@ -75,14 +77,14 @@ class ChromeTabToolFactory:
         def new_tab_wrapper(query):
             try:
                 url = query.strip()
-                return self.new_tab(url)
+                return factory.new_tab(url)
             except Exception as e:
                 return f"Error in new_tab_wrapper: {e}"
         
         def close_tab_wrapper(query):
             try:
                 tab_index = int(query.strip())
-                return self.close_tab(tab_index)
+                return factory.close_tab(tab_index)
             except ValueError:
                 return f"Error: '{query}' is not a valid tab index. Please provide an integer."
             except Exception as e:
@@ -91,6 +93,7 @@ class ChromeTabToolFactory:
         return [
             Tool(
                 name="switch_tab",
+                metadata={"user_ready": True},
                 func=switch_tab_wrapper,
                 description="""
                 Switch to a specific Chrome tab by index.
@@ -103,6 +106,7 @@ class ChromeTabToolFactory:
             ),
             Tool(
                 name="new_tab",
+                metadata={"user_ready": True},
                 func=new_tab_wrapper,
                 description="""
                 Open a new Chrome tab with the specified URL.
@@ -119,6 +123,7 @@ class ChromeTabToolFactory:
             ),
             Tool(
                 name="close_tab",
+                metadata={"user_ready": True},
                 func=close_tab_wrapper,
                 description="""
                 Close a specific Chrome tab by index.
@@ -135,5 +140,5 @@ class ChromeTabToolFactory:
         ]
 
 
-_chrome_tab_factory = ChromeTabToolFactory()
-chrome_tab_tools = _chrome_tab_factory.create_tools()  
\ No newline at end of file
+_chrome_tab_factory = tool_registry.register("chrome_tab", ChromeTabToolFactory)
+chrome_tab_tools = ChromeTabToolFactory.create_tools(_chrome_tab_factory)
@@ -0,0 +1,162 @@
+import asyncio
+import contextvars
+import functools
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List
+from langchain.agents import Tool
+from src.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Cancel token of the tool call running in this thread (sync tools) or task (async tools).
+_current_token: contextvars.ContextVar = contextvars.ContextVar("tool_cancel_token", default=None)
+
+
+class ToolCancelled(Exception):
+    """Raised inside a tool that checked its cancel token after the call was abandoned."""
+
+
+class CancelToken:
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.reason = None
+        self._event = threading.Event()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self, reason: str):
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def wait(self, seconds: float) -> bool:
+        return self._event.wait(seconds)
+
+
+class ToolExecutor:
+    """Runs sync tool functions on a bounded pool with per-tool timeouts.
+
+    ``wrap`` gives a tool a coroutine, so ToolNode awaits it instead of blocking
+    the turn. A call that runs past its timeout (``metadata["timeout"]`` or
+    ``settings.tool_timeout``) returns a structured result (see ``result``) and
+    its cancel token is set, as is the token of every call in a turn that gets
+    cancelled (VoiceAssistant cancels the running turn when a new command
+    arrives). Cancellation is cooperative: long-running tools call
+    ``tool_executor.sleep`` / ``tool_executor.check`` and stop at the next
+    check. Async tools find their token the same way, through a context
+    variable, and are also cancelled at their next await.
+    """
+
+    def __init__(self, max_workers: int = None):
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers or settings.tool_workers, thread_name_prefix="tool"
+        )
+        self._lock = threading.Lock()
+        self._running = set()
+        self.timeouts = 0
+        self.cancellations = 0
+
+    @staticmethod
+    def result(status: str, tool: str, message: str, **extra) -> str:
+        """Structured tool result for a call that did not complete."""
+        return json.dumps({"status": status, "tool": tool, "message": message, **extra})
+
+    # Called from inside tool functions.
+
+    def current_token(self) -> CancelToken:
+        return _current_token.get()
+
+    def check(self):
+        token = self.current_token()
+        if token is not None and token.cancelled:
+            raise ToolCancelled(token.reason)
+
+    def sleep(self, seconds: float):
+        """Interruptible replacement for time.sleep inside tools."""
+        token = self.current_token()
+        if token is None:
+            time.sleep(seconds)
+        elif token.wait(seconds):
+            raise ToolCancelled(token.reason)
+
+    # Called from the event loop.
+
+    @staticmethod
+    def _call(token: CancelToken, func, *args, **kwargs):
+        reset = _current_token.set(token)
+        try:
+            if token.cancelled:
+                raise ToolCancelled(token.reason)
+            return func(*args, **kwargs)
+        finally:
+            _current_token.reset(reset)
+
+    async def run(self, name: str, func, *args, timeout: float = None, is_async: bool = None, **kwargs):
+        """Await ``func`` (threaded unless it is async) under ``timeout``; never raises on timeout."""
+        if is_async is None:
+            is_async = asyncio.iscoroutinefunction(func)
+        timeout = timeout or settings.tool_timeout
+        token = CancelToken(name)
+        with self._lock:
+            self._running.add(token)
+        loop = asyncio.get_running_loop()
+        start = time.perf_counter()
+        try:
+            if is_async:
+                # wait_for runs the coroutine in a task, which copies the context as it is now.
+                reset = _current_token.set(token)
+                try:
+                    call = asyncio.ensure_future(func(*args, **kwargs))
+                finally:
+                    _current_token.reset(reset)
+            else:
+                call = loop.run_in_executor(
+                    self._pool, functools.partial(self._call, token, func, *args, **kwargs)
+                )
+            return await asyncio.wait_for(call, timeout)
+        except asyncio.TimeoutError:
+            token.cancel("timed out")
+            self.timeouts += 1
+            logger.warning(f"Tool '{name}' timed out after {timeout:.1f}s")
+            return self.result(
+                "timeout", name, f"{name} did not finish within {timeout:g} seconds and was stopped.", timeout=timeout
+            )
+        except ToolCancelled as e:
+            return self.result("cancelled", name, f"{name} was cancelled ({e}).")
+        except asyncio.CancelledError:
+            token.cancel("turn cancelled")
+            raise
+        finally:
+            with self._lock:
+                self._running.discard(token)
+            if token.cancelled and token.reason != "timed out":
+                self.cancellations += 1
+            logger.debug(f"Tool '{name}' ran {time.perf_counter() - start:.3f}s")
+
+    def wrap(self, tool: Tool) -> Tool:
+        """Copy of ``tool`` whose async path runs through the executor."""
+        timeout = (tool.metadata or {}).get("timeout")
+        # Tool functions are often LazyRefs, so whether a target is async comes from the Tool itself.
+        is_async = tool.coroutine is not None
+        target = tool.coroutine if is_async else tool.func
+        name = tool.name
+
+        async def coroutine(*args, **kwargs):
+            return await self.run(name, target, *args, timeout=timeout, is_async=is_async, **kwargs)
+
+        return tool.model_copy(update={"coroutine": coroutine})
+
+    def wrap_all(self, tools: Iterable[Tool]) -> List[Tool]:
+        return [self.wrap(tool) for tool in tools]
+
+    def stats(self) -> dict:
+        return {"running": len(self._running), "timeouts": self.timeouts, "cancellations": self.cancellations}
+
+
+tool_executor = ToolExecutor()
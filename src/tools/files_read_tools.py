@@ -1,10 +1,11 @@
-import time
 import os
 import platform
 from typing import List
 from langchain.agents import Tool
 from src.services.selenium_service import seleniumservice
 from src.services.filemanger_service import FileManagerService
+from src.tools.executor import tool_executor
+from src.tools.registry import LazyRef, tool_registry
 
 
 class FileManagerReadToolFactory:
@@ -25,7 +26,7 @@ class FileManagerReadToolFactory:
 
         for _ in range(steps):
             driver.execute_script(f"window.scrollBy(0, {step_height});")
-            time.sleep(pause)
+            tool_executor.sleep(pause)
 
         return f"Scrolled {steps} steps {direction} by {abs(step_height)}px each"
 
@@ -65,12 +66,14 @@ class FileManagerReadToolFactory:
         except Exception as e:
             return f"Error reading file: {e}"
 
-    def create_tools(self) -> List[Tool]:
+    @classmethod
+    def create_tools(cls, factory: LazyRef) -> List[Tool]:
         """Create and return all File Manager tools for agent usage with detailed descriptions."""
         return [
             Tool(
                 name="scroll_page",
-                func=self.scroll_page,
+                metadata={"user_ready": True},
+                func=factory.scroll_page,
                 description="""
                 Scrolls through a File Manager window (simulated in a browser view).
                 
@@ -90,7 +93,8 @@ class FileManagerReadToolFactory:
             ),
             Tool(
                 name="open_folder",
-                func=self.open_folder,
+                metadata={"user_ready": True},
+                func=factory.open_folder,
                 description="""
                 Opens a folder in File Manager (in a browser tab via Selenium).
                 
@@ -106,7 +110,8 @@ class FileManagerReadToolFactory:
             ),
             Tool(
                 name="open_file",
-                func=self.open_file,
+                metadata={"user_ready": True},
+                func=factory.open_file,
                 description="""
                 Opens a file using the system's default application.
                 
@@ -118,7 +123,7 @@ class FileManagerReadToolFactory:
             ),
             Tool(
                 name="read_file",
-                func=self.read_file,
+                func=factory.read_file,
                 description="""
                 Reads the contents of a text file as a string.
                 
@@ -132,5 +137,5 @@ class FileManagerReadToolFactory:
         ]
 
 
-_filemanager_read_factory = FileManagerReadToolFactory()
-filemanager_read_tools = _filemanager_read_factory.create_tools()
+_filemanager_read_factory = tool_registry.register("filemanager_read", FileManagerReadToolFactory)
+filemanager_read_tools = FileManagerReadToolFactory.create_tools(_filemanager_read_factory)
@@ -3,6 +3,7 @@ from langchain.agents import Tool
 import time
 import asyncio
 from src.services.selenium_service import seleniumservice
+from src.tools.registry import LazyRef, tool_registry
 
 class FileManagerTabToolFactory:
     def __init__(self): 
@@ -59,13 +60,14 @@ class FileManagerTabToolFactory:
         
         return return_msg
 
-    def create_tools(self) -> List[Tool]: 
+    @classmethod
+    def create_tools(cls, factory: LazyRef) -> List[Tool]:
         """Create tools for File Manager mode"""
         
         def switch_tab_wrapper(query):
             try:
                 tab_index = int(query.strip())
-                return self.switch_tab(tab_index)
+                return factory.switch_tab(tab_index)
             except ValueError:
                 return f"Error: '{query}' is not a valid tab index. Please provide an integer."
             except Exception as e:
@@ -74,14 +76,14 @@ class FileManagerTabToolFactory:
         def new_tab_wrapper(query):
             try:
                 path = query.strip()
-                return self.new_tab(path)
+                return factory.new_tab(path)
             except Exception as e:
                 return f"Error in new_tab_wrapper: {e}"
         
         def close_tab_wrapper(query):
             try:
                 tab_index = int(query.strip())
-                return self.close_tab(tab_index)
+                return factory.close_tab(tab_index)
             except ValueError:
                 return f"Error: '{query}' is not a valid tab index. Please provide an integer."
             except Exception as e:
@@ -90,6 +92,7 @@ class FileManagerTabToolFactory:
         return [
             Tool(
                 name="switch_tab",
+                metadata={"user_ready": True},
                 func=switch_tab_wrapper,
                 description="""
                 Switch to a specific File Manager tab by index.
@@ -101,6 +104,7 @@ class FileManagerTabToolFactory:
             ),
             Tool(
                 name="new_tab",
+                metadata={"user_ready": True},
                 func=new_tab_wrapper,
                 description="""
                 Open a new File Manager tab at a specified path.
@@ -116,6 +120,7 @@ class FileManagerTabToolFactory:
             ),
             Tool(
                 name="close_tab",
+                metadata={"user_ready": True},
                 func=close_tab_wrapper,
                 description="""
                 Close a specific File Manager tab by index.
@@ -130,5 +135,5 @@ class FileManagerTabToolFactory:
         ]
 
 
-_file_manager_tab_factory = FileManagerTabToolFactory()
-file_manager_tab_tools = _file_manager_tab_factory.create_tools()
+_file_manager_tab_factory = tool_registry.register("filemanager_tab", FileManagerTabToolFactory)
+file_manager_tab_tools = FileManagerTabToolFactory.create_tools(_file_manager_tab_factory)
@@ -6,6 +6,8 @@ from typing import List
 from langchain.agents import Tool
 from src.services.filemanger_service import FileManagerService
 from langchain.tools import StructuredTool
+from src.tools.executor import tool_executor, ToolCancelled
+from src.tools.registry import LazyRef, tool_registry
 
 
 class FileManagerWriteToolFactory:
@@ -66,7 +68,7 @@ class FileManagerWriteToolFactory:
         try:
             if os.path.isdir(src_path):
                 if operation == "copy":
-                    shutil.copytree(src_path, dest_path)
+                    shutil.copytree(src_path, dest_path, copy_function=self._copy_file)
                 else:
                     shutil.move(src_path, dest_path)
             else:
@@ -74,11 +76,19 @@ class FileManagerWriteToolFactory:
                     shutil.copy2(src_path, dest_path)
                 else:
                     shutil.move(src_path, dest_path)
+        except ToolCancelled:
+            return f"Paste into '{dest_folder}' was stopped before it finished; '{dest_path}' may be incomplete."
         except Exception as e:
             return f"Error during paste: {e}"
 
         return f"Pasted '{src_path}' to '{dest_folder}' using {operation} operation."
 
+    @staticmethod
+    def _copy_file(src, dst):
+        # Checked per file so a cancelled or timed-out paste stops part-way through a large tree.
+        tool_executor.check()
+        return shutil.copy2(src, dst)
+
     def delete_content(self, path: str):
         if not os.path.exists(path):
             return f"Path does not exist: {path}"
@@ -117,41 +127,48 @@ class FileManagerWriteToolFactory:
         except Exception as e:
             return f"Error creating item: {e}"
 
-    def create_tools(self) -> List[Tool]:
+    @classmethod
+    def create_tools(cls, factory: LazyRef) -> List[Tool]:
         """Create and return all File Manager tools for agent usage with detailed descriptions."""
         return [
             Tool(
                 name="copy_to_clipboard",
-                func=self.copy_to_clipboard,
+                metadata={"user_ready": True},
+                func=factory.copy_to_clipboard,
                 description="""UseFul when user want to Copy a file or folder to clipboard for later pasting.""",
             ),
             Tool(
                 name="cut_to_clipboard",
-                func=self.cut_to_clipboard,
+                metadata={"user_ready": True},
+                func=factory.cut_to_clipboard,
                 description="""UseFul when user want to Cut (move) a file or folder to clipboard for later pasting.""",
             ),
             Tool(
                 name="paste_from_clipboard",
-                func=self.paste_from_clipboard,
+                metadata={"user_ready": True, "timeout": 600},
+                func=factory.paste_from_clipboard,
                 description="""UseFul when user want to Paste previously copied or cut items from clipboard to destination folder.""",
             ),
             Tool(
                 name="delete_content",
-                func=self.delete_content,
+                metadata={"user_ready": True},
+                func=factory.delete_content,
                 description="""UseFul when user want to Delete a file or folder by moving it to Recycle Bin.""",
             ),
             Tool(
                 name="create_file",
-                func=self.create_file,
+                metadata={"user_ready": True},
+                func=factory.create_file,
                 description="""UseFul when user want to Create a file at the specified path."""
             ),
             Tool(
                 name="create_folder",
+                metadata={"user_ready": True},
                 description="Usefull when user want to Create a folder at the specified path",
-                func=self.create_folder,
+                func=factory.create_folder,
             ),
         ]
 
 
-_filemanager_write_factory = FileManagerWriteToolFactory()
-filemanager_write_tools = _filemanager_write_factory.create_tools()
+_filemanager_write_factory = tool_registry.register("filemanager_write", FileManagerWriteToolFactory)
+filemanager_write_tools = FileManagerWriteToolFactory.create_tools(_filemanager_write_factory)
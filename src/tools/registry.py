@@ -0,0 +1,101 @@
+import logging
+import threading
+import time
+from typing import Callable, Dict, Iterable
+
+logger = logging.getLogger(__name__)
+
+
+class LazyRef:
+    """Attribute path on a registered factory, resolved (and the factory built) only when called.
+
+    Each factory declares its tools in a classmethod ``create_tools(cls, factory)``
+    that receives the ``LazyRef`` returned by ``register``. It references
+    ``factory.open_app`` or ``factory.client.method`` instead of a live
+    instance, so names, descriptions and metadata exist at import while the
+    factory's own setup waits for the first call. Declarations should only
+    reference attributes of the ref; calling one would build the factory.
+    """
+
+    __slots__ = ("_registry", "_name", "_path")
+
+    def __init__(self, registry, name: str, path: tuple = ()):
+        self._registry = registry
+        self._name = name
+        self._path = path
+
+    def __getattr__(self, attr: str) -> "LazyRef":
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        return LazyRef(self._registry, self._name, self._path + (attr,))
+
+    def __call__(self, *args, **kwargs):
+        target = self._registry.get(self._name)
+        for attr in self._path:
+            target = getattr(target, attr)
+        return target(*args, **kwargs)
+
+    def __repr__(self) -> str:
+        return f"LazyRef({'.'.join((self._name,) + self._path)})"
+
+
+class ToolRegistry:
+    """Named tool factories that are constructed on first use or warmed in the background."""
+
+    def __init__(self):
+        self._loaders: Dict[str, Callable] = {}
+        self._factories = {}
+        self._locks: Dict[str, threading.Lock] = {}
+        self._guard = threading.Lock()
+        self.timings: Dict[str, float] = {}
+        self.errors: Dict[str, str] = {}
+
+    def register(self, name: str, loader: Callable) -> LazyRef:
+        with self._guard:
+            self._loaders[name] = loader
+            self._locks[name] = threading.Lock()
+        return LazyRef(self, name)
+
+    def get(self, name: str):
+        factory = self._factories.get(name)
+        if factory is not None:
+            return factory
+        with self._locks[name]:
+            factory = self._factories.get(name)
+            if factory is None:
+                start = time.perf_counter()
+                try:
+                    factory = self._loaders[name]()
+                except Exception as e:
+                    self.errors[name] = str(e)
+                    raise
+                self.timings[name] = time.perf_counter() - start
+                self.errors.pop(name, None)
+                self._factories[name] = factory
+                logger.info(f"Tool factory '{name}' ready in {self.timings[name]:.2f}s")
+        return factory
+
+    def warm(self, names: Iterable[str] = None) -> threading.Thread:
+        """Build factories in a daemon thread so the first tool call does not pay for them."""
+        names = list(names or self._loaders)
+
+        def run():
+            for name in names:
+                try:
+                    self.get(name)
+                except Exception as e:
+                    logger.warning(f"Warming tool factory '{name}' failed: {e}")
+
+        thread = threading.Thread(target=run, name="tool-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def stats(self) -> dict:
+        return {
+            "registered": sorted(self._loaders),
+            "loaded": {name: round(self.timings[name], 3) for name in self._factories},
+            "errors": dict(self.errors),
+        }
+
+
+tool_registry = ToolRegistry()
@@ -1,78 +1,189 @@
-import asyncio
-import aiohttp
 from typing import List
-from langchain.agents import Tool
-from langchain_community.utilities import GoogleSerperAPIWrapper
-from langchain_community.tools.wikipedia.tool import WikipediaQueryRun
-from langchain_community.utilities.wikipedia import WikipediaAPIWrapper
+import aiohttp
+from langchain.tools import StructuredTool
+from pydantic import BaseModel, Field
 from src.config.settings import settings
-from langchain_community.utilities import OpenWeatherMapAPIWrapper
+from src.services.http_service import http_service
+from src.services.page_fetcher import page_fetcher
+from src.services.result_cache import result_cache
+from src.services.wiki_index import wiki_index
+from src.tools.registry import LazyRef, tool_registry
+from src.utils.result_reducer import result_reducer
+
+
+class SearchInput(BaseModel):
+    query: str = Field(description="Search query with key terms")
+
+
+class WeatherInput(BaseModel):
+    location: str = Field(description="Location name (city, region, or coordinates)")
+
 
 class SearchToolFactory:
-    def __init__(self):
-        self.serper = GoogleSerperAPIWrapper()
-        self.wikipedia = WikipediaAPIWrapper()
-        self.wiki_tool = WikipediaQueryRun(api_wrapper=self.wikipedia)
-        self.weather = OpenWeatherMapAPIWrapper()
+    """Async clients for the search APIs, all sharing the pooled session from http_service.
 
-    async def search_news_async(self, query: str):
-        try:
-            url = f"https://newsapi.org/v2/everything"
-            params = {
-                "q": query,
-                "sortBy": "publishedAt",
-                "apiKey": settings.news_api_key,
-                "pageSize": 10
-            }
-            
-            timeout = aiohttp.ClientTimeout(total=30)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.get(url, params=params) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-
-                    if data["status"] == "ok":
-                        articles = data["articles"]
-                        if not articles:
-                            return f"No news articles found for '{query}'"
-
-                        news_summary = f"Found {len(articles)} news articles for '{query}':\n\n"
-
-                        for i, article in enumerate(articles[:10], 1):
-                            title = article.get("title", "No title")
-                            description = article.get("description", "No description")
-                            url_link = article.get("url", "")
-                            published_at = article.get("publishedAt", "Unknown date")
-
-                            news_summary += f"{i}. {title}\n"
-                            news_summary += f"   Published: {published_at}\n"
-                            news_summary += f"   Description: {description}\n"
-                            news_summary += f"   URL: {url_link}\n\n"
-
-                        return news_summary
-                    else:
-                        return f"Error: {data.get('message', 'Unknown error occurred')}"
+    Results go through result_cache; the ``_fetch_*`` methods raise on failure so
+    that errors are never cached and a stale entry can stand in for them.
+    """
+
+    WIKI_MAX_CHARS = 4000
 
+    @staticmethod
+    async def _cached(tool: str, query: str, fetch, action: str) -> str:
+        try:
+            return await result_cache.get_or_fetch(tool, query, lambda: fetch(query))
         except aiohttp.ClientError as e:
             return f"Network error: {str(e)}"
         except Exception as e:
-            return f"Error searching news: {str(e)}"
-
-    def search_news(self, query: str):
-        try:
-            loop = asyncio.get_running_loop()
-            import concurrent.futures
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, self.search_news_async(query))
-                return future.result()
-        except RuntimeError:
-            return asyncio.run(self.search_news_async(query))
-
-    async def create_tools(self) -> List[Tool]:
+            return f"Error {action}: {str(e)}"
+
+    async def search_internet(self, query: str) -> str:
+        return await self._cached("search_internet", query, self._fetch_search, "searching the internet")
+
+    async def wikipedia_search(self, query: str) -> str:
+        return await self._cached("wikipedia_search", query, self._fetch_wikipedia, "searching Wikipedia")
+
+    async def search_news(self, query: str) -> str:
+        return await self._cached("news_search", query, self._fetch_news, "searching news")
+
+    async def weather(self, location: str) -> str:
+        return await self._cached("weather", location, self._fetch_weather, "getting weather")
+
+    async def _fetch_search(self, query: str) -> str:
+        data = await http_service.post_json(
+            f"{settings.serper_base_url}/search",
+            {"q": query, "num": 10},
+            headers={"X-API-KEY": settings.serper_api_key or ""},
+        )
+        snippets = self._format_serper(data)
+        # A direct answer needs no sources; otherwise the top pages give the chatbot enough
+        # context to answer without another search round.
+        hits = data.get("organic", [])[: settings.page_fetch_top]
+        if data.get("answerBox") or not hits:
+            return snippets
+        pages = await page_fetcher.fetch_all([hit.get("link") for hit in hits])
+        # Each page gets an equal share of the reducer's budget, so the first page
+        # cannot crowd the others out of the reduced result.
+        budget = result_reducer.budget("search_internet") * 4 if settings.result_reducer_enabled else 0
+        share = budget // len(pages) if budget and pages else 0
+        sources = []
+        for hit in hits:
+            page = pages.get(hit.get("link"))
+            if page is None:
+                continue
+            text = result_reducer.fit(page["text"], query, share) if share else page["text"]
+            sources.append(f"Source: {hit.get('title') or page['title']}\n{text}")
+        return "\n\n".join([snippets, *sources])
+
+    @staticmethod
+    def _format_serper(data: dict) -> str:
+        """Same shape as GoogleSerperAPIWrapper.run: a direct answer if there is one, else snippets."""
+        box = data.get("answerBox") or {}
+        for key in ("answer", "snippet", "snippetHighlighted"):
+            if box.get(key):
+                value = box[key]
+                return " ".join(value) if isinstance(value, list) else str(value)
+        snippets = []
+        graph = data.get("knowledgeGraph") or {}
+        if graph.get("description"):
+            snippets.append(graph["description"])
+        for attribute, value in (graph.get("attributes") or {}).items():
+            snippets.append(f"{graph.get('title', '')} {attribute}: {value}.")
+        for result in data.get("organic", [])[:10]:
+            if result.get("snippet"):
+                snippets.append(result["snippet"])
+            for attribute, value in (result.get("attributes") or {}).items():
+                snippets.append(f"{attribute}: {value}.")
+        return " ".join(snippets) if snippets else "No good Google Search Result was found"
+
+    async def _fetch_wikipedia(self, query: str) -> str:
+        if wiki_index.available():
+            pages = wiki_index.search(query)
+            if pages:
+                return self._format_wikipedia(pages)
+        data = await http_service.get_json(
+            f"{settings.wikipedia_base_url}/w/api.php",
+            {
+                "action": "query",
+                "format": "json",
+                "generator": "search",
+                "gsrsearch": query,
+                "gsrlimit": 3,
+                "prop": "extracts",
+                "exintro": 1,
+                "explaintext": 1,
+                "exlimit": 3,
+                "redirects": 1,
+            },
+        )
+        pages = sorted((data.get("query") or {}).get("pages", {}).values(), key=lambda p: p.get("index", 0))
+        return self._format_wikipedia([(page["title"], page["extract"]) for page in pages if page.get("extract")])
+
+    def _format_wikipedia(self, pages) -> str:
+        if not pages:
+            return "No good Wikipedia Search Result was found"
+        summaries = [f"Page: {title}\nSummary: {extract.strip()}" for title, extract in pages]
+        return "\n\n".join(summaries)[: self.WIKI_MAX_CHARS]
+
+    async def _fetch_news(self, query: str) -> str:
+        data = await http_service.get_json(
+            f"{settings.news_api_base_url}/v2/everything",
+            {
+                "q": query,
+                "sortBy": "publishedAt",
+                "apiKey": settings.news_api_key or "",
+                "pageSize": 10,
+            },
+        )
+        if data.get("status") != "ok":
+            raise RuntimeError(data.get("message", "Unknown error occurred"))
+        articles = data.get("articles") or []
+        if not articles:
+            return f"No news articles found for '{query}'"
+
+        news_summary = f"Found {len(articles)} news articles for '{query}':\n\n"
+        for i, article in enumerate(articles[:10], 1):
+            news_summary += f"{i}. {article.get('title', 'No title')}\n"
+            news_summary += f"   Published: {article.get('publishedAt', 'Unknown date')}\n"
+            news_summary += f"   Description: {article.get('description', 'No description')}\n"
+            news_summary += f"   URL: {article.get('url', '')}\n\n"
+        return news_summary
+
+    async def _fetch_weather(self, location: str) -> str:
+        data = await http_service.get_json(
+            f"{settings.openweathermap_base_url}/data/2.5/weather",
+            {"q": location, "appid": settings.openweathermap_api_key or "", "units": "metric"},
+        )
+        return self._format_weather(location, data)
+
+    @staticmethod
+    def _format_weather(location: str, data: dict) -> str:
+        main = data.get("main", {})
+        wind = data.get("wind", {})
+        status = ", ".join(w.get("description", "") for w in data.get("weather", [])) or "unknown"
+        return (
+            f"In {location}, the current weather is as follows:\n"
+            f"Detailed status: {status}\n"
+            f"Wind speed: {wind.get('speed', 'N/A')} m/s, direction: {wind.get('deg', 'N/A')}°\n"
+            f"Humidity: {main.get('humidity', 'N/A')}%\n"
+            f"Temperature: \n"
+            f"  - Current: {main.get('temp', 'N/A')}°C\n"
+            f"  - High: {main.get('temp_max', 'N/A')}°C\n"
+            f"  - Low: {main.get('temp_min', 'N/A')}°C\n"
+            f"  - Feels like: {main.get('feels_like', 'N/A')}°C\n"
+            f"Rain: {data.get('rain', {})}\n"
+            f"Cloud cover: {data.get('clouds', {}).get('all', 'N/A')}%"
+        )
+
+    @classmethod
+    def create_tools(cls, factory: LazyRef) -> List[StructuredTool]:
+        # Coroutine-only tools: ToolNode awaits them directly and gathers every call from one
+        # AI message concurrently. Schemas are explicit because the coroutines are LazyRefs.
         return [
-            Tool(
+            StructuredTool(
                 name="search_internet",
-                func=lambda query: asyncio.run(asyncio.to_thread(self.serper.run, query)),
+                coroutine=factory.search_internet,
+                args_schema=SearchInput,
                 description="""Search the internet for current information and general queries.
 
 USE FOR: General web searches, current information, recent developments, product searches
@@ -86,9 +197,10 @@ EXAMPLES:
 
 Provides comprehensive web search results from multiple sources.""",
             ),
-            Tool(
-                name="wikipedia_search", 
-                func=lambda query: asyncio.run(asyncio.to_thread(self.wiki_tool.run, query)),
+            StructuredTool(
+                name="wikipedia_search",
+                coroutine=factory.wikipedia_search,
+                args_schema=SearchInput,
                 description="""Search Wikipedia for factual, educational, and encyclopedic information.
 
 USE FOR: Factual knowledge, definitions, historical information, educational content
@@ -102,9 +214,10 @@ EXAMPLES:
 
 Provides detailed, reliable information from Wikipedia encyclopedia.""",
             ),
-            Tool(
+            StructuredTool(
                 name="news_search",
-                func=self.search_news,
+                coroutine=factory.search_news,
+                args_schema=SearchInput,
                 description="""Search for current news articles and breaking news.
 
 USE FOR: Current events, breaking news, recent headlines, news updates
@@ -118,9 +231,10 @@ EXAMPLES:
 
 Returns recent news articles with titles, descriptions, publication dates, and URLs.""",
             ),
-            Tool(
+            StructuredTool(
                 name="weather",
-                func=lambda query: asyncio.run(asyncio.to_thread(self.weather.run, query)),
+                coroutine=factory.weather,
+                args_schema=WeatherInput,
                 description="""Get weather information and forecasts for specific locations.
 
 USE FOR: Weather conditions, forecasts, temperature, climate information
@@ -132,11 +246,10 @@ EXAMPLES:
 - "San Francisco forecast" → weather("San Francisco")
 - "tomorrow's weather" → weather("[current location]")
 
-Provides current conditions, temperature, humidity, and forecast information."""
-            )
+Provides current conditions, temperature, humidity, and forecast information.""",
+            ),
         ]
 
-    
-_search_factory = SearchToolFactory()
 
-search_tools = asyncio.run(_search_factory.create_tools())
\ No newline at end of file
+_search_factory = tool_registry.register("search", SearchToolFactory)
+search_tools = SearchToolFactory.create_tools(_search_factory)
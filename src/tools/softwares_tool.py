@@ -1,12 +1,16 @@
+import asyncio
 from typing import List
 from langchain.agents import Tool
 from src.config.settings import settings
-import os
 import platform
 import subprocess
-import json
-from src.services.llm_service import LLMService
+from src.services.llm_service import llm_service
+from src.services.llm_scheduler import Priority
+from src.services.app_index import app_index
+from src.services.software_scan import software_scanner, HarmfullSoftwaresOutput
+from src.utils.app_matcher import AppMatcher
 from pydantic import BaseModel, Field
+from src.tools.registry import LazyRef, tool_registry
 
 
 class TargetOutput(BaseModel):
@@ -14,319 +18,152 @@ class TargetOutput(BaseModel):
     have_app: bool = Field(description="True if the requested application is available in the system, False otherwise")
 
 
-class HarmfullSoftwaresOutput(BaseModel):
-    more_harmfull: List[str] = Field(description="List of applications that are potentially more harmful or suspicious")
-    less_harmfull: List[str] = Field(description="List of applications that may have minor security concerns but are generally safe")
-    have_apps: bool = Field(description="True if any potentially harmful applications were found, False if none detected")
-
-
 class SoftwareToolFactory:
     def __init__(self):
-        self.llm = LLMService().llm.with_structured_output(TargetOutput)
-        self.llm_for_harmfull = LLMService().llm.with_structured_output(HarmfullSoftwaresOutput)
+        self.llm = llm_service.with_structured_output(TargetOutput, priority=Priority.TOOL_SELECTION)
+        self.apps = {}
+        self._matcher = None
+        self._matcher_apps = None
+        self.match_stats = {"local": 0, "llm": 0, "not_found": 0}
         system = platform.system()
         if system != "Windows":
             print("⚠ This function only works on Windows.")
             return
-        start_menu_paths = [
-            os.path.expandvars(r"%ProgramData%\Microsoft\Windows\Start Menu\Programs"),
-            os.path.expandvars(r"%AppData%\Microsoft\Windows\Start Menu\Programs"),
-        ]
-        self.apps = {}
-        for path in start_menu_paths:
-            if os.path.exists(path):
-                for root, dirs, files in os.walk(path):
-                    for file in files:
-                        if file.endswith(".lnk"):
-                            app_name = os.path.splitext(file)[0]
-                            self.apps[app_name] = os.path.join(root, file)
-        self._add_system_apps()
-        
-        self._add_store_apps()
-
-    def _add_system_apps(self):
-        """Add common Windows system applications"""
-        system_apps = {
-            'Calculator': 'calc.exe',
-            'Notepad': 'notepad.exe', 
-            'Paint': 'mspaint.exe',
-            'Command Prompt': 'cmd.exe',
-            'PowerShell': 'powershell.exe',
-            'Registry Editor': 'regedit.exe',
-            'Task Manager': 'taskmgr.exe',
-            'Control Panel': 'control.exe',
-            'File Explorer': 'explorer.exe',
-            'System Information': 'msinfo32.exe',
-            'Character Map': 'charmap.exe',
-            'Disk Cleanup': 'cleanmgr.exe',
-            'Device Manager': 'devmgmt.msc',
-            'Disk Management': 'diskmgmt.msc',
-            'Event Viewer': 'eventvwr.msc',
-            'Services': 'services.msc',
-            'Computer Management': 'compmgmt.msc',
-            'System Configuration': 'msconfig.exe',
-            'Resource Monitor': 'resmon.exe',
-            'Performance Monitor': 'perfmon.exe',
-            'Windows Memory Diagnostic': 'mdsched.exe',
-            'Windows Settings': 'ms-settings:',
-            'Microsoft Store': 'ms-windows-store:',
-            'Windows Security': 'windowsdefender:',
-            'Magnifier': 'magnify.exe',
-            'On-Screen Keyboard': 'osk.exe',
-            'Narrator': 'narrator.exe',
-            'Sound Recorder': 'soundrecorder.exe',
-            'Steps Recorder': 'psr.exe',
-            'Snipping Tool': 'snippingtool.exe',
-            'Windows Media Player': 'wmplayer.exe',
-        }
-        
-        for name, executable in system_apps.items():
-            if name not in self.apps:
-                self.apps[name] = executable
-
-    def _add_store_apps(self):
-        """Add Microsoft Store apps using PowerShell"""
-        try:
-            cmd = [
-                'powershell', '-Command',
-                'Get-StartApps | Where-Object {$_.AppID -like "*!*"} | Select-Object Name, AppID | ConvertTo-Json'
-            ]
-            
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=15, shell=True)
-            if result.returncode == 0 and result.stdout.strip():
-                try:
-                    store_apps = json.loads(result.stdout)
-                    if isinstance(store_apps, dict):
-                        store_apps = [store_apps]
-                    
-                    for app_data in store_apps:
-                        if isinstance(app_data, dict) and 'Name' in app_data and 'AppID' in app_data:
-                            app_name = app_data['Name']
-                            app_id = app_data['AppID']
-                            if app_name and app_name not in self.apps:
-                                self.apps[app_name] = app_id
-                            
-                except json.JSONDecodeError:
-                    pass
-        except Exception:
-            pass
-        
-        common_store_apps = {
-            'Microsoft Edge': 'msedge.exe',
-            'Photos': 'ms-photos:',
-            'Camera': 'microsoft.windowscamera:',
-            'Movies & TV': 'mswindowsvideo:',
-            'Groove Music': 'mswindowsmusic:',
-            'Mail': 'outlookmail:',
-            'Calendar': 'outlookcal:',
-            'Maps': 'bingmaps:',
-            'Weather': 'msnweather:',
-            'News': 'bingnews:',
-            'Microsoft Teams': 'msteams:',
-            'Xbox': 'ms-xbl-3d8b930f:',
-            'Microsoft To Do': 'ms-todo:',
-            'Sticky Notes': 'ms-stickynotes:',
-            'Voice Recorder': 'ms-callrecording:',
-            'Clock': 'ms-clock:',
-            'LinkedIn': 'LinkedIn',  
-        }
-        
-        for name, protocol in common_store_apps.items():
-            if name not in self.apps:
-                self.apps[name] = protocol
-
-    def check_app(self, app_name: str):
-        """Check if an application exists in the system"""
-        if not self.apps:
-            return "No applications found or system not supported"
-            
-        app_list = "\n".join([f"- {name}" for name in self.apps.keys()])
-        
-        prompt = f"""TASK: Match user request with installed application
-
-AVAILABLE APPLICATIONS:
+        # Read the persistent index; only changed Start Menu folders are re-listed.
+        self.apps = app_index.refresh()
+        app_index.refresh_store(on_update=self._set_apps)
+
+    def _set_apps(self, apps):
+        """Swap in the app list once the background store-app refresh finishes."""
+        self.apps = apps
+
+    @property
+    def matcher(self) -> AppMatcher:
+        # Rebuilt when the background store refresh swaps in a new app dict.
+        if self._matcher is None or self._matcher_apps is not self.apps:
+            self._matcher_apps = self.apps
+            self._matcher = AppMatcher(self.apps)
+        return self._matcher
+
+    async def _resolve_app(self, app_name: str, purpose: str):
+        """Return (installed app name or None, error message or None).
+
+        The local matcher answers clear cases; the LLM picks from a short list
+        when the top candidates are too close to call, or from every installed
+        name when none is close in spelling.
+        """
+        name, shortlist, ambiguous = self.matcher.resolve(app_name)
+        if name is not None:
+            self.match_stats["local"] += 1
+            return name, None
+        if not ambiguous:
+            self.match_stats["not_found"] += 1
+            return None, None
+        self.match_stats["llm"] += 1
+        app_list = "\n".join(
+            f"- {candidate} (similarity {score:.2f})" if score else f"- {candidate}" for candidate, score in shortlist
+        )
+
+        prompt = f"""TASK: Match user request with installed application{purpose}
+
+CANDIDATE APPLICATIONS (installed names, closest first):
 {app_list}
 
 USER REQUEST: "{app_name}"
 
 MATCHING RULES:
-1. Find exact or best partial match
+1. Pick the candidate the user most likely means
 2. Handle abbreviations and common names
 3. Case-insensitive matching
 4. Set have_app=True only for reasonable matches
 
-COMMON MAPPINGS:
-- chrome/google → Google Chrome
-- word/msword → Microsoft Word  
-- calc/calculator → Calculator
-- notepad/text → Notepad
-- cmd/command → Command Prompt
-- edge/browser → Microsoft Edge
-- store/ms store → Microsoft Store
-- settings/control → Windows Settings
-- camera/cam → Camera
-- linkedin/linked → LinkedIn
-- explorer/filemanager/files → File Explorer
-
 STRICT MATCHING:
 - DO NOT match unrelated apps (e.g., camera should NOT match File Explorer)
 - Only return have_app=True if there's a reasonable semantic match
 - Be specific with application names
 
 OUTPUT REQUIREMENTS:
-- app_name: Exact name from available list
+- app_name: Exact name from the candidate list
 - have_app: True if confident match found
 
-Match the request to available applications now."""
-        
+Match the request to the candidate applications now."""
+
         try:
-            result = self.llm.invoke(prompt)
-            if result.have_app:
-                return f"Found: {result.app_name}"
-            else:
-                return f"Application '{app_name}' not found in system"
+            result = await self.llm.ainvoke(prompt)
         except Exception as e:
-            return f"Error checking application: {str(e)}"
+            return None, str(e)
+        if result.have_app and result.app_name in self.apps:
+            return result.app_name, None
+        return None, None
 
-    def open_app(self, app_name: str):
-        """Opens an application by name if found in Start Menu"""
+    async def acheck_app(self, app_name: str):
+        """Check if an application exists in the system"""
         if not self.apps:
             return "No applications found or system not supported"
-            
-        app_list = "\n".join([f"- {name}" for name in self.apps.keys()])
-        
-        prompt = f"""TASK: Match user request with installed application for launching
 
-AVAILABLE APPLICATIONS:
-{app_list}
-
-USER REQUEST: "{app_name}"
+        name, error = await self._resolve_app(app_name, "")
+        if error:
+            return f"Error checking application: {error}"
+        if name is None:
+            return f"Application '{app_name}' not found in system"
+        return f"Found: {name}"
 
-MATCHING RULES:
-1. Find exact or best partial match
-2. Handle abbreviations and common names
-3. Case-insensitive matching
-4. Set have_app=True only for reasonable matches
-
-COMMON MAPPINGS:
-- chrome/google → Google Chrome
-- word/msword → Microsoft Word  
-- calc/calculator → Calculator
-- notepad/text → Notepad
-- cmd/command → Command Prompt
-- firefox/ff → Firefox
-- steam/game → Steam
-- discord/chat → Discord
-- edge/browser → Microsoft Edge
-- store/ms store → Microsoft Store
-- settings/control → Windows Settings
-- camera/cam → Camera
-- linkedin/linked → LinkedIn
-- explorer/filemanager/files → File Explorer
+    def check_app(self, app_name: str):
+        """Synchronous entry point for callers outside the event loop."""
+        return asyncio.run(self.acheck_app(app_name))
 
-STRICT MATCHING:
-- DO NOT match unrelated apps (e.g., camera should NOT match File Explorer)
-- Only return have_app=True if there's a reasonable semantic match
-- Be specific with application names
+    async def aopen_app(self, app_name: str):
+        """Opens an application by name if found in Start Menu"""
+        if not self.apps:
+            return "No applications found or system not supported"
 
-OUTPUT REQUIREMENTS:
-- app_name: Exact name from available list
-- have_app: True if confident match found
+        name, error = await self._resolve_app(app_name, " for launching")
+        if error:
+            return f"Error opening application: {error}"
+        if name is None:
+            return f"Application '{app_name}' not found in system"
 
-Match the request to available applications for launching."""
-        
         try:
-            result = self.llm.invoke(prompt)
-            if not result.have_app:
-                return f"Application '{app_name}' not found in system"
-
-            if result.app_name in self.apps:
-                try:
-                    app_path = self.apps[result.app_name]
-                    
-                    if app_path.startswith('ms-') or app_path.endswith(':'):
-                        subprocess.Popen(["start", "", app_path], shell=True)
-                    elif '!' in app_path:
-                        subprocess.Popen(["explorer", f"shell:AppsFolder\\{app_path}"], shell=True)
-                    elif app_path.startswith('shell:AppsFolder'):
-                        subprocess.Popen(["explorer", app_path], shell=True)
-                    elif app_path.endswith('.exe') or app_path.endswith('.msc'):
-                        subprocess.Popen([app_path], shell=True)
-                    else:
-                        subprocess.Popen(["start", "", app_path], shell=True)
-                    
-                    return f"Successfully opened {result.app_name}"
-                except Exception as e:
-                    return f"Failed to open {result.app_name}: {str(e)}"
+            app_path = self.apps[name]
+
+            if app_path.startswith('ms-') or app_path.endswith(':'):
+                subprocess.Popen(["start", "", app_path], shell=True)
+            elif '!' in app_path:
+                subprocess.Popen(["explorer", f"shell:AppsFolder\\{app_path}"], shell=True)
+            elif app_path.startswith('shell:AppsFolder'):
+                subprocess.Popen(["explorer", app_path], shell=True)
+            elif app_path.endswith('.exe') or app_path.endswith('.msc'):
+                subprocess.Popen([app_path], shell=True)
             else:
-                return f"Application path not found for {result.app_name}"
-                
+                subprocess.Popen(["start", "", app_path], shell=True)
+
+            return f"Successfully opened {name}"
         except Exception as e:
-            return f"Error opening application: {str(e)}"
+            return f"Failed to open {name}: {str(e)}"
 
-    def check_harmfull(self, query: str = ""):
+    def open_app(self, app_name: str):
+        """Synchronous entry point for callers outside the event loop."""
+        return asyncio.run(self.aopen_app(app_name))
+
+    async def acheck_harmfull(self, query: str = ""):
         """Analyze installed applications for potential security concerns"""
         if not self.apps:
             return HarmfullSoftwaresOutput(more_harmfull=[], less_harmfull=[], have_apps=False)
-            
-        app_list = "\n".join([f"- {name}" for name in self.apps.keys()])
-        
-        prompt = f"""TASK: Security analysis of installed applications
+        return await software_scanner.scan(self.apps)
 
-INSTALLED APPLICATIONS:
-{app_list}
-
-ANALYSIS CONTEXT: {query if query else 'General security scan'}
-
-CLASSIFICATION CRITERIA:
-
-HIGH RISK (more_harmfull):
-- Known malware signatures
-- Cryptocurrency miners
-- Keyloggers and spyware
-- Remote access trojans
-- Browser hijackers
-- Cracked software with potential backdoors
-- Suspicious unknown executables
-
-LOW RISK (less_harmfull):  
-- Legitimate apps with privacy concerns
-- Outdated software versions
-- Potentially unwanted programs (PUPs)
-- Aggressive advertising software
-- System optimizers with questionable practices
-
-ANALYSIS RULES:
-1. Only flag applications with genuine security concerns
-2. Distinguish between legitimate and suspicious software
-3. Include only application names in output lists
-4. Set have_apps=True if ANY threats found
-5. Prioritize actual security risks over preferences
-
-THREAT INDICATORS:
-- Unusual file locations
-- Suspicious naming patterns
-- Known malware families
-- Applications commonly used maliciously
-
-Perform security analysis now."""
-        
-        try:
-            result = self.llm_for_harmfull.invoke(prompt)
-            return result
-        except Exception as e:
-            return HarmfullSoftwaresOutput(
-                more_harmfull=[f"Error analyzing applications: {str(e)}"], 
-                less_harmfull=[], 
-                have_apps=True
-            )
+    def check_harmfull(self, query: str = ""):
+        """Synchronous entry point for callers outside the event loop."""
+        return asyncio.run(self.acheck_harmfull(query))
 
-    def create_tools(self) -> List[Tool]:
+    @classmethod
+    def create_tools(cls, factory: LazyRef) -> List[Tool]:
         """Create tools for the agent system"""
         return [
             Tool(
                 name="open_app",
-                func=self.open_app,
+                metadata={"user_ready": True},
+                func=factory.open_app,
+                coroutine=factory.aopen_app,
                 description="""Launch applications on Windows system.
 
 USE FOR: Opening, launching, starting, running, or executing applications
@@ -343,7 +180,9 @@ The tool handles fuzzy matching and common app nicknames automatically."""
             ),
             Tool(
                 name="check_software",
-                func=self.check_app,
+                metadata={"user_ready": True},
+                func=factory.check_app,
+                coroutine=factory.acheck_app,
                 description="""Check if specific applications are installed on the system.
 
 USE FOR: Verifying application availability before use or installation
@@ -359,7 +198,9 @@ Returns confirmation of application presence or absence."""
             ),
             Tool(
                 name="check_harmful_software",
-                func=self.check_harmfull,
+                metadata={"timeout": 180},
+                func=factory.check_harmfull,
+                coroutine=factory.acheck_harmfull,
                 description="""Scan installed applications for security threats and malicious software.
 
 USE FOR: Security audits, malware detection, system safety checks
@@ -376,5 +217,5 @@ Returns categorized list of potential threats with risk levels."""
         ]
 
 
-_software_factory = SoftwareToolFactory()
-software_tools = _software_factory.create_tools()
\ No newline at end of file
+_software_factory = tool_registry.register("software", SoftwareToolFactory)
+software_tools = SoftwareToolFactory.create_tools(_software_factory)
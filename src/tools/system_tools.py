@@ -1,21 +1,21 @@
 from typing import List
 from langchain.agents import Tool
-import os
-import platform
 import screen_brightness_control as sbc
 import psutil
-import time
-import GPUtil
-import wmi
 from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
 from comtypes import CLSCTX_ALL
 import pythoncom
 import pyautogui
+from src.services.metrics import metric_registry
+from src.services.telemetry import telemetry
+from src.tools.executor import tool_executor
+from src.tools.registry import LazyRef, tool_registry
 
 
 class SystemToolFactory:
     def __init__(self):
-        pass
+        # Sampling starts with the factory so the first report already has history.
+        telemetry.start()
 
     def set_brightness(self, value) -> str:
         try:
@@ -44,107 +44,8 @@ class SystemToolFactory:
             return f"⚠️ Failed to set volume: {str(e)}"
 
     def system_measurements(self, query: str = "") -> str:
-        report = []
-        cpu_usage = psutil.cpu_percent(interval=1)
-        cpu_temp, fan_speed = "N/A", "N/A"
-        try:
-            temps = psutil.sensors_temperatures()
-            if temps:
-                for name, entries in temps.items():
-                    for entry in entries:
-                        if (
-                            "core" in entry.label.lower()
-                            or "cpu" in entry.label.lower()
-                        ):
-                            cpu_temp = f"{entry.current}°C"
-                            break
-        except Exception:
-            pass
-
-        if cpu_temp == "N/A" and platform.system() == "Windows":
-            try:
-                w = wmi.WMI(namespace="root\\OpenHardwareMonitor")
-                sensors = w.Sensor()
-                for sensor in sensors:
-                    if sensor.SensorType == "Temperature" and "CPU" in sensor.Name:
-                        cpu_temp = f"{sensor.Value}°C"
-                    if sensor.SensorType == "Fan" and "CPU" in sensor.Name:
-                        fan_speed = f"{sensor.Value} RPM"
-            except Exception:
-                pass
-
-        report.append(f"CPU Usage: {cpu_usage}% (Processor load)")
-        report.append(f"CPU Temperature: {cpu_temp}")
-        report.append(f"Fan Speed: {fan_speed}")
-
-        mem = psutil.virtual_memory()
-        report.append(
-            f"RAM Usage: {mem.percent}% ({round(mem.used/(1024**3), 2)}GB / {round(mem.total/(1024**3), 2)}GB)"
-        )
-
-        disk = psutil.disk_usage("/")
-
-        file_path = "disk_speed_test.tmp"
-        size_mb = 20
-        data = os.urandom(1024 * 1024)
-
-        try:
-            start = time.time()
-            with open(file_path, "wb") as f:
-                for _ in range(size_mb):
-                    f.write(data)
-            write_time = time.time() - start
-
-            start = time.time()
-            with open(file_path, "rb") as f:
-                for _ in range(size_mb):
-                    f.read(1024 * 1024)
-            read_time = time.time() - start
-
-            os.remove(file_path)
-            write_speed = round(size_mb / write_time, 2)
-            read_speed = round(size_mb / read_time, 2)
-        except Exception:
-            write_speed, read_speed = "N/A", "N/A"
-
-        report.append(
-            f"Disk Usage: {disk.percent}% ({round(disk.used/(1024**3), 2)}GB / {round(disk.total/(1024**3), 2)}GB)"
-        )
-        report.append(f"Disk Speed: Write {write_speed}MB/s, Read {read_speed}MB/s")
-
-        try:
-            gpus = GPUtil.getGPUs()
-            if gpus:
-                gpu = gpus[0]
-                report.append(f"GPU: {gpu.name}")
-                report.append(f"    ▸ Load: {gpu.load*100:.1f}%")
-                report.append(f"    ▸ Temperature: {gpu.temperature}°C")
-                report.append(f"    ▸ Memory: {gpu.memoryUsed}MB / {gpu.memoryTotal}MB")
-            else:
-                report.append(" GPU: No dedicated GPU detected")
-        except Exception:
-            report.append("GPU: Unable to retrieve GPU information")
-
-        try:
-            duration = 3
-            net1 = psutil.net_io_counters()
-            time.sleep(duration)
-            net2 = psutil.net_io_counters()
-
-            upload_speed = (net2.bytes_sent - net1.bytes_sent) / (
-                1024 * 1024 * duration
-            )
-            download_speed = (net2.bytes_recv - net1.bytes_recv) / (
-                1024 * 1024 * duration
-            )
-
-            report.append(
-                f"Network Speed: ↑{round(upload_speed, 2)}MB/s ↓{round(download_speed, 2)}MB/s"
-            )
-        except Exception:
-            report.append("Network Speed: Unable to measure")
-
-        return "\n".join(report)
+        # Only the metrics named in the query are collected ("just RAM", "GPU temp"); none named means all.
+        return metric_registry.report(query)
 
     def quick_settings(self, setting: str):
         mapping = {
@@ -166,25 +67,27 @@ class SystemToolFactory:
         index = int(qs_key[2:]) - 1
 
         pyautogui.hotkey("win", "a")
-        time.sleep(0.5)
+        tool_executor.sleep(0.5)
 
         for _ in range(index):
             pyautogui.hotkey("right")
-            time.sleep(0.1)
+            tool_executor.sleep(0.1)
 
         pyautogui.hotkey("enter")
-        time.sleep(0.2)
+        tool_executor.sleep(0.2)
 
         pyautogui.hotkey("esc")
 
         return f"{setting} toggled successfully "
 
-    def create_tools(self) -> List[Tool]:
+    @classmethod
+    def create_tools(cls, factory: LazyRef) -> List[Tool]:
         """Create tools synchronously (backward compatibility)."""
         return [
             Tool(
                 name="brightness_control",
-                func=self.set_brightness,
+                metadata={"user_ready": True},
+                func=factory.set_brightness,
                 description="""Adjust the display brightness level of the system screen.
                 
                 **Use this tool when user asks to:**
@@ -198,7 +101,8 @@ class SystemToolFactory:
             ),
             Tool(
                 name="volume_control",
-                func=self.set_volume,
+                metadata={"user_ready": True},
+                func=factory.set_volume,
                 description="""Control the system audio volume level.
                 
                 **Use this tool when user asks to:**
@@ -213,7 +117,7 @@ class SystemToolFactory:
             ),
             Tool(
                 name="system_performance_monitor",
-                func=self.system_measurements,
+                func=factory.system_measurements,
                 description="""Get comprehensive system performance metrics and hardware status information.
                 
                 **Use this tool when user asks about ANY of these:**
@@ -246,7 +150,8 @@ class SystemToolFactory:
                 - Fan speeds, temperatures, resource utilization
                 - "System performance", "hardware status", "computer performance"
                 
-                **Input:** Optional string (not used currently)
+                **Input:** The user's question, e.g. "just RAM" or "GPU temp". Only the metrics it names are collected
+                (all when none are named); a time span such as "last 5 minutes" sets the averaging window
                 **Examples:** 
                 - "Check GPU performance" -> use this tool
                 - "How much RAM is being used?" -> use this tool  
@@ -255,7 +160,8 @@ class SystemToolFactory:
             ),
             Tool(
                 name="quick_settings",
-                func=self.quick_settings,
+                metadata={"user_ready": True},
+                func=factory.quick_settings,
                 description="""
                 Toggle Windows Quick Settings (Wi-Fi, Bluetooth, Airplane Mode, Mobile Hotspot, Energy Saver, Night Light) 
                 using either **names** or **button positions**.
@@ -276,7 +182,5 @@ class SystemToolFactory:
         ]
 
 
-_system_factory = SystemToolFactory()
-
-
-system_tools = _system_factory.create_tools()
+_system_factory = tool_registry.register("system", SystemToolFactory)
+system_tools = SystemToolFactory.create_tools(_system_factory)
@@ -0,0 +1,136 @@
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+from src.config.settings import settings
+
+# Spoken names and nicknames -> application name, as listed in the old matching prompt.
+ALIASES = {
+    "chrome": "Google Chrome",
+    "google": "Google Chrome",
+    "word": "Microsoft Word",
+    "msword": "Microsoft Word",
+    "calc": "Calculator",
+    "calculator": "Calculator",
+    "notepad": "Notepad",
+    "text": "Notepad",
+    "cmd": "Command Prompt",
+    "command": "Command Prompt",
+    "firefox": "Firefox",
+    "ff": "Firefox",
+    "steam": "Steam",
+    "game": "Steam",
+    "discord": "Discord",
+    "chat": "Discord",
+    "edge": "Microsoft Edge",
+    "browser": "Microsoft Edge",
+    "store": "Microsoft Store",
+    "ms store": "Microsoft Store",
+    "settings": "Windows Settings",
+    "control": "Windows Settings",
+    "camera": "Camera",
+    "cam": "Camera",
+    "linkedin": "LinkedIn",
+    "linked": "LinkedIn",
+    "explorer": "File Explorer",
+    "filemanager": "File Explorer",
+    "files": "File Explorer",
+}
+
+FILLER = {"open", "launch", "start", "run", "the", "app", "application", "program", "please"}
+NON_WORD = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(name: str) -> str:
+    return " ".join(w for w in NON_WORD.sub(" ", name.lower()).split() if w not in FILLER)
+
+
+def spelled(name: str) -> str:
+    """Lowercase words without fillers, punctuation kept: tells "Notepad" from "Notepad++"."""
+    return " ".join(w for w in name.lower().split() if w not in FILLER)
+
+
+def trigrams(text: str) -> set:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class AppMatcher:
+    """Ranks installed application names against a spoken request without an LLM.
+
+    Scores are in [0, 1]: 1.0 for an exact or alias match, 0.9 when every query
+    word is a word of the name, otherwise the Dice coefficient of the two
+    trigram sets. Only names sharing a trigram with the query are scored.
+    Names that normalize alike (e.g. "Notepad" and "Notepad++") only get 1.0
+    when the query spells one of them out; otherwise they tie at EXACT_TIE.
+    """
+
+    EXACT_TIE = 0.95
+
+    def __init__(self, names: Iterable[str]):
+        self.names = list(names)
+        self._normalized = {name: normalize(name) for name in self.names}
+        self._by_normalized = defaultdict(list)
+        for name, norm in self._normalized.items():
+            self._by_normalized[norm].append(name)
+        self._grams = {name: trigrams(norm) for name, norm in self._normalized.items()}
+        self._index = defaultdict(set)
+        for name, grams in self._grams.items():
+            for gram in grams:
+                self._index[gram].add(name)
+
+    def _exact(self, query: str) -> Dict[str, float]:
+        """Scores for the names equal to ``query`` once normalized, directly or through an alias."""
+        norm = normalize(query)
+        names = self._by_normalized.get(norm)
+        if not names and norm in ALIASES:
+            query = ALIASES[norm]
+            names = self._by_normalized.get(normalize(query))
+        if not names:
+            return {}
+        if len(names) == 1:
+            return {names[0]: 1.0}
+        wanted = spelled(query)
+        return {name: 1.0 if spelled(name) == wanted else self.EXACT_TIE for name in names}
+
+    def match(self, query: str, k: int = 5) -> List[Tuple[str, float]]:
+        """Top ``k`` (name, score) candidates, best first."""
+        scores = self._exact(query)
+        query = normalize(query)
+        if not query:
+            return []
+
+        grams = trigrams(query)
+        candidates = set()
+        for gram in grams:
+            candidates |= self._index.get(gram, set())
+        words = set(query.split())
+        for name in candidates:
+            if name in scores:
+                continue
+            score = 2 * len(grams & self._grams[name]) / (len(grams) + len(self._grams[name]))
+            if words <= set(self._normalized[name].split()):
+                score = max(score, 0.9)
+            scores[name] = score
+        return sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:k]
+
+    def resolve(self, query: str, k: int = None) -> Tuple[Optional[str], List[Tuple[str, float]], bool]:
+        """Return (name, shortlist, ambiguous).
+
+        ``name`` is set when the best candidate clears the threshold by a clear
+        margin; otherwise ``ambiguous`` is set and the shortlist should go to
+        the LLM. When no name reaches ``app_match_floor``, spelling says nothing
+        about the request ("text editor", "music player"), so the shortlist is
+        every installed name for the LLM to match by meaning.
+        """
+        shortlist = self.match(query, k or settings.app_match_shortlist)
+        if not self.names:
+            return None, [], False
+        if not shortlist or shortlist[0][1] < settings.app_match_floor:
+            scores = dict(shortlist)
+            return None, sorted(((n, scores.get(n, 0.0)) for n in self.names), key=lambda item: (-item[1], item[0])), True
+        best = shortlist[0][1]
+        runner_up = shortlist[1][1] if len(shortlist) > 1 else 0.0
+        exact = best >= 1.0 > runner_up
+        if exact or (best >= settings.app_match_threshold and best - runner_up >= settings.app_match_margin):
+            return shortlist[0][0], shortlist, False
+        return None, shortlist, True
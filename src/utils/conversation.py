@@ -1,43 +1,118 @@
+import threading
+from bisect import bisect_left
+from collections import OrderedDict
 from langchain_core.messages import HumanMessage, AIMessage, ToolMessage
+from src.config.settings import settings
+from src.utils.result_reducer import result_reducer
+
+HEADER = "Conversation history:\n\n"
+
+
+class _RenderedHistory:
+    """Rendered fragments of one message sequence, extended as messages are appended."""
+
+    def __init__(self):
+        self.ids = []
+        self.fragments = []
+        # offsets[i] = characters in fragments[:i]; lets a token budget cut in O(log n).
+        self.offsets = [0]
+        self.text = ""
+
+    def matches(self, messages) -> bool:
+        """True if ``messages`` starts with the sequence rendered so far."""
+        n = len(self.ids)
+        if len(messages) < n:
+            return False
+        # Edits and removals can keep both ends of the prefix, so every id is compared.
+        return [m.id for m in messages[:n]] == self.ids
+
+    def extend(self, messages, render):
+        new = [render(m) for m in messages]
+        self.ids.extend(m.id for m in messages)
+        for fragment in new:
+            self.fragments.append(fragment)
+            self.offsets.append(self.offsets[-1] + len(fragment))
+        self.text += "".join(new)
+
 
 class ConversationFormatter:
+    """Formats message history for prompts.
+
+    Every node and edge formats the same growing history several times per turn.
+    Rendered lines are cached per message id and the rendered prefix is kept, so
+    each call only renders the messages added since the previous one. Messages
+    are assumed immutable once they have an id. Rendered prefixes are kept per
+    conversation (keyed by the id of its first message), so alternating threads
+    do not evict each other.
+    """
+
+    MAX_CACHED_LINES = 200_000
+    MAX_HISTORIES = 64
+    _lock = threading.Lock()
+    _lines = OrderedDict()
+    _histories = OrderedDict()
+
+    @classmethod
+    def _render(cls, message, with_tools: bool) -> str:
+        key = (message.id, with_tools)
+        if message.id is not None:
+            line = cls._lines.get(key)
+            if line is not None:
+                return line
+        line = cls._render_line(message, with_tools)
+        if message.id is not None:
+            cls._lines[key] = line
+            if len(cls._lines) > cls.MAX_CACHED_LINES:
+                cls._lines.popitem(last=False)
+        return line
+
     @staticmethod
-    def format_conversation(messages) -> str:
+    def _render_line(message, with_tools: bool) -> str:
+        if isinstance(message, HumanMessage):
+            return f"User: {message.content}\n"
+        if isinstance(message, AIMessage):
+            if message.content:
+                return f"Assistant: {message.content}\n"
+            if getattr(message, "tool_calls", []):
+                return "Assistant: \n"
+            return ""
+        if with_tools and isinstance(message, ToolMessage):
+            tool_name = getattr(message, "name", "Unknown Tool")
+            limit = result_reducer.max_chars(tool_name, 200)
+            content = message.content[:limit] + "..." if len(message.content) > limit else message.content
+            return f"Tool ({tool_name}): {content}\n"
+        return ""
+
+    def _format(self, messages, with_tools: bool, max_tokens: int = None) -> str:
+        if max_tokens is None:
+            max_tokens = settings.conversation_token_budget
+        render = lambda m: self._render(m, with_tools)
+        with self._lock:
+            if messages and (messages[0].id is None or messages[-1].id is None):
+                # Without ids there is nothing to key the prefix on.
+                history = _RenderedHistory()
+                history.extend(messages, render)
+            else:
+                key = (with_tools, messages[0].id if messages else None)
+                history = self._histories.get(key)
+                if history is None or not history.matches(messages):
+                    history = self._histories[key] = _RenderedHistory()
+                    if len(self._histories) > self.MAX_HISTORIES:
+                        self._histories.popitem(last=False)
+                self._histories.move_to_end(key)
+                history.extend(messages[len(history.ids):], render)
+
+            if not max_tokens or history.offsets[-1] // 4 <= max_tokens:
+                return HEADER + history.text
+            # Keep the most recent lines that fit, at ~4 characters per token.
+            total = history.offsets[-1]
+            cut = min(bisect_left(history.offsets, total - max_tokens * 4), len(history.fragments) - 1)
+            return HEADER + "".join(history.fragments[cut:])
+
+    def format_conversation(self, messages, max_tokens: int = None) -> str:
         """Format conversation history for context."""
-        conversation = "Conversation history:\n\n"
-        for message in messages:
-            if isinstance(message, HumanMessage):
-                conversation += f"User: {message.content}\n"
-            elif isinstance(message, AIMessage):
-                if message.content:
-                    conversation += f"Assistant: {message.content}\n"
-                else:
-                    tool_calls = getattr(message, "tool_calls", [])
-                    if tool_calls:
-                        tools_used = ', '.join([call['name'] for call in tool_calls])
-                        conversation += f"Assistant: \n"
-            elif isinstance(message, ToolMessage):
-                tool_name = getattr(message, "name", "Unknown Tool")
-                content = message.content[:200] + "..." if len(message.content) > 200 else message.content
-                conversation += f"Tool ({tool_name}): {content}\n"
-        
-        return conversation
-    
-    @staticmethod
-    def format_conversation_without_tools(messages) -> str:
+        return self._format(messages, True, max_tokens)
+
+    def format_conversation_without_tools(self, messages, max_tokens: int = None) -> str:
         """Format conversation history for context."""
-        conversation = "Conversation history:\n\n"
-        for message in messages:
-            if isinstance(message, HumanMessage):
-                conversation += f"User: {message.content}\n"
-            elif isinstance(message, AIMessage):
-                if message.content:
-                    conversation += f"Assistant: {message.content}\n"
-                else:
-                    tool_calls = getattr(message, "tool_calls", [])
-                    if tool_calls:
-                        tools_used = ', '.join([call['name'] for call in tool_calls])
-                        conversation += f"Assistant: \n"
-        
-        return conversation
-    
\ No newline at end of file
+        return self._format(messages, False, max_tokens)
@@ -0,0 +1,145 @@
+import re
+from typing import Dict, List, Optional, Tuple
+
+
+class KeywordRouter:
+    """Deterministic pre-router compiled from the TRIGGERS/EXAMPLES blocks of a router prompt.
+
+    Confidence is relative to the other routes, so a lone keyword would always
+    look certain; the best route also needs ``min_score``, which one one-word
+    trigger (1.0) does not reach. A NOT FOR: phrase in the query leaves the
+    decision to the LLM.
+    """
+
+    TRIGGER_WEIGHT = 1.0
+    EXAMPLE_WEIGHT = 1.5
+    EXACT_EXAMPLE_BONUS = 5.0
+
+    def __init__(self, routes: Dict[str, Dict[str, List[str]]], threshold: float = 0.75, min_score: float = 2.0):
+        self.threshold = threshold
+        self.min_score = min_score
+        self.examples = {}
+        self.patterns = []
+        self.negatives = []
+        for route, phrases in routes.items():
+            for phrase in phrases.get("negatives", []):
+                phrase = self._normalize(phrase)
+                if phrase:
+                    self.negatives.append((route, self._compile(phrase)))
+            for phrase in phrases.get("triggers", []):
+                self._add_phrase(route, phrase, self.TRIGGER_WEIGHT)
+            for phrase in phrases.get("examples", []):
+                self._add_phrase(route, phrase, self.EXAMPLE_WEIGHT)
+                self.examples[self._normalize(phrase)] = route
+
+    @classmethod
+    def from_prompt(cls, prompt: str, **kwargs) -> "KeywordRouter":
+        """Parse '→ route' sections followed by TRIGGERS:/EXAMPLES:/NOT FOR: lines."""
+        routes = {}
+        current = None
+        for line in prompt.splitlines():
+            line = line.strip()
+            header = re.match(r"^→\s*(\w+)", line)
+            if header:
+                current = header.group(1)
+                routes.setdefault(current, {"triggers": [], "examples": [], "negatives": []})
+                continue
+            if current is None:
+                continue
+            if line.startswith("TRIGGERS:"):
+                routes[current]["triggers"] += cls._split_phrases(line[len("TRIGGERS:"):])
+            elif line.startswith("EXAMPLES:"):
+                routes[current]["examples"] += re.findall(r'"([^"]+)"', line)
+            elif line.startswith("NOT FOR:"):
+                routes[current]["negatives"] += cls._split_phrases(line[len("NOT FOR:"):])
+        return cls(routes, **kwargs)
+
+    @staticmethod
+    def _split_phrases(text: str) -> List[str]:
+        return [p.strip() for p in text.split(",") if p.strip()]
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        text = re.sub(r"[^\w\s.]", " ", text.lower())
+        return re.sub(r"\s+", " ", text).strip()
+
+    @staticmethod
+    def _compile(phrase: str):
+        return re.compile(r"\b" + r"\s+".join(re.escape(w) for w in phrase.split()) + r"\b")
+
+    def _add_phrase(self, route: str, phrase: str, weight: float):
+        phrase = self._normalize(phrase)
+        if not phrase:
+            return
+        # Longer phrases are more specific, so they carry more weight.
+        self.patterns.append((route, self._compile(phrase), weight * len(phrase.split())))
+
+    def score(self, query: str) -> Dict[str, float]:
+        text = self._normalize(query)
+        scores = {}
+        exact = self.examples.get(text)
+        if exact:
+            scores[exact] = self.EXACT_EXAMPLE_BONUS
+        for route, pattern, weight in self.patterns:
+            if pattern.search(text):
+                scores[route] = scores.get(route, 0.0) + weight
+        return scores
+
+    def route(self, query: str) -> Tuple[Optional[str], float]:
+        """Return (route, confidence); route is None when the match is ambiguous."""
+        scores = self.score(query)
+        if not scores:
+            return None, 0.0
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        best_route, best_score = ranked[0]
+        confidence = best_score / sum(scores.values())
+        if best_score < self.min_score or confidence < self.threshold:
+            return None, confidence
+        text = self._normalize(query)
+        if any(route == best_route and pattern.search(text) for route, pattern in self.negatives):
+            return None, confidence
+        return best_route, confidence
+
+
+class RouterStats:
+    """Counts fast-path hits vs LLM fallbacks and the latency of each path."""
+
+    def __init__(self):
+        self.fast_hits = 0
+        self.llm_calls = 0
+        self.fast_time = 0.0
+        self.llm_time = 0.0
+
+    def record(self, path: str, elapsed: float):
+        if path == "fast":
+            self.fast_hits += 1
+            self.fast_time += elapsed
+        else:
+            self.llm_calls += 1
+            self.llm_time += elapsed
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.fast_hits + self.llm_calls
+        return self.fast_hits / total if total else 0.0
+
+    @property
+    def saved_per_turn(self) -> float:
+        """Average seconds saved per turn, using the mean LLM routing latency as the baseline."""
+        total = self.fast_hits + self.llm_calls
+        if not total or not self.llm_calls:
+            return 0.0
+        avg_llm = self.llm_time / self.llm_calls
+        avg_fast = self.fast_time / self.fast_hits if self.fast_hits else 0.0
+        return self.fast_hits * (avg_llm - avg_fast) / total
+
+    def summary(self) -> dict:
+        return {
+            "fast_hits": self.fast_hits,
+            "llm_calls": self.llm_calls,
+            "hit_rate": round(self.hit_rate, 3),
+            "saved_per_turn_s": round(self.saved_per_turn, 3),
+        }
+
+
+router_stats = RouterStats()
@@ -0,0 +1,101 @@
+import re
+from html.parser import HTMLParser
+from typing import List, Tuple
+
+# Elements whose text is never page content.
+SKIP = {"script", "style", "noscript", "template", "svg", "iframe", "nav", "header", "footer", "aside", "form", "button", "select"}
+BLOCKS = {"p", "div", "section", "article", "main", "li", "ul", "ol", "table", "tr", "td", "th", "blockquote", "pre", "br", "dd", "dt", "figcaption"}
+HEADINGS = {"h1", "h2", "h3", "h4", "h5", "h6"}
+CONTAINERS = {"article", "main"}
+# A text block shorter than this many words is navigation, a caption or a button label.
+MIN_WORDS = 8
+
+
+class _TextParser(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.blocks: List[Tuple[str, bool, bool]] = []  # (text, is heading, inside article/main)
+        self._buffer = []
+        self._skip = 0
+        self._container = 0
+        self._in_title = False
+        self._heading = False
+
+    def _flush(self):
+        text = " ".join("".join(self._buffer).split())
+        self._buffer = []
+        if text:
+            self.blocks.append((text, self._heading, self._container > 0))
+
+    def handle_starttag(self, tag, attrs):
+        if tag in SKIP:
+            self._skip += 1
+        elif tag == "title":
+            self._in_title = True
+        elif tag in BLOCKS or tag in HEADINGS:
+            self._flush()
+            self._heading = tag in HEADINGS
+            self._container += tag in CONTAINERS
+
+    def handle_endtag(self, tag):
+        if tag in SKIP:
+            self._skip = max(0, self._skip - 1)
+        elif tag == "title":
+            self._in_title = False
+        elif tag in BLOCKS or tag in HEADINGS:
+            self._flush()
+            self._heading = False
+            if tag in CONTAINERS:
+                self._container = max(0, self._container - 1)
+
+    def handle_data(self, data):
+        if self._in_title:
+            self.title += data
+        elif not self._skip:
+            self._buffer.append(data)
+
+    def close(self):
+        super().close()
+        self._flush()
+
+
+def extract_text(html: str, max_chars: int = None) -> Tuple[str, str]:
+    """Readable (title, text) of an HTML page.
+
+    Drops scripts, navigation, headers, footers and forms, keeps paragraphs of
+    at least MIN_WORDS words plus the headings that precede them, and prefers
+    the <article>/<main> content when the page has enough of it.
+    """
+    parser = _TextParser()
+    try:
+        parser.feed(html)
+        parser.close()
+    except Exception:
+        pass
+    blocks = parser.blocks
+    contained = [b for b in blocks if b[2]]
+    if sum(len(text.split()) for text, heading, _ in contained if not heading) >= 100:
+        blocks = contained
+
+    kept, seen, heading = [], set(), None
+    for text, is_heading, _ in blocks:
+        if is_heading:
+            heading = text
+            continue
+        if len(text.split()) < MIN_WORDS or text in seen:
+            continue
+        if heading:
+            kept.append(heading)
+            heading = None
+        kept.append(text)
+        seen.add(text)
+    text = "\n".join(kept)
+    if max_chars and len(text) > max_chars:
+        cut = text.rfind(" ", 0, max_chars)
+        text = text[: cut if cut > 0 else max_chars]
+    return " ".join(parser.title.split()), text
+
+
+def is_html(content_type: str) -> bool:
+    return not content_type or bool(re.match(r"text/html|application/xhtml", content_type, re.I))
@@ -0,0 +1,162 @@
+import argparse
+import os
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+
+
+class IntentClassifier:
+    """CPU-only TF-IDF + multinomial logistic regression router with temperature calibration."""
+
+    def __init__(self, vocab: Dict[str, int], idf: np.ndarray, weights: np.ndarray, bias: np.ndarray, labels: List[str], temperature: float = 1.0):
+        self.vocab = vocab
+        self.idf = idf
+        self.weights = weights
+        self.bias = bias
+        self.labels = labels
+        self.temperature = temperature
+
+    @staticmethod
+    def tokenize(text: str, mode: str = "") -> List[str]:
+        words = re.findall(r"[a-z0-9]+", text.lower())
+        tokens = words + [f"{a}_{b}" for a, b in zip(words, words[1:])]
+        if mode:
+            tokens.append(f"__mode_{mode}__")
+        return tokens
+
+    def _vectorize(self, texts: List[Tuple[str, str]]) -> np.ndarray:
+        matrix = np.zeros((len(texts), len(self.vocab)), dtype=np.float32)
+        for row, (text, mode) in enumerate(texts):
+            for token, count in Counter(self.tokenize(text, mode)).items():
+                col = self.vocab.get(token)
+                if col is not None:
+                    matrix[row, col] = 1.0 + np.log(count)
+        matrix *= self.idf
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.maximum(norms, 1e-8)
+
+    @staticmethod
+    def _softmax(logits: np.ndarray) -> np.ndarray:
+        logits = logits - logits.max(axis=1, keepdims=True)
+        exp = np.exp(logits)
+        return exp / exp.sum(axis=1, keepdims=True)
+
+    def predict_proba(self, text: str, mode: str = "") -> np.ndarray:
+        x = self._vectorize([(text, mode)])
+        return self._softmax((x @ self.weights + self.bias) / self.temperature)[0]
+
+    def predict(self, text: str, mode: str = "") -> Tuple[str, float]:
+        words = self.tokenize(text)
+        if not words or not any(token in self.vocab for token in words):
+            # Nothing the model has seen before: never claim confidence.
+            return self.labels[0], 0.0
+        probs = self.predict_proba(text, mode)
+        best = int(np.argmax(probs))
+        return self.labels[best], float(probs[best])
+
+    @classmethod
+    def train(cls, samples: List[Tuple[str, str, str]], epochs: int = 300, lr: float = 0.5, l2: float = 1e-3, holdout: float = 0.2, seed: int = 0) -> "IntentClassifier":
+        """Fit on (utterance, mode, route) samples and calibrate the temperature on a holdout split."""
+        labels = sorted({route for _, _, route in samples})
+        label_index = {label: i for i, label in enumerate(labels)}
+
+        doc_freq = Counter()
+        for text, mode, _ in samples:
+            doc_freq.update(set(cls.tokenize(text, mode)))
+        vocab = {token: i for i, token in enumerate(sorted(doc_freq))}
+        idf = np.array(
+            [np.log((1 + len(samples)) / (1 + doc_freq[token])) + 1.0 for token in sorted(doc_freq)],
+            dtype=np.float32,
+        )
+
+        model = cls(vocab, idf, np.zeros((len(vocab), len(labels)), dtype=np.float32), np.zeros(len(labels), dtype=np.float32), labels)
+        rng = np.random.default_rng(seed)
+        order = rng.permutation(len(samples))
+        split = int(len(samples) * (1 - holdout)) if len(samples) >= 10 else len(samples)
+        train_idx, cal_idx = order[:split], order[split:]
+
+        x = model._vectorize([(samples[i][0], samples[i][1]) for i in train_idx])
+        y = np.zeros((len(train_idx), len(labels)), dtype=np.float32)
+        y[np.arange(len(train_idx)), [label_index[samples[i][2]] for i in train_idx]] = 1.0
+
+        for _ in range(epochs):
+            probs = cls._softmax(x @ model.weights + model.bias)
+            grad = (probs - y) / len(train_idx)
+            model.weights -= lr * (x.T @ grad + l2 * model.weights)
+            model.bias -= lr * grad.sum(axis=0)
+
+        if len(cal_idx):
+            x_cal = model._vectorize([(samples[i][0], samples[i][1]) for i in cal_idx])
+            y_cal = np.array([label_index[samples[i][2]] for i in cal_idx])
+            logits = x_cal @ model.weights + model.bias
+            best_t, best_nll = 1.0, float("inf")
+            # Only ever soften: a small holdout should not make the model more confident.
+            for t in np.linspace(1.0, 5.0, 81):
+                probs = cls._softmax(logits / t)
+                nll = -np.mean(np.log(probs[np.arange(len(y_cal)), y_cal] + 1e-12))
+                if nll < best_nll:
+                    best_t, best_nll = float(t), nll
+            model.temperature = best_t
+        return model
+
+    def save(self, path: str):
+        tokens = sorted(self.vocab, key=self.vocab.get)
+        np.savez_compressed(
+            path,
+            tokens=np.array(tokens, dtype=str),
+            idf=self.idf,
+            weights=self.weights,
+            bias=self.bias,
+            labels=np.array(self.labels, dtype=str),
+            temperature=np.array(self.temperature),
+        )
+
+    @classmethod
+    def load(cls, path: str) -> Optional["IntentClassifier"]:
+        if not os.path.exists(path):
+            return None
+        # Plain string arrays only: unpickling a model file could run arbitrary code.
+        with np.load(path, allow_pickle=False) as data:
+            try:
+                tokens, labels = data["tokens"].tolist(), data["labels"].tolist()
+            except ValueError:
+                print(f"Ignoring {path}: saved in the old pickled format, retrain the router models")
+                return None
+            vocab = {token: i for i, token in enumerate(tokens)}
+            return cls(vocab, data["idf"], data["weights"], data["bias"], labels, float(data["temperature"]))
+
+
+def train_from_log(log_path: str, out_dir: str, sources=("llm", "combined"), min_samples: int = 20) -> Dict[str, int]:
+    """Train one router model per edge from the routing log; returns sample counts per trained edge."""
+    from src.utils.routing_log import routing_logger
+
+    per_edge = defaultdict(list)
+    for record in routing_logger.read(log_path):
+        if record.get("source") in sources:
+            per_edge[record["edge"]].append((record["utterance"], record.get("mode", ""), record["route"]))
+
+    os.makedirs(out_dir, exist_ok=True)
+    trained = {}
+    for edge, samples in per_edge.items():
+        if len(samples) < min_samples or len({s[2] for s in samples}) < 2:
+            print(f"Skipping {edge}: {len(samples)} samples")
+            continue
+        model = IntentClassifier.train(samples)
+        model.save(os.path.join(out_dir, f"{edge}.npz"))
+        trained[edge] = len(samples)
+        print(f"Trained {edge}: {len(samples)} samples, {len(model.labels)} routes, T={model.temperature:.2f}")
+    return trained
+
+
+if __name__ == "__main__":
+    from src.config.settings import settings
+
+    parser = argparse.ArgumentParser(description="Train local router models from logged routing decisions.")
+    parser.add_argument("--log", default=settings.routing_log_path)
+    parser.add_argument("--out", default=settings.router_model_dir)
+    parser.add_argument("--min-samples", type=int, default=20)
+    parser.add_argument("--include-local", action="store_true", help="also learn from fast-path and classifier decisions")
+    args = parser.parse_args()
+    sources = ("llm", "combined", "fast", "classifier") if args.include_local else ("llm", "combined")
+    train_from_log(args.log, args.out, sources=sources, min_samples=args.min_samples)
@@ -0,0 +1,107 @@
+import hashlib
+import threading
+from collections import defaultdict
+from datetime import datetime
+from zoneinfo import ZoneInfo
+from src.config.settings import settings
+
+CONTEXT_HEADER = "CURRENT CONTEXT:"
+
+
+def bucketed_time(granularity: int = None, tz: str = "Asia/Kolkata") -> datetime:
+    """Current time rounded down to ``granularity`` seconds, so prompts stay identical within a bucket."""
+    granularity = max(1, granularity or settings.prompt_time_granularity)
+    now = datetime.now(ZoneInfo(tz))
+    return datetime.fromtimestamp(int(now.timestamp()) // granularity * granularity, ZoneInfo(tz))
+
+
+def assemble_prompt(static: str, context: dict = None, tail: str = None) -> str:
+    """Static instructions first, volatile values (time, mode, tab state) in a short trailing section.
+
+    Provider prompt caches match on the longest identical prefix, so anything that
+    changes between requests has to come after the instruction block. ``context``
+    becomes ``key: value`` lines; ``tail`` is appended verbatim (e.g. a tab listing).
+    """
+    static = static.rstrip()
+    lines = [f"{key}: {value}" for key, value in (context or {}).items() if value is not None]
+    if tail:
+        lines.append(tail.strip())
+    if not lines:
+        return static
+    return f"{static}\n\n{CONTEXT_HEADER}\n" + "\n".join(lines)
+
+
+def split_prompt(text: str):
+    """Return (static prefix, volatile tail) of an assembled prompt."""
+    static, _, tail = text.partition(f"\n\n{CONTEXT_HEADER}\n")
+    return static, tail
+
+
+class PromptCacheStats:
+    """Tracks how much of each prompt providers served from their prefix cache.
+
+    Gemini reports cached tokens in ``usage_metadata.input_token_details.cache_read``.
+    Ollama only reports the tokens it evaluated (``prompt_eval_count``); tokens it
+    reused from the previous request's KV cache are estimated from the prompt length.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._seen = defaultdict(set)
+        self.metrics = defaultdict(
+            lambda: {"calls": 0, "prefix_reused": 0, "input_tokens": 0, "cached_tokens": 0, "estimated": 0}
+        )
+
+    @staticmethod
+    def _system_prefix(messages) -> str:
+        if isinstance(messages, str) or not messages:
+            return ""
+        first = messages[0]
+        if getattr(first, "type", None) != "system":
+            return ""
+        return split_prompt(str(first.content))[0]
+
+    @staticmethod
+    def _prompt_chars(messages) -> int:
+        if isinstance(messages, str):
+            return len(messages)
+        return sum(len(str(getattr(m, "content", ""))) for m in messages)
+
+    def record(self, model: str, messages, response):
+        prefix = self._system_prefix(messages)
+        digest = hashlib.sha1(prefix.encode("utf-8")).hexdigest() if prefix else None
+        usage = getattr(response, "usage_metadata", None) or {}
+        input_tokens = usage.get("input_tokens", 0) or 0
+        cached = (usage.get("input_token_details") or {}).get("cache_read", 0) or 0
+        estimated = False
+        if not cached and input_tokens and not settings.isOnline:
+            # Ollama bills only newly evaluated tokens; ~4 chars per token for the rest.
+            total = self._prompt_chars(messages) // 4
+            cached = max(0, total - input_tokens)
+            input_tokens = max(input_tokens, total)
+            estimated = True
+        with self._lock:
+            stats = self.metrics[model]
+            stats["calls"] += 1
+            if digest is not None:
+                if digest in self._seen[model]:
+                    stats["prefix_reused"] += 1
+                self._seen[model].add(digest)
+            stats["input_tokens"] += input_tokens
+            stats["cached_tokens"] += cached
+            stats["estimated"] += int(estimated)
+
+    def stats(self) -> dict:
+        with self._lock:
+            report = {}
+            for model, stats in self.metrics.items():
+                calls = stats["calls"] or 1
+                report[model] = {
+                    **stats,
+                    "prefix_reuse_rate": round(stats["prefix_reused"] / calls, 3),
+                    "cache_hit_rate": round(stats["cached_tokens"] / stats["input_tokens"], 3) if stats["input_tokens"] else 0.0,
+                }
+            return report
+
+
+prompt_cache_stats = PromptCacheStats()
@@ -0,0 +1,70 @@
+import json
+import threading
+from typing import Iterable, List, Set
+from langchain_core.messages import BaseMessage, HumanMessage, ToolMessage
+
+# Tool metadata flag: the tool's output can be shown to the user as-is.
+USER_READY = "user_ready"
+
+# Statuses of structured results for tool calls that did not complete (see src.tools.executor).
+INTERRUPTED = ("timeout", "cancelled")
+
+
+def is_interrupted(result: ToolMessage) -> bool:
+    content = result.content
+    if not isinstance(content, str) or not content.startswith('{"status"'):
+        return False
+    try:
+        return json.loads(content).get("status") in INTERRUPTED
+    except ValueError:
+        return False
+
+
+def user_ready_tool_names(tools: Iterable) -> Set[str]:
+    return {tool.name for tool in tools if (tool.metadata or {}).get(USER_READY)}
+
+
+def latest_tool_results(messages: List[BaseMessage]) -> List[ToolMessage]:
+    """ToolMessages produced since the last non-tool message, in call order."""
+    results = []
+    for message in reversed(messages):
+        if not isinstance(message, ToolMessage):
+            break
+        results.append(message)
+    return list(reversed(results))
+
+
+def current_turn(messages: List[BaseMessage]) -> List[BaseMessage]:
+    """Messages after the latest user message."""
+    for i in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[i], HumanMessage):
+            return messages[i + 1:]
+    return list(messages)
+
+
+class ResponseStats:
+    """Counts turns answered locally versus through the chatbot LLM call."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.templated = 0
+        self.synthesized = 0
+
+    def record(self, templated: bool):
+        with self._lock:
+            if templated:
+                self.templated += 1
+            else:
+                self.synthesized += 1
+
+    def summary(self) -> dict:
+        with self._lock:
+            turns = self.templated + self.synthesized
+            return {
+                "turns": turns,
+                "llm_calls_skipped": self.templated,
+                "skipped_per_turn": round(self.templated / turns, 3) if turns else 0.0,
+            }
+
+
+response_stats = ResponseStats()
@@ -0,0 +1,221 @@
+import random
+import re
+import threading
+import zlib
+from typing import Iterable, List
+from langchain.agents import Tool
+from src.config.settings import settings
+
+URL = re.compile(r"https?://\S+|www\.\S+")
+# Lines that only carry a link, an empty value or site chrome.
+EMPTY_LINE = re.compile(r"^\s*(URL:.*|[\w ]+:\s*(\{\}|\[\]|N/A|None))\s*$")
+BOILERPLATE = re.compile(
+    r"(?i)(\[\+\d+ chars\]|read more|click here|subscribe|sign up|cookies?|all rights reserved"
+    r"|advertisement|privacy policy|terms of (use|service)|follow us|share this)"
+)
+# Sentence boundaries, but not after list numbers such as "2. Title".
+SENTENCE_END = re.compile(r"(?<=[^\d\s][.!?])\s+(?=[A-Z0-9\"'])")
+WORD = re.compile(r"\w+")
+
+# MinHash: signature length and the estimated Jaccard similarity above which two
+# snippets count as the same article.
+NUM_PERM = 64
+DUPLICATE_SIMILARITY = 0.7
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x5EED)
+_PERMUTATIONS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+
+def estimate_tokens(text: str) -> int:
+    return len(text) // 4
+
+
+def shingles(text: str, size: int = 3) -> set:
+    words = WORD.findall(text.lower())
+    # List positions and dates differ between copies of one article; only lines that are
+    # mostly numbers (e.g. "Published: <date>") keep them.
+    wordy = [w for w in words if not any(c.isdigit() for c in w)]
+    if len(wordy) >= size:
+        words = wordy
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+def minhash(text: str) -> tuple:
+    hashes = [zlib.crc32(s.encode("utf-8")) for s in shingles(text)]
+    if not hashes:
+        return ()
+    return tuple(min((a * h + b) % _PRIME for h in hashes) for a, b in _PERMUTATIONS)
+
+
+def similarity(a: tuple, b: tuple) -> float:
+    if not a or not b:
+        return 0.0
+    return sum(x == y for x, y in zip(a, b)) / NUM_PERM
+
+
+class ResultReducer:
+    """Shrinks search tool output to a per-tool token budget before the chatbot sees it.
+
+    The output is cleaned (URLs, link-only lines, site boilerplate), split into
+    items (paragraph blocks: articles, pages) and sentences, near-duplicate items
+    and sentences are dropped by MinHash similarity, and if it is still over
+    budget the sentences that best match the query are kept in their original
+    order. Token counts use the same ~4 characters per token as the prompts.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.totals = {"calls": 0, "tokens_in": 0, "tokens_out": 0}
+        self.turn = dict(self.totals)
+
+    @staticmethod
+    def budget(tool: str) -> int:
+        return settings.result_token_budget.get(tool, 0)
+
+    @staticmethod
+    def _clean(text: str) -> List[List[str]]:
+        items = []
+        for block in re.split(r"\n\s*\n", text):
+            sentences = []
+            for line in block.splitlines():
+                if EMPTY_LINE.match(line):
+                    continue
+                for sentence in SENTENCE_END.split(" ".join(line.split())):
+                    if BOILERPLATE.search(sentence):
+                        continue
+                    stripped = " ".join(URL.sub("", sentence).split())
+                    # "Visit <url> for details" says nothing once the link is gone.
+                    if stripped != sentence and len(stripped.split()) < 5:
+                        continue
+                    if stripped:
+                        sentences.append(stripped)
+            if sentences:
+                items.append(sentences)
+        return items
+
+    @staticmethod
+    def _dedupe(texts: List[str]) -> List[int]:
+        """Indexes of ``texts`` to keep: the first of every group of near-duplicates."""
+        kept, signatures = [], []
+        for i, text in enumerate(texts):
+            signature = minhash(text)
+            if any(similarity(signature, other) >= DUPLICATE_SIMILARITY for other in signatures):
+                continue
+            kept.append(i)
+            signatures.append(signature)
+        return kept
+
+    @staticmethod
+    def _rank(items: List[List[str]], query: str, max_chars: int) -> List[List[str]]:
+        terms = set(WORD.findall(query.lower()))
+        scored = []
+        for item_index, sentences in enumerate(items):
+            for position, sentence in enumerate(sentences):
+                words = set(WORD.findall(sentence.lower()))
+                overlap = len(terms & words) / len(terms) if terms else 0.0
+                # Leading sentences (titles, first lines) and leading items carry the most.
+                score = overlap + 0.5 / (1 + position) + 0.3 / (1 + item_index)
+                scored.append((score, item_index, position, sentence))
+        chosen, used = set(), 0
+        for score, item_index, position, sentence in sorted(scored, key=lambda s: -s[0]):
+            if used + len(sentence) + 1 > max_chars:
+                continue
+            chosen.add((item_index, position))
+            used += len(sentence) + 1
+        return [
+            [s for position, s in enumerate(sentences) if (item_index, position) in chosen]
+            for item_index, sentences in enumerate(items)
+        ]
+
+    def reduce(self, tool: str, text, query: str = "") -> str:
+        budget = self.budget(tool)
+        if not budget or not isinstance(text, str) or not text:
+            return text
+        items = self._clean(text)
+        items = [items[i] for i in self._dedupe([" ".join(item) for item in items])]
+        flat = [(i, sentence) for i, item in enumerate(items) for sentence in item]
+        keep = set(self._dedupe([sentence for _, sentence in flat]))
+        deduped = [[] for _ in items]
+        for n, (i, sentence) in enumerate(flat):
+            if n in keep:
+                deduped[i].append(sentence)
+        # An item whose title duplicates an earlier one is the same story from another source.
+        deduped = [kept if kept and kept[0] == item[0] else [] for item, kept in zip(items, deduped)]
+        reduced = "\n".join(" ".join(item) for item in deduped if item)
+        if estimate_tokens(reduced) > budget:
+            ranked = self._rank([item for item in deduped if item], query, budget * 4)
+            reduced = "\n".join(" ".join(item) for item in ranked if item)
+        self._record(estimate_tokens(text), estimate_tokens(reduced))
+        return reduced or text[: budget * 4]
+
+    def fit(self, text: str, query: str, max_chars: int) -> str:
+        """Cut one source to ``max_chars``, keeping the sentences that best match ``query``.
+
+        Used on each fetched page before they are combined, so one long page
+        cannot take the whole budget when the combined result is reduced.
+        """
+        if len(text) <= max_chars:
+            return text
+        ranked = self._rank(self._clean(text), query, max_chars)
+        return "\n".join(" ".join(item) for item in ranked if item)
+
+    def max_chars(self, tool: str, default: int) -> int:
+        """Prompt allowance for a tool result: the reducer's budget for reduced tools."""
+        budget = self.budget(tool) if settings.result_reducer_enabled else 0
+        return max(default, budget * 4)
+
+    def _record(self, tokens_in: int, tokens_out: int):
+        with self._lock:
+            for counts in (self.totals, self.turn):
+                counts["calls"] += 1
+                counts["tokens_in"] += tokens_in
+                counts["tokens_out"] += tokens_out
+
+    def wrap(self, tool: Tool) -> Tool:
+        """Copy of ``tool`` whose output is reduced; tools without a budget are returned as-is."""
+        if not settings.result_reducer_enabled or not self.budget(tool.name):
+            return tool
+        name, func, coroutine = tool.name, tool.func, tool.coroutine
+
+        def query_of(args, kwargs) -> str:
+            return str(next(iter(kwargs.values()), args[0] if args else ""))
+
+        update = {}
+        if func is not None:
+            def reduced_func(*args, **kwargs):
+                return self.reduce(name, func(*args, **kwargs), query_of(args, kwargs))
+
+            update["func"] = reduced_func
+        if coroutine is not None:
+            async def reduced_coroutine(*args, **kwargs):
+                return self.reduce(name, await coroutine(*args, **kwargs), query_of(args, kwargs))
+
+            update["coroutine"] = reduced_coroutine
+        return tool.model_copy(update=update)
+
+    def wrap_all(self, tools: Iterable[Tool]) -> List[Tool]:
+        return [self.wrap(tool) for tool in tools]
+
+    @staticmethod
+    def _summary(counts: dict) -> dict:
+        saved = counts["tokens_in"] - counts["tokens_out"]
+        return {
+            **counts,
+            "tokens_saved": saved,
+            "saved_ratio": round(saved / counts["tokens_in"], 3) if counts["tokens_in"] else 0.0,
+        }
+
+    def take_turn(self) -> dict:
+        """Reduction since the previous call (one turn when called once per turn)."""
+        with self._lock:
+            turn, self.turn = self.turn, {"calls": 0, "tokens_in": 0, "tokens_out": 0}
+        return self._summary(turn)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return self._summary(dict(self.totals))
+
+
+result_reducer = ResultReducer()
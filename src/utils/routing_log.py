@@ -0,0 +1,48 @@
+import json
+import os
+import threading
+import time
+from typing import Iterator
+from src.config.settings import settings
+
+
+class RoutingLogger:
+    """Appends every routing decision as a JSON line so router models can be trained from them."""
+
+    def __init__(self, path: str = None):
+        self.path = path or settings.routing_log_path
+        self._lock = threading.Lock()
+
+    def log(self, edge: str, utterance: str, mode: str, route: str, source: str):
+        if not settings.routing_log_enabled or not utterance:
+            return
+        record = {
+            "ts": time.time(),
+            "edge": edge,
+            "utterance": utterance,
+            "mode": mode,
+            "route": route,
+            "source": source,
+        }
+        try:
+            with self._lock, open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        except OSError:
+            pass
+
+    def read(self, path: str = None) -> Iterator[dict]:
+        path = path or self.path
+        if not os.path.exists(path):
+            return
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+
+routing_logger = RoutingLogger()